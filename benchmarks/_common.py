@@ -0,0 +1,64 @@
+"""Shared helpers for the benchmark scripts."""
+
+import os
+import sys
+from contextlib import asynccontextmanager
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.api.deps import get_db  # noqa: E402
+from app.database.base_class import Base  # noqa: E402
+from app.database.request_session import RequestSession  # noqa: E402
+from app.main import create_app  # noqa: E402
+import app.models.item  # noqa: E402,F401
+import app.models.user  # noqa: E402,F401
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the ``pct`` percentile (0-100) of ``samples``."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def make_sqlite_engine():
+    """Create an in-memory SQLite engine with all tables created."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine
+
+
+@asynccontextmanager
+async def app_client(engine):
+    """Yield an HTTP client bound to a fresh app that uses ``engine``."""
+    session_factory = async_sessionmaker(
+        engine, class_=RequestSession, expire_on_commit=False, autoflush=False
+    )
+    application = create_app()
+
+    async def override_get_db():
+        async with session_factory() as session:
+            try:
+                yield session
+                if session.has_writes:
+                    await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    application.dependency_overrides[get_db] = override_get_db
+    transport = ASGITransport(app=application)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        yield client
@@ -0,0 +1,86 @@
+"""Encode/decode throughput of the JWT engine per algorithm and backend.
+
+Keys are generated on the fly. The "raw key" row reproduces the old path,
+where python-jose re-parsed ``SECRET_KEY`` on every call.
+
+    python benchmarks/bench_jwt.py --iterations 5000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+from functools import partial
+
+import _common  # noqa: F401  (puts src/ on the path)
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+from app.core.jwt_engine import BACKENDS, KeyRing, TokenEngine
+
+SECRET = "benchmark-secret-key-that-is-long-enough"
+
+
+def pem_pair(algorithm: str) -> tuple[bytes, bytes]:
+    if algorithm == "RS256":
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return private_pem, public_pem
+
+
+def rate(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - started)
+
+
+def main(args):
+    claims = {
+        "sub": "12345",
+        "exp": datetime.now(timezone.utc) + timedelta(minutes=30),
+    }
+    print(f"{'backend':<8} {'algorithm':<10} {'encode/s':>10} {'decode/s':>10}")
+
+    from jose import jwt as jose_jwt
+
+    token = jose_jwt.encode(claims, SECRET, algorithm="HS256")
+    encode_rate = rate(partial(jose_jwt.encode, claims, SECRET, algorithm="HS256"), args.iterations)
+    decode_rate = rate(
+        partial(jose_jwt.decode, token, SECRET, algorithms=["HS256"]), args.iterations
+    )
+    print(f"{'jose':<8} {'HS256 raw':<10} {encode_rate:>10.0f} {decode_rate:>10.0f}  (old path)")
+
+    for name, backend_cls in BACKENDS.items():
+        try:
+            backend = backend_cls()
+        except RuntimeError as e:
+            print(f"{name:<8} skipped: {e}")
+            continue
+        for algorithm in backend.algorithms:
+            key_ring = KeyRing(backend)
+            if algorithm == "HS256":
+                key_ring.add("k1", algorithm, SECRET, active=True)
+            else:
+                private_pem, public_pem = pem_pair(algorithm)
+                key_ring.add("k1", algorithm, public_pem, private_pem, active=True)
+            engine = TokenEngine(key_ring)
+            token = engine.encode(claims)
+            encode_rate = rate(partial(engine.encode, claims), args.iterations)
+            decode_rate = rate(partial(engine.decode, token), args.iterations)
+            print(f"{name:<8} {algorithm:<10} {encode_rate:>10.0f} {decode_rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    main(parser.parse_args())
@@ -0,0 +1,83 @@
+"""Memory and throughput of the item list read path, ORM entities vs column rows.
+
+Reads ``--rows`` items from in-memory SQLite the old way
+(``select(Item)`` + ``result.scalars().all()``) and the way
+``ItemService.get_items`` does it now (``select`` of the response columns +
+``result.all()``). Each read uses a fresh session, as a request would, and
+is serialized with ``item_serializer``. Peak memory is measured with
+tracemalloc, so absolute numbers include its overhead.
+
+    python benchmarks/bench_list_read.py --rows 10000 --repeat 20
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from _common import make_sqlite_engine
+from app.models.item import Item
+from app.models.user import User
+from app.schemas.item import item_serializer
+from app.services.item_service import LIST_COLUMNS
+
+
+def orm_query():
+    return select(Item).order_by(Item.id)
+
+
+def column_query():
+    return select(*(getattr(Item, column) for column in LIST_COLUMNS)).order_by(Item.id)
+
+
+async def read(engine, query, entities: bool):
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        result = await session.execute(query)
+        rows = result.scalars().all() if entities else result.all()
+        return rows, item_serializer.dump_json_many(rows)
+
+
+async def main(args):
+    engine = await make_sqlite_engine()
+    async with AsyncSession(engine) as session:
+        await session.execute(
+            insert(User).values(email="bench@example.com", username="bench", hashed_password="x")
+        )
+        await session.execute(
+            insert(Item),
+            [
+                {"title": f"Item {i}", "description": "Lorem ipsum " * 8, "owner_id": 1}
+                for i in range(args.rows)
+            ],
+        )
+        await session.commit()
+
+    print(f"{'path':<22} {'peak MiB':>9} {'reads/s':>9} {'ms/read':>9}")
+    for name, query, entities in [
+        ("scalars().all()", orm_query(), True),
+        ("column rows", column_query(), False),
+    ]:
+        await read(engine, query, entities)
+        tracemalloc.start()
+        rows, _ = await read(engine, query, entities)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert len(rows) == args.rows
+        del rows
+
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            await read(engine, query, entities)
+        elapsed = (time.perf_counter() - started) / args.repeat
+        print(f"{name:<22} {peak / 2**20:>9.1f} {1 / elapsed:>9.1f} {elapsed * 1000:>9.1f}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
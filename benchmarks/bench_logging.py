@@ -0,0 +1,114 @@
+"""Logging throughput and event loop stalls, synchronous vs queued handlers.
+
+A coroutine logs ``--records`` JSON records to a file (and the console
+handler, pointed at /dev/null) in bursts while a ticker task measures how
+late its 1 ms sleeps wake up. "records/s" is the rate seen by the logging
+coroutine; "written/s" includes draining the queue. ``--write-delay-ms``
+adds a sleep to every write to the file, standing in for a slow disk or a
+blocked stdout pipe.
+
+    python benchmarks/bench_logging.py --records 100000 --write-delay-ms 0.1
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+
+import _common  # noqa: F401  (puts src/ on the path)
+
+from _common import percentile
+from app.utils import logging as app_logging
+from app.utils.logging import BatchRotatingFileHandler, setup_logging, shutdown_logging
+
+
+def _all_handlers():
+    """Root handlers, or the listener's handlers in queued mode."""
+    listener = app_logging._listener
+    return listener.handlers if listener is not None else logging.getLogger().handlers
+
+
+async def measure(records: int, burst: int) -> tuple[float, list[float]]:
+    logger = logging.getLogger("bench.logging")
+    lags: list[float] = []
+    done = False
+
+    async def ticker():
+        while not done:
+            expected = time.perf_counter() + 0.001
+            await asyncio.sleep(0.001)
+            lags.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    started = time.perf_counter()
+    for i in range(records):
+        logger.info("request %d handled", i, extra={"request_id": "bench"})
+        if i % burst == 0:
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+    done = True
+    await task
+    return elapsed, lags
+
+
+class SlowStream:
+    """File wrapper whose writes take at least ``delay`` seconds."""
+
+    def __init__(self, stream, delay: float):
+        self._stream = stream
+        self._delay = delay
+
+    def write(self, data):
+        time.sleep(self._delay)
+        return self._stream.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def main(args):
+    variants = [
+        ("sync", {}),
+        ("queue, drop", {"async_mode": True, "overflow": "drop"}),
+        ("queue, block", {"async_mode": True, "overflow": "block"}),
+    ]
+    print(
+        f"{'mode':<14} {'records/s':>10} {'written/s':>10} {'dropped':>8} "
+        f"{'lag p99 ms':>11} {'lag max ms':>11}"
+    )
+    stdout = sys.stdout
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull:
+        for name, options in variants:
+            log_file = os.path.join(directory, f"{name.replace(', ', '-')}.log")
+            sys.stdout = devnull
+            setup_logging(use_json=True, log_file=log_file, queue_size=args.queue_size, **options)
+            sys.stdout = stdout
+            if args.write_delay_ms:
+                file_handler = next(
+                    h for h in _all_handlers() if isinstance(h, BatchRotatingFileHandler)
+                )
+                file_handler.stream = SlowStream(file_handler.stream, args.write_delay_ms / 1000)
+            elapsed, lags = asyncio.run(measure(args.records, args.burst))
+            started_drain = time.perf_counter()
+            dropped = getattr(logging.getLogger().handlers[0], "dropped", 0)
+            shutdown_logging()
+            total = elapsed + time.perf_counter() - started_drain
+            print(
+                f"{name:<14} {args.records / elapsed:>10.0f} "
+                f"{(args.records - dropped) / total:>10.0f} {dropped:>8} "
+                f"{percentile(lags, 99):>11.2f} {max(lags, default=0):>11.2f}"
+            )
+    logging.getLogger().handlers.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--burst", type=int, default=100, help="records between loop yields")
+    parser.add_argument("--queue-size", type=int, default=10_000)
+    parser.add_argument("--write-delay-ms", type=float, default=0.0)
+    main(parser.parse_args())
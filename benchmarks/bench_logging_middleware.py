@@ -0,0 +1,98 @@
+"""Per-request overhead of the access logging middleware.
+
+A one-route app is called directly through ASGI (no HTTP client), bare and
+wrapped in each middleware variant. The "BaseHTTPMiddleware" row reproduces
+the old implementation. Log records are handled by a NullHandler, so the
+numbers cover building the records, not writing them.
+
+    python benchmarks/bench_logging_middleware.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import _common  # noqa: F401  (puts src/ on the path)
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware.logging import LoggingMiddleware
+
+old_logger = logging.getLogger("bench.old_logging")
+
+
+class OldLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        old_logger.info(f"Request: {request.method} {request.url}")
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        old_logger.info(f"Response: {response.status_code} - Process time: {process_time:.4f}s")
+        response.headers["X-Process-Time"] = str(process_time)
+        return response
+
+
+def make_app(middleware=None, **options) -> FastAPI:
+    app = FastAPI()
+    if middleware is not None:
+        app.add_middleware(middleware, **options)
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"id": item_id}
+
+    return app
+
+
+async def per_request_us(app: FastAPI, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/items/1",
+        "raw_path": b"/items/1",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(200):
+        await app(dict(scope), receive, send)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def main(args):
+    logging.basicConfig(level=logging.INFO, handlers=[logging.NullHandler()])
+    variants = [
+        ("no middleware", make_app()),
+        ("BaseHTTPMiddleware", make_app(OldLoggingMiddleware)),
+        ("ASGI, log all", make_app(LoggingMiddleware)),
+        ("ASGI, sample 1%", make_app(LoggingMiddleware, sample_rate=0.01)),
+    ]
+    baseline = None
+    print(f"{'variant':<20} {'us/request':>11} {'overhead us':>12}")
+    for name, app in variants:
+        elapsed = await per_request_us(app, args.requests)
+        baseline = elapsed if baseline is None else baseline
+        print(f"{name:<20} {elapsed:>11.1f} {elapsed - baseline:>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,91 @@
+"""Latency of unrelated GETs while a burst of logins is being processed.
+
+Compares bcrypt running inline on the event loop (``--workers 0``, the old
+behaviour) against the bounded password hashing pool. Auth admission control
+is switched off so that every login reaches bcrypt.
+
+    python benchmarks/bench_login_storm.py --logins 40 --gets 400
+"""
+
+import argparse
+import asyncio
+import time
+
+from _common import app_client, make_sqlite_engine, percentile
+
+from app.core.admission import auth_admission
+from app.core.security import password_executor
+
+USER = {
+    "email": "bench@example.com",
+    "username": "benchuser",
+    "password": "Benchpass123",
+}
+
+
+async def run_storm(workers: int, logins: int, gets: int) -> dict:
+    password_executor.shutdown()
+    password_executor.max_workers = workers
+    password_executor.max_queue = logins
+    engine = await make_sqlite_engine()
+    async with app_client(engine) as client:
+        await client.post("/api/v1/auth/register", json=USER)
+        response = await client.post(
+            "/api/v1/auth/login",
+            json={"username": USER["username"], "password": USER["password"]},
+        )
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        credentials = {"username": USER["username"], "password": USER["password"]}
+
+        latencies: list[float] = []
+
+        async def timed_get():
+            started = time.perf_counter()
+            await client.get("/api/v1/items/", headers=headers)
+            latencies.append(time.perf_counter() - started)
+
+        async def get_stream():
+            # Issue GETs on a fixed schedule so a stalled loop delays all of them
+            tasks = []
+            for _ in range(gets):
+                tasks.append(asyncio.create_task(timed_get()))
+                await asyncio.sleep(0.005)
+            await asyncio.gather(*tasks)
+
+        started = time.perf_counter()
+        _, *login_responses = await asyncio.gather(
+            get_stream(),
+            *(client.post("/api/v1/auth/login", json=credentials) for _ in range(logins)),
+        )
+        elapsed = time.perf_counter() - started
+        statuses = {response.status_code for response in login_responses}
+        assert statuses == {200}, f"logins were rejected: {statuses}"
+    await engine.dispose()
+    return {
+        "workers": workers,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies) * 1000,
+        "elapsed_s": elapsed,
+    }
+
+
+async def main(args):
+    # Rate limits and load shedding would reject most of the burst
+    auth_admission.enabled = False
+    for workers in (0, args.workers):
+        result = await run_storm(workers, args.logins, args.gets)
+        label = "inline (before)" if workers == 0 else f"pool of {workers} (after)"
+        print(
+            f"{label:<22} GET p50={result['p50_ms']:.1f}ms p99={result['p99_ms']:.1f}ms "
+            f"max={result['max_ms']:.1f}ms total={result['elapsed_s']:.2f}s"
+        )
+    password_executor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--gets", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=4)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,88 @@
+"""Serialization cost of item list responses, response_model vs ResponseSerializer.
+
+Transient ORM ``Item`` objects are serialized the way each path does it:
+
+* "response_model + json": FastAPI's default path, validate into the
+  schema, dump to JSON-compatible Python, ``json.dumps`` (JSONResponse).
+* "response_model + orjson": the same with the ORJSONResponse default.
+* "serializer": ``item_serializer.dump_json_many`` on the ORM objects.
+* "serializer, validated": the same on schema instances a service already
+  validated.
+
+    python benchmarks/bench_serialization.py --seconds 1
+"""
+
+import argparse
+import time
+from datetime import datetime
+from functools import partial
+from typing import List
+
+import _common  # noqa: F401  (puts src/ on the path)
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.models.item import Item
+from app.schemas.item import Item as ItemSchema, item_serializer
+
+SIZES = (1, 100, 10_000)
+
+
+def make_items(count: int) -> List[Item]:
+    now = datetime(2024, 1, 1, 12, 30)
+    return [
+        Item(
+            id=i,
+            title=f"Item {i}",
+            description="Lorem ipsum dolor sit amet " * 4,
+            owner_id=1,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def per_call_us(fn, seconds: float) -> float:
+    calls = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        fn()
+        calls += 1
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main(args):
+    adapter = TypeAdapter(List[ItemSchema])
+
+    def response_model(response_class):
+        def serialize(items):
+            content = adapter.dump_python(
+                adapter.validate_python(items, from_attributes=True), mode="json", by_alias=True
+            )
+            return response_class(content).body
+
+        return serialize
+
+    variants = [
+        ("response_model + json", response_model(JSONResponse), False),
+        ("response_model + orjson", response_model(ORJSONResponse), False),
+        ("serializer", item_serializer.dump_json_many, False),
+        ("serializer, validated", item_serializer.dump_json_many, True),
+    ]
+    print(f"{'path':<26}" + "".join(f"{f'{size} us':>14}" for size in SIZES))
+    for name, serialize, validated in variants:
+        row = []
+        for size in SIZES:
+            items = make_items(size)
+            if validated:
+                items = item_serializer.validate_many(items)
+            row.append(per_call_us(partial(serialize, items), args.seconds))
+        print(f"{name:<26}" + "".join(f"{us:>14.1f}" for us in row))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="time spent per cell")
+    main(parser.parse_args())
@@ -0,0 +1,136 @@
+"""SQL statements and commits issued per write request.
+
+Counts every statement sent to the database (``before_cursor_execute``) and
+every commit while the item and user write endpoints are exercised, and
+reports the averages per request along with mean latency.
+
+    python benchmarks/bench_write_statements.py --requests 200
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import event, text
+
+from _common import app_client, make_sqlite_engine
+
+ADMIN = {
+    "email": "bench@example.com",
+    "username": "benchadmin",
+    "password": "Benchpass123",
+}
+
+
+class StatementCounter:
+    """Count statements and commits on an engine."""
+
+    def __init__(self, engine):
+        self.statements = 0
+        self.commits = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+        event.listen(engine.sync_engine, "commit", self._on_commit)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements += 1
+
+    def _on_commit(self, conn):
+        self.commits += 1
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.commits = 0
+
+
+async def measure(counter: StatementCounter, requests: int, call) -> dict:
+    counter.reset()
+    started = time.perf_counter()
+    for i in range(requests):
+        response = await call(i)
+        assert response.status_code < 300, response.text
+    elapsed = time.perf_counter() - started
+    return {
+        "statements": counter.statements / requests,
+        "commits": counter.commits / requests,
+        "latency_ms": elapsed / requests * 1000,
+    }
+
+
+async def main(args):
+    engine = await make_sqlite_engine()
+    counter = StatementCounter(engine)
+    async with app_client(engine) as client:
+        await client.post("/api/v1/auth/register", json=ADMIN)
+        async with engine.begin() as conn:
+            await conn.execute(text("UPDATE users SET is_superuser = 1"))
+        response = await client.post(
+            "/api/v1/auth/login",
+            json={"username": ADMIN["username"], "password": ADMIN["password"]},
+        )
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        # Warm the principal cache so authentication does not skew the counts
+        await client.get("/api/v1/items/", headers=headers)
+
+        item_ids: list[int] = []
+        user_ids: list[int] = []
+
+        async def create_item(i):
+            response = await client.post(
+                "/api/v1/items/", json={"title": f"item {i}"}, headers=headers
+            )
+            item_ids.append(response.json()["id"])
+            return response
+
+        async def update_item(i):
+            return await client.put(
+                f"/api/v1/items/{item_ids[i]}", json={"title": f"renamed {i}"}, headers=headers
+            )
+
+        async def delete_item(i):
+            return await client.delete(f"/api/v1/items/{item_ids[i]}", headers=headers)
+
+        async def create_user(i):
+            response = await client.post(
+                "/api/v1/users/",
+                json={
+                    "email": f"user{i}@example.com",
+                    "username": f"user{i}",
+                    "password": "Benchpass123",
+                },
+                headers=headers,
+            )
+            user_ids.append(response.json()["id"])
+            return response
+
+        async def update_user(i):
+            return await client.put(
+                f"/api/v1/users/{user_ids[i]}", json={"full_name": f"User {i}"}, headers=headers
+            )
+
+        users = min(args.requests, args.user_requests)
+        results = [
+            ("POST /items/", await measure(counter, args.requests, create_item)),
+            ("PUT /items/{id}", await measure(counter, args.requests, update_item)),
+            ("DELETE /items/{id}", await measure(counter, args.requests, delete_item)),
+            ("POST /users/", await measure(counter, users, create_user)),
+            ("PUT /users/{id}", await measure(counter, users, update_user)),
+        ]
+    await engine.dispose()
+
+    for label, result in results:
+        print(
+            f"{label:<20} statements/req={result['statements']:.2f} "
+            f"commits/req={result['commits']:.2f} latency={result['latency_ms']:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--user-requests",
+        type=int,
+        default=20,
+        help="user writes hash a password, so fewer of them are issued",
+    )
+    asyncio.run(main(parser.parse_args()))
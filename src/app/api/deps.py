@@ -1,20 +1,58 @@
 """FastAPI dependencies."""
 
 from typing import AsyncGenerator
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config.database import AsyncSessionLocal
+from app.config.database import (
+    AsyncSessionLocal,
+    ReadSessionLocal,
+    read_only_engine,
+    replica_router,
+)
+from app.database.request_session import READ_ONLY_METHODS
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting database session."""
-    async with AsyncSessionLocal() as session:
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting database session.
+
+    No connection is checked out until the first statement. GET/HEAD requests
+    run in READ ONLY transactions that end after each statement, and the final
+    commit is skipped when nothing was written.
+    """
+    read_only = request.method in READ_ONLY_METHODS
+    session_kwargs = {"bind": read_only_engine} if read_only else {}
+    async with AsyncSessionLocal(**session_kwargs) as session:
+        session.info["request"] = request
+        session.info["read_only"] = read_only
         try:
             yield session
-            await session.commit()
+            if session.has_writes:
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
         finally:
             await session.close()
 
+
+async def get_read_db(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for read-only endpoints.
+
+    Routes queries to a healthy read replica when replicas are configured,
+    unless the current user wrote recently (read-your-writes). Without
+    replicas this is the regular request session.
+    """
+    if not replica_router.enabled:
+        yield db
+        return
+    async with ReadSessionLocal() as session:
+        session.info["request"] = request
+        session.info["read_only"] = True
+        try:
+            yield session
+        finally:
+            await session.close()
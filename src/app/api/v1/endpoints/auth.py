@@ -1,9 +1,10 @@
 """Authentication endpoints."""
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db
+from app.core.admission import auth_admission
 from app.schemas.token import Token
 from app.schemas.user import UserLogin, UserCreate, User
 from app.services.auth_service import AuthService
@@ -14,17 +15,23 @@ router = APIRouter()
 @router.post("/login", response_model=Token, status_code=status.HTTP_200_OK)
 async def login(
     user_login: UserLogin,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """Login endpoint."""
-    return await AuthService.login(db, user_login)
+    client_ip = request.client.host if request.client else None
+    async with auth_admission.admit(username=user_login.username, client_ip=client_ip):
+        return await AuthService.login(db, user_login)
 
 
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
 async def register(
     user_create: UserCreate,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """Register endpoint."""
-    return await AuthService.register(db, user_create)
+    client_ip = request.client.host if request.client else None
+    async with auth_admission.admit(client_ip=client_ip):
+        return await AuthService.register(db, user_create)
 
@@ -1,14 +1,25 @@
 """Item endpoints."""
 
-from typing import List
+from typing import Any, List, Literal, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_read_db
 from app.core.security import get_current_active_user
-from app.models.user import User
-from app.schemas.item import Item as ItemSchema, ItemCreate, ItemUpdate
-from app.services.item_service import ItemService
+from app.core.principal import Principal
+from app.schemas.item import (
+    Item as ItemSchema,
+    ItemBulkCreate,
+    ItemBulkDelete,
+    ItemBulkResponse,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemUpdate,
+    item_serializer,
+)
+from app.services.item_service import EXPORT_COLUMNS, ItemService
+from app.utils.export import EXPORT_MEDIA_TYPES, encode_rows
 
 router = APIRouter()
 
@@ -17,68 +28,123 @@ router = APIRouter()
 async def read_items(
     skip: int = 0,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_active_user),
 ):
-    """Get all items for the current user."""
-    items = await ItemService.get_items(db, skip=skip, limit=limit, owner_id=current_user.id)
-    return items
+    """Get the current user's items, one page at a time.
+
+    The cursor of the next page is returned in the ``X-Next-Cursor`` header.
+    ``fields`` (e.g. ``id,title``) limits the columns read and returned.
+    """
+    selected = item_serializer.parse_fields(fields)
+    page = await ItemService.get_items(
+        db, skip=skip, limit=limit, owner_id=current_user.id, cursor=cursor, fields=selected
+    )
+    return item_serializer.only(selected).page_response(page)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_items(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_active_user),
+):
+    """Stream all of the current user's items as NDJSON or CSV."""
+    rows = ItemService.export_items(db, owner_id=current_user.id)
+    return StreamingResponse(
+        encode_rows(rows, EXPORT_COLUMNS, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="items.{format}"'},
+    )
 
 
 @router.get("/{item_id}", response_model=ItemSchema)
 async def read_item(
     item_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_active_user),
 ):
-    """Get an item by ID."""
-    item = await ItemService.get_item(db, item_id)
+    """Get an item by ID, limited to ``fields`` when given."""
+    selected = item_serializer.parse_fields(fields)
+    # A row of the selected columns or a full Item; both expose owner_id
+    item: Any
+    if selected:
+        item = await ItemService.get_item_fields(db, item_id, selected)
+    else:
+        item = await ItemService.load_item(db, item_id)
     if item.owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
         )
-    return item
+    return item_serializer.only(selected).response(item)
 
 
 @router.post("/", response_model=ItemSchema, status_code=status.HTTP_201_CREATED)
 async def create_item(
     item_create: ItemCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ):
     """Create a new item."""
     return await ItemService.create_item(db, item_create, owner_id=current_user.id)
 
 
+# Bulk routes are declared before "/{item_id}" so "bulk" is not taken for an id
+@router.post("/bulk", response_model=ItemBulkResponse, status_code=status.HTTP_201_CREATED)
+async def create_items_bulk(
+    bulk_create: ItemBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
+):
+    """Create many items in one request (all or nothing)."""
+    results = await ItemService.create_items(db, bulk_create.items, owner_id=current_user.id)
+    return ItemBulkResponse(results=results)
+
+
+@router.patch("/bulk", response_model=ItemBulkResponse)
+async def update_items_bulk(
+    bulk_update: ItemBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
+):
+    """Update many items; missing or foreign items are reported per entry."""
+    results = await ItemService.update_items(db, bulk_update.items, owner_id=current_user.id)
+    return ItemBulkResponse(results=results)
+
+
+@router.delete("/bulk", response_model=ItemBulkResponse)
+async def delete_items_bulk(
+    bulk_delete: ItemBulkDelete,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
+):
+    """Delete many items; missing or foreign items are reported per entry."""
+    results = await ItemService.delete_items(db, bulk_delete.ids, owner_id=current_user.id)
+    return ItemBulkResponse(results=results)
+
+
 @router.put("/{item_id}", response_model=ItemSchema)
 async def update_item(
     item_id: int,
     item_update: ItemUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ):
     """Update an item."""
-    if not await ItemService.check_ownership(db, item_id, current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-    return await ItemService.update_item(db, item_id, item_update)
+    return await ItemService.update_item(db, item_id, item_update, owner_id=current_user.id)
 
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_item(
     item_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ):
     """Delete an item."""
-    if not await ItemService.check_ownership(db, item_id, current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-    await ItemService.delete_item(db, item_id)
+    await ItemService.delete_item(db, item_id, owner_id=current_user.id)
     return None
 
@@ -1,13 +1,20 @@
 """MongoDB Notes endpoints."""
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, status
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, Request, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.database.mongodb import get_mongodb_database
 from app.core.security import get_current_active_user
-from app.models.user import User
-from app.schemas.mongodb_note import Note as NoteSchema, NoteCreate, NoteUpdate
+from app.core.principal import Principal
+from app.schemas.mongodb_note import (
+    Note as NoteSchema,
+    NoteCreate,
+    NoteImportSummary,
+    NoteUpdate,
+    TagCount,
+    note_serializer,
+)
 from app.services.mongodb_note_service import MongoDBNoteService
 
 router = APIRouter()
@@ -23,14 +30,27 @@ async def read_notes(
     skip: int = 0,
     limit: int = 100,
     archived: Optional[bool] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     db: AsyncIOMotorDatabase = Depends(get_mongodb_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ):
-    """Get all notes for the current user."""
-    notes = await MongoDBNoteService.get_notes(
-        db, str(current_user.id), skip=skip, limit=limit, archived=archived
+    """Get the current user's notes, newest first, one page at a time.
+
+    The cursor of the next page is returned in the ``X-Next-Cursor`` header.
+    ``fields`` (e.g. ``_id,title``) limits the fields read and returned.
+    """
+    selected = note_serializer.parse_fields(fields)
+    page = await MongoDBNoteService.get_notes(
+        db,
+        str(current_user.id),
+        skip=skip,
+        limit=limit,
+        archived=archived,
+        cursor=cursor,
+        fields=selected,
     )
-    return notes
+    return note_serializer.only(selected).page_response(page)
 
 
 @router.get("/search", response_model=List[NoteSchema])
@@ -38,42 +58,71 @@ async def search_notes(
     q: str,
     skip: int = 0,
     limit: int = 100,
+    mode: Literal["text", "regex"] = "text",
+    cursor: Optional[str] = None,
     db: AsyncIOMotorDatabase = Depends(get_mongodb_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ):
-    """Search notes by title or content."""
-    notes = await MongoDBNoteService.search_notes(
-        db, str(current_user.id), q, skip=skip, limit=limit
+    """Search notes by title or content.
+
+    ``mode=text`` (default) ranks whole-word matches by relevance;
+    ``mode=regex`` matches substrings. The cursor of the next page is
+    returned in the ``X-Next-Cursor`` header.
+    """
+    page = await MongoDBNoteService.search_notes(
+        db, str(current_user.id), q, skip=skip, limit=limit, mode=mode, cursor=cursor
     )
-    return notes
+    return note_serializer.page_response(page)
+
+
+@router.get("/tags", response_model=List[TagCount])
+async def read_tag_counts(
+    db: AsyncIOMotorDatabase = Depends(get_mongodb_db),
+    current_user: Principal = Depends(get_current_active_user),
+):
+    """Get the current user's tags with note counts, most used first."""
+    return await MongoDBNoteService.get_tag_counts(db, str(current_user.id))
 
 
 @router.get("/{note_id}", response_model=NoteSchema)
 async def read_note(
     note_id: str,
+    fields: Optional[str] = None,
     db: AsyncIOMotorDatabase = Depends(get_mongodb_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ):
-    """Get a note by ID."""
-    return await MongoDBNoteService.get_note(db, note_id, str(current_user.id))
+    """Get a note by ID, limited to ``fields`` when given."""
+    selected = note_serializer.parse_fields(fields)
+    note = await MongoDBNoteService.get_note(db, note_id, str(current_user.id), fields=selected)
+    return note_serializer.only(selected).response(note)
 
 
 @router.post("/", response_model=NoteSchema, status_code=status.HTTP_201_CREATED)
 async def create_note(
     note_create: NoteCreate,
     db: AsyncIOMotorDatabase = Depends(get_mongodb_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ):
     """Create a new note."""
     return await MongoDBNoteService.create_note(db, note_create, str(current_user.id))
 
 
+@router.post("/import", response_model=NoteImportSummary)
+async def import_notes(
+    request: Request,
+    db: AsyncIOMotorDatabase = Depends(get_mongodb_db),
+    current_user: Principal = Depends(get_current_active_user),
+):
+    """Import notes from a streamed NDJSON body (one note per line)."""
+    return await MongoDBNoteService.import_notes(db, request.stream(), str(current_user.id))
+
+
 @router.put("/{note_id}", response_model=NoteSchema)
 async def update_note(
     note_id: str,
     note_update: NoteUpdate,
     db: AsyncIOMotorDatabase = Depends(get_mongodb_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ):
     """Update a note."""
     return await MongoDBNoteService.update_note(db, note_id, note_update, str(current_user.id))
@@ -83,7 +132,7 @@ async def update_note(
 async def delete_note(
     note_id: str,
     db: AsyncIOMotorDatabase = Depends(get_mongodb_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ):
     """Delete a note."""
     await MongoDBNoteService.delete_note(db, note_id, str(current_user.id))
@@ -1,51 +1,75 @@
 """User endpoints."""
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_read_db
 from app.core.security import get_current_active_user, get_current_active_superuser
-from app.models.user import User
-from app.schemas.user import User as UserSchema, UserCreate, UserUpdate
+from app.core.principal import Principal
+from app.schemas.user import User as UserSchema, UserCreate, UserUpdate, user_serializer
 from app.services.user_service import UserService
 
 router = APIRouter()
 
 
+async def _user_response(db: AsyncSession, user_id: int, fields: Optional[str]) -> Response:
+    selected = user_serializer.parse_fields(fields)
+    user: Any
+    if selected:
+        user = await UserService.get_user_fields(db, user_id, selected)
+    else:
+        user = await UserService.load_user(db, user_id)
+    return user_serializer.only(selected).response(user)
+
+
 @router.get("/me", response_model=UserSchema)
-async def read_users_me(current_user: User = Depends(get_current_active_user)):
-    """Get current user."""
-    return current_user
+async def read_users_me(
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_active_user),
+):
+    """Get current user, limited to ``fields`` when given."""
+    return await _user_response(db, current_user.id, fields)
 
 
 @router.get("/", response_model=List[UserSchema])
 async def read_users(
     skip: int = 0,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_superuser),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_active_superuser),
 ):
-    """Get all users (admin only)."""
-    users = await UserService.get_users(db, skip=skip, limit=limit)
-    return users
+    """Get all users, one page at a time (admin only).
+
+    The cursor of the next page is returned in the ``X-Next-Cursor`` header.
+    ``fields`` (e.g. ``id,username``) limits the columns read and returned.
+    """
+    selected = user_serializer.parse_fields(fields)
+    page = await UserService.get_users(
+        db, skip=skip, limit=limit, cursor=cursor, fields=selected
+    )
+    return user_serializer.only(selected).page_response(page)
 
 
 @router.get("/{user_id}", response_model=UserSchema)
 async def read_user(
     user_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_superuser),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_active_superuser),
 ):
-    """Get a user by ID (admin only)."""
-    return await UserService.get_user(db, user_id)
+    """Get a user by ID, limited to ``fields`` when given (admin only)."""
+    return await _user_response(db, user_id, fields)
 
 
 @router.post("/", response_model=UserSchema, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_create: UserCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: Principal = Depends(get_current_active_superuser),
 ):
     """Create a new user (admin only)."""
     return await UserService.create_user(db, user_create)
@@ -56,7 +80,7 @@ async def update_user(
     user_id: int,
     user_update: UserUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ):
     """Update a user (users can update themselves, admins can update anyone)."""
     if user_id != current_user.id and not current_user.is_superuser:
@@ -71,7 +95,7 @@ async def update_user(
 async def delete_user(
     user_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: Principal = Depends(get_current_active_superuser),
 ):
     """Delete a user (admin only)."""
     await UserService.delete_user(db, user_id)
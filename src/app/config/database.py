@@ -1,8 +1,14 @@
 """Database configuration."""
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from typing import Any, Dict
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from app.config.settings import settings
+from app.core.metrics import register_metrics
+from app.database.pool_metrics import PoolMetrics
+from app.database.replicas import ReplicaRouter, make_routing_session_class, track_writes
+from app.database.request_session import RequestSession
 
 
 def get_async_database_url(database_url: str) -> str:
@@ -14,20 +20,72 @@ def get_async_database_url(database_url: str) -> str:
     return database_url
 
 
+def get_engine_options(database_url: str, pool_metrics: PoolMetrics) -> dict:
+    """Build engine keyword arguments from settings."""
+    options: Dict[str, Any] = {
+        "echo": settings.DATABASE_ECHO,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+    }
+    # SQLite keeps SQLAlchemy's default pool; the sizing only applies to servers
+    if not database_url.startswith("sqlite"):
+        options.update(
+            poolclass=pool_metrics.pool_class(),
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        )
+    if database_url.startswith("postgresql+asyncpg://"):
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        }
+    return options
+
+
 # Create async database engine
 async_database_url = get_async_database_url(settings.DATABASE_URL)
+pool_metrics = PoolMetrics("primary")
 engine = create_async_engine(
-    async_database_url,
-    echo=settings.DATABASE_ECHO,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    async_database_url, **get_engine_options(async_database_url, pool_metrics)
 )
+pool_metrics.instrument(engine)
+register_metrics("database_pool", pool_metrics.stats)
+# Same pool, but transactions are started as BEGIN READ ONLY on PostgreSQL
+read_only_engine = engine.execution_options(postgresql_readonly=True)
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
-    class_=AsyncSession,
+    class_=RequestSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+# Optional read replicas
+replica_engines = []
+for index, replica_url in enumerate(settings.DATABASE_REPLICA_URLS):
+    replica_url = get_async_database_url(replica_url)
+    replica_pool_metrics = PoolMetrics(f"replica_{index}")
+    replica_engine = create_async_engine(
+        replica_url, **get_engine_options(replica_url, replica_pool_metrics)
+    )
+    replica_pool_metrics.instrument(replica_engine)
+    register_metrics(f"database_pool_replica_{index}", replica_pool_metrics.stats)
+    replica_engines.append(replica_engine)
+
+replica_router = ReplicaRouter(
+    replica_engines, sticky_seconds=settings.DATABASE_READ_YOUR_WRITES_SECONDS
+)
+register_metrics("database_replicas", replica_router.stats)
+if replica_router.enabled:
+    track_writes(replica_router)
+
+# Session factory for read-only endpoints, routed to replicas when configured
+ReadSessionLocal = async_sessionmaker(
+    read_only_engine,
+    class_=RequestSession,
+    sync_session_class=make_routing_session_class(read_only_engine, replica_router),
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
@@ -0,0 +1,195 @@
+"""Admission control for expensive credential checks.
+
+Login and registration are CPU-bound on bcrypt, so a burst of them can take
+every worker CPU away from regular traffic. The controller bounds how many
+credential checks run at once, lets a few more wait briefly, rate limits per
+username and per client IP, and sheds everything else with ``Retry-After``.
+
+Rate limited clients get 429. Overload, whether the wait queue is full or
+the wait timed out, is the server's condition rather than the client's, so
+both get 503.
+
+The client IP is the one uvicorn reports, so behind a reverse proxy run it
+with ``--proxy-headers`` and the proxy's address in ``--forwarded-allow-ips``
+(or ``FORWARDED_ALLOW_IPS``); otherwise every client shares the proxy's
+bucket.
+"""
+
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from app.config.settings import settings
+from app.core.exceptions import ServiceUnavailableError, TooManyRequestsError
+from app.core.metrics import register_metrics
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at ``rate`` tokens per second."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = now
+
+    def try_acquire(self, now: float) -> float:
+        """Take one token; return 0 on success or the seconds until one is available."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class KeyedTokenBuckets:
+    """Token buckets per key, keeping at most ``max_keys`` (least recently used dropped)."""
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        burst: int,
+        max_keys: int = 100_000,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate_per_minute / 60
+        self.burst = burst
+        self.max_keys = max_keys
+        self._timer = timer
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+
+    def try_acquire(self, key: str) -> float:
+        """Take a token for ``key``; return 0 on success or the retry delay in seconds."""
+        now = self._timer()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(self.rate, self.burst, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket.try_acquire(now)
+
+
+class AdmissionController:
+    """Concurrency limit with a short bounded wait queue and per-key rate limits."""
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout: float,
+        username_limiter: Optional[KeyedTokenBuckets] = None,
+        ip_limiter: Optional[KeyedTokenBuckets] = None,
+        enabled: bool = True,
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.username_limiter = username_limiter
+        self.ip_limiter = ip_limiter
+        self.enabled = enabled
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._active = 0
+        self._waiting = 0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_rate_limited = 0
+        self.rejected_queue_full = 0
+        self.rejected_queue_timeout = 0
+        self.queue_wait_seconds_total = 0.0
+        self.queue_wait_seconds_max = 0.0
+
+    def _check_rate(self, username: Optional[str], client_ip: Optional[str]) -> None:
+        checks = ((self.ip_limiter, client_ip), (self.username_limiter, username))
+        for limiter, key in checks:
+            if limiter is None or key is None:
+                continue
+            retry_after = limiter.try_acquire(key)
+            if retry_after:
+                self.rejected_rate_limited += 1
+                raise TooManyRequestsError(retry_after=math.ceil(retry_after))
+
+    async def _acquire_slot(self) -> None:
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            return
+        if self._waiting >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise ServiceUnavailableError(
+                detail="Authentication is overloaded, retry later",
+                retry_after=math.ceil(self.queue_timeout),
+            )
+        self._waiting += 1
+        self.queued += 1
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected_queue_timeout += 1
+            raise ServiceUnavailableError(
+                detail="Authentication is overloaded, retry later",
+                retry_after=math.ceil(self.queue_timeout),
+            ) from None
+        finally:
+            self._waiting -= 1
+            waited = time.perf_counter() - started
+            self.queue_wait_seconds_total += waited
+            self.queue_wait_seconds_max = max(self.queue_wait_seconds_max, waited)
+
+    @asynccontextmanager
+    async def admit(
+        self, username: Optional[str] = None, client_ip: Optional[str] = None
+    ) -> AsyncIterator[None]:
+        """Hold an admission slot for the duration of the block, or raise 429/503."""
+        if not self.enabled:
+            yield
+            return
+        self._check_rate(username, client_ip)
+        await self._acquire_slot()
+        self._active += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self._active -= 1
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters suitable for a metrics endpoint."""
+        return {
+            "enabled": self.enabled,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "waiting": self._waiting,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected_rate_limited": self.rejected_rate_limited,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_queue_timeout": self.rejected_queue_timeout,
+            "queue_wait_seconds_total": self.queue_wait_seconds_total,
+            "queue_wait_seconds_max": self.queue_wait_seconds_max,
+        }
+
+
+auth_admission = AdmissionController(
+    "auth",
+    max_concurrency=settings.AUTH_MAX_CONCURRENCY,
+    max_queue=settings.AUTH_MAX_QUEUE,
+    queue_timeout=settings.AUTH_QUEUE_TIMEOUT_SECONDS,
+    username_limiter=KeyedTokenBuckets(
+        settings.AUTH_USERNAME_RATE_PER_MINUTE, settings.AUTH_USERNAME_BURST
+    ),
+    ip_limiter=KeyedTokenBuckets(settings.AUTH_IP_RATE_PER_MINUTE, settings.AUTH_IP_BURST),
+    enabled=settings.AUTH_ADMISSION_ENABLED,
+)
+register_metrics("auth_admission", auth_admission.stats)
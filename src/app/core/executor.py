@@ -0,0 +1,106 @@
+"""Bounded executors for CPU-bound work that must stay off the event loop."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from app.core.exceptions import ServiceUnavailableError
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """Dispatch blocking calls to a dedicated pool with a queue-depth limit.
+
+    At most ``max_workers`` calls run at once and at most ``max_queue`` more
+    may wait for a worker; anything beyond that fails fast with a 503 instead
+    of piling up behind a saturated pool. With ``max_workers=0`` calls run
+    inline on the caller's thread.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        max_queue: int,
+        kind: str = "thread",
+        retry_after: int = 1,
+    ):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.kind = kind
+        self.retry_after = retry_after
+        self._executor: Optional[Executor] = None
+        # Calls finish on pool threads, so the counters are shared with them
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.busy_seconds = 0.0
+
+    def _get_executor(self) -> Executor:
+        # Created lazily so importing the module never forks or spawns threads
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=self.name
+                )
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(*args)`` in the pool, or raise 503 if the pool is saturated."""
+        if self.max_workers <= 0:
+            return fn(*args)
+        with self._lock:
+            saturated = self._pending >= self.max_workers + self.max_queue
+            if saturated:
+                self.rejected += 1
+            else:
+                self._pending += 1
+        if saturated:
+            raise ServiceUnavailableError(
+                detail=f"{self.name} pool is saturated, retry later",
+                retry_after=self.retry_after,
+            )
+        started = time.perf_counter()
+        try:
+            future = self._get_executor().submit(partial(fn, *args))
+        except BaseException:
+            self._finished(started)
+            raise
+        # Counted as pending until the call itself ends, not until the caller
+        # stops waiting: a cancelled caller leaves the call running
+        future.add_done_callback(lambda _: self._finished(started))
+        return await asyncio.wrap_future(future)
+
+    def _finished(self, started: float) -> None:
+        with self._lock:
+            self._pending -= 1
+            self.completed += 1
+            self.busy_seconds += time.perf_counter() - started
+
+    def shutdown(self) -> None:
+        """Shut the underlying pool down (it is recreated on next use)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters suitable for a metrics endpoint."""
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "pending": self._pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "busy_seconds": self.busy_seconds,
+        }
@@ -0,0 +1,245 @@
+"""JWT token engine with a pre-parsed, ``kid``-indexed key ring.
+
+Keys are parsed once at startup into backend key objects, so encoding and
+decoding never re-process raw secrets or PEM material. Tokens carry the
+``kid`` of the key that signed them and are only ever verified with that
+key's algorithm, which rules out algorithm-confusion attacks.
+
+Supported algorithms are HS256, RS256 and EdDSA (Ed25519). Two backends are
+available: ``jose`` (python-jose, the default; HS256 and RS256 only) and
+``pyjwt`` (PyJWT with ``cryptography``, all three algorithms).
+"""
+
+import json
+from abc import ABC, abstractmethod
+from base64 import urlsafe_b64decode
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+SUPPORTED_ALGORITHMS = ("HS256", "RS256", "EdDSA")
+
+
+class TokenError(Exception):
+    """Raised when a token cannot be decoded or verified."""
+
+
+class JWTBackend(ABC):
+    """Adapter over a JWT library."""
+
+    name: str
+    algorithms: tuple[str, ...]
+
+    @abstractmethod
+    def prepare_key(self, algorithm: str, material: str | bytes, private: bool) -> Any:
+        """Parse raw key material into the backend's key object."""
+
+    @abstractmethod
+    def encode(self, claims: dict, key: Any, algorithm: str, headers: dict) -> str:
+        """Sign ``claims`` with a prepared key."""
+
+    @abstractmethod
+    def decode(self, token: str, key: Any, algorithm: str) -> dict:
+        """Verify ``token`` with a prepared key and return its claims."""
+
+
+class JoseBackend(JWTBackend):
+    """python-jose backend."""
+
+    name = "jose"
+    algorithms = ("HS256", "RS256")
+
+    def __init__(self):
+        from jose import jwk, jwt
+        from jose.exceptions import JOSEError
+
+        self._jwk = jwk
+        self._jwt = jwt
+        self._error = JOSEError
+
+    def prepare_key(self, algorithm: str, material: str | bytes, private: bool) -> Any:
+        return self._jwk.construct(material, algorithm)
+
+    def encode(self, claims: dict, key: Any, algorithm: str, headers: dict) -> str:
+        try:
+            token: str = self._jwt.encode(claims, key, algorithm=algorithm, headers=headers)
+        except self._error as e:
+            raise TokenError(str(e)) from e
+        return token
+
+    def decode(self, token: str, key: Any, algorithm: str) -> dict:
+        try:
+            claims: dict = self._jwt.decode(token, key, algorithms=[algorithm])
+        except self._error as e:
+            raise TokenError(str(e)) from e
+        return claims
+
+
+class PyJWTBackend(JWTBackend):
+    """PyJWT backend (requires ``PyJWT[crypto]``)."""
+
+    name = "pyjwt"
+    algorithms = ("HS256", "RS256", "EdDSA")
+
+    def __init__(self):
+        try:
+            import jwt
+        except ImportError as e:
+            raise RuntimeError(
+                "JWT_BACKEND=pyjwt requires PyJWT: pip install 'PyJWT[crypto]'"
+            ) from e
+        self._jwt = jwt
+        self._algorithms = jwt.algorithms.get_default_algorithms()
+
+    def prepare_key(self, algorithm: str, material: str | bytes, private: bool) -> Any:
+        if algorithm == "HS256":
+            return material.encode() if isinstance(material, str) else material
+        return self._algorithms[algorithm].prepare_key(material)
+
+    def encode(self, claims: dict, key: Any, algorithm: str, headers: dict) -> str:
+        try:
+            return self._jwt.encode(claims, key, algorithm=algorithm, headers=headers)
+        except self._jwt.PyJWTError as e:
+            raise TokenError(str(e)) from e
+
+    def decode(self, token: str, key: Any, algorithm: str) -> dict:
+        try:
+            return self._jwt.decode(token, key, algorithms=[algorithm])
+        except self._jwt.PyJWTError as e:
+            raise TokenError(str(e)) from e
+
+
+BACKENDS: Dict[str, type[JWTBackend]] = {
+    JoseBackend.name: JoseBackend,
+    PyJWTBackend.name: PyJWTBackend,
+}
+
+
+@dataclass(frozen=True)
+class KeyEntry:
+    """A parsed key in the key ring."""
+
+    kid: str
+    algorithm: str
+    signing_key: Any
+    verification_key: Any
+
+
+class KeyRing:
+    """Parsed keys indexed by ``kid``; exactly one key is active for signing."""
+
+    def __init__(self, backend: JWTBackend):
+        self.backend = backend
+        self._keys: Dict[str, KeyEntry] = {}
+        self.active_kid: Optional[str] = None
+
+    def add(
+        self,
+        kid: str,
+        algorithm: str,
+        verification_material: str | bytes,
+        signing_material: str | bytes | None = None,
+        active: bool = False,
+    ) -> KeyEntry:
+        """Parse and register a key. HMAC keys use the same secret for both roles."""
+        if algorithm not in SUPPORTED_ALGORITHMS:
+            raise ValueError(f"Unsupported JWT algorithm: {algorithm}")
+        if algorithm not in self.backend.algorithms:
+            raise ValueError(f"JWT backend '{self.backend.name}' does not support {algorithm}")
+        if algorithm == "HS256":
+            signing_material = verification_material
+        signing_key = (
+            self.backend.prepare_key(algorithm, signing_material, private=True)
+            if signing_material is not None
+            else None
+        )
+        verification_key = self.backend.prepare_key(algorithm, verification_material, private=False)
+        entry = KeyEntry(kid, algorithm, signing_key, verification_key)
+        self._keys[kid] = entry
+        if active:
+            if signing_key is None:
+                raise ValueError(f"Key '{kid}' has no private material and cannot sign")
+            self.active_kid = kid
+        return entry
+
+    def get(self, kid: Optional[str]) -> Optional[KeyEntry]:
+        """Return the key for ``kid`` (the active key when ``kid`` is None)."""
+        if kid is None:
+            kid = self.active_kid
+        return self._keys.get(kid) if kid is not None else None
+
+    @property
+    def active(self) -> KeyEntry:
+        """The key used for signing new tokens."""
+        if self.active_kid is None:
+            raise RuntimeError("Key ring has no active signing key")
+        return self._keys[self.active_kid]
+
+
+def _unverified_kid(token: str) -> Optional[str]:
+    """Read ``kid`` from the token header without verifying anything."""
+    try:
+        segment = token.split(".", 1)[0]
+        header = json.loads(urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    except (ValueError, IndexError) as e:
+        raise TokenError("Malformed token header") from e
+    if not isinstance(header, dict):
+        raise TokenError("Malformed token header")
+    kid = header.get("kid")
+    if kid is not None and not isinstance(kid, str):
+        raise TokenError("Malformed token header")
+    return kid
+
+
+class TokenEngine:
+    """Encode and decode JWTs with keys from a :class:`KeyRing`."""
+
+    def __init__(self, key_ring: KeyRing):
+        self.key_ring = key_ring
+
+    @property
+    def backend(self) -> JWTBackend:
+        return self.key_ring.backend
+
+    def encode(self, claims: dict) -> str:
+        """Sign ``claims`` with the active key and tag the token with its ``kid``."""
+        key = self.key_ring.active
+        return self.backend.encode(claims, key.signing_key, key.algorithm, headers={"kid": key.kid})
+
+    def decode(self, token: str) -> dict:
+        """Verify ``token`` with the key named by its ``kid`` and return its claims.
+
+        Tokens without a ``kid`` (issued before the key ring existed) are
+        verified with the active key.
+        """
+        key = self.key_ring.get(_unverified_kid(token))
+        if key is None:
+            raise TokenError("Unknown signing key")
+        return self.backend.decode(token, key.verification_key, key.algorithm)
+
+
+def build_token_engine(settings) -> TokenEngine:
+    """Build the application token engine from settings."""
+    backend_cls = BACKENDS.get(settings.JWT_BACKEND)
+    if backend_cls is None:
+        raise ValueError(f"Unknown JWT backend: {settings.JWT_BACKEND}")
+    key_ring = KeyRing(backend_cls())
+    algorithm = settings.ALGORITHM
+    if algorithm == "HS256":
+        key_ring.add(settings.JWT_KEY_ID, algorithm, settings.SECRET_KEY, active=True)
+    else:
+        if not (settings.JWT_PRIVATE_KEY_FILE and settings.JWT_PUBLIC_KEY_FILE):
+            raise ValueError(
+                f"ALGORITHM={algorithm} requires JWT_PRIVATE_KEY_FILE and JWT_PUBLIC_KEY_FILE"
+            )
+        key_ring.add(
+            settings.JWT_KEY_ID,
+            algorithm,
+            Path(settings.JWT_PUBLIC_KEY_FILE).read_bytes(),
+            Path(settings.JWT_PRIVATE_KEY_FILE).read_bytes(),
+            active=True,
+        )
+    # Retired public keys stay verifiable until their tokens expire
+    for kid, path in settings.JWT_VERIFICATION_KEY_FILES.items():
+        key_ring.add(kid, algorithm, Path(path).read_bytes())
+    return TokenEngine(key_ring)
@@ -0,0 +1,21 @@
+"""In-process metrics registry.
+
+Components register a callable that returns a snapshot of their counters;
+the ``/metrics`` endpoint collects every snapshot into a single document.
+"""
+
+from typing import Any, Callable, Dict
+
+MetricsProvider = Callable[[], Dict[str, Any]]
+
+_providers: Dict[str, MetricsProvider] = {}
+
+
+def register_metrics(name: str, provider: MetricsProvider) -> None:
+    """Register (or replace) a metrics provider under ``name``."""
+    _providers[name] = provider
+
+
+def collect_metrics() -> Dict[str, Dict[str, Any]]:
+    """Collect a snapshot from every registered provider."""
+    return {name: provider() for name, provider in _providers.items()}
@@ -0,0 +1,58 @@
+"""Authenticated principal snapshot and its in-process cache."""
+
+from dataclasses import dataclass
+
+from app.config.settings import settings
+from app.core.metrics import register_metrics
+from app.utils.cache import TTLCache
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Compact, immutable view of the authenticated user.
+
+    Only the fields needed for authorization are kept, so instances are safe
+    to share across requests and sessions, unlike a live ORM ``User``.
+    """
+
+    id: int
+    is_active: bool
+    is_superuser: bool
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        """Build a principal from a ``User`` model instance."""
+        return cls(id=user.id, is_active=bool(user.is_active), is_superuser=bool(user.is_superuser))
+
+
+principal_cache: TTLCache[Principal] = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+register_metrics("principal_cache", principal_cache.stats)
+
+# Bumped by every invalidation; a fill that started before one is discarded
+_invalidations = 0
+
+
+def principal_cache_version() -> int:
+    """Return a token to pass to ``cache_principal`` after reading the user row."""
+    return _invalidations
+
+
+def cache_principal(principal: Principal, version: int) -> None:
+    """Cache ``principal`` unless a user was invalidated since ``version`` was taken.
+
+    Without the check, a row read just before ``invalidate_principal`` ran
+    would be cached, and served, for the full TTL.
+    """
+    if version == _invalidations:
+        principal_cache.set(principal.id, principal)
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Drop the cached principal for ``user_id`` after the user changes."""
+    global _invalidations
+    _invalidations += 1
+    principal_cache.invalidate(user_id)
@@ -0,0 +1,125 @@
+"""In-memory access token revocation filter.
+
+Self-contained access tokens carry the user's ``token_version``. Bumping the
+version in the database revokes every token issued before the bump. This
+module keeps the latest known version per user in an exact map, fronted by a
+bloom filter so the common case (a user who never had tokens revoked) is
+answered by a couple of bit tests without touching the map.
+"""
+
+import hashlib
+import time
+from threading import Lock
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from app.config.settings import settings
+from app.core.metrics import register_metrics
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over integer keys."""
+
+    def __init__(self, size_bits: int, num_hashes: int):
+        if size_bits <= 0 or num_hashes <= 0:
+            raise ValueError("size_bits and num_hashes must be positive")
+        self.size_bits = size_bits
+        self.num_hashes = num_hashes
+        self._bits = bytearray((size_bits + 7) // 8)
+
+    def _positions(self, key: int) -> Iterable[int]:
+        # Kirsch-Mitzenmacher double hashing from a single 128-bit digest
+        digest = hashlib.blake2b(key.to_bytes(8, "big", signed=True), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.size_bits
+
+    def add(self, key: int) -> None:
+        """Add ``key`` to the filter."""
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: int) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key)
+        )
+
+
+class RevocationFilter:
+    """Deny structure answering "was this token version revoked?" without I/O.
+
+    Entries synced from the database are authoritative. Entries only known
+    locally (for example deleted users, whose rows are gone) are kept until
+    every token issued before them has expired.
+    """
+
+    def __init__(self, size_bits: int, num_hashes: int, retention_seconds: float):
+        self.size_bits = size_bits
+        self.num_hashes = num_hashes
+        self.retention_seconds = retention_seconds
+        self._lock = Lock()
+        self._versions: Dict[int, Tuple[int, float]] = {}
+        self._bloom = BloomFilter(size_bits, num_hashes)
+        self.checks = 0
+        self.bloom_negatives = 0
+        self.revoked_hits = 0
+        self.last_sync_at: Optional[float] = None
+
+    def revoke(self, user_id: int, min_version: int) -> None:
+        """Reject tokens for ``user_id`` whose version is below ``min_version``."""
+        with self._lock:
+            current = self._versions.get(user_id)
+            if current is None or current[0] < min_version:
+                self._versions[user_id] = (min_version, time.time())
+            self._bloom.add(user_id)
+
+    def is_revoked(self, user_id: int, token_version: int) -> bool:
+        """Return True if a token with ``token_version`` for ``user_id`` is revoked."""
+        self.checks += 1
+        if user_id not in self._bloom:
+            self.bloom_negatives += 1
+            return False
+        entry = self._versions.get(user_id)
+        revoked = entry is not None and token_version < entry[0]
+        if revoked:
+            self.revoked_hits += 1
+        return revoked
+
+    def replace(self, authoritative: Dict[int, int]) -> None:
+        """Rebuild from an authoritative ``{user_id: version}`` snapshot.
+
+        Local-only entries younger than the retention window are carried over
+        so that revocations not yet visible in the snapshot are not lost.
+        """
+        now = time.time()
+        with self._lock:
+            versions = {user_id: (version, now) for user_id, version in authoritative.items()}
+            for user_id, (version, revoked_at) in self._versions.items():
+                if now - revoked_at > self.retention_seconds:
+                    continue
+                if user_id not in versions or versions[user_id][0] < version:
+                    versions[user_id] = (version, revoked_at)
+            bloom = BloomFilter(self.size_bits, self.num_hashes)
+            for user_id in versions:
+                bloom.add(user_id)
+            self._versions = versions
+            self._bloom = bloom
+            self.last_sync_at = now
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters suitable for a metrics endpoint."""
+        return {
+            "entries": len(self._versions),
+            "checks": self.checks,
+            "bloom_negatives": self.bloom_negatives,
+            "revoked_hits": self.revoked_hits,
+            "last_sync_at": self.last_sync_at,
+        }
+
+
+revocation_filter = RevocationFilter(
+    size_bits=settings.TOKEN_REVOCATION_BLOOM_BITS,
+    num_hashes=settings.TOKEN_REVOCATION_BLOOM_HASHES,
+    retention_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+register_metrics("token_revocation", revocation_filter.stats)
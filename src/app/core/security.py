@@ -2,19 +2,40 @@
 
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from jose import JWTError, jwt
 from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.config.settings import settings
 from app.api.deps import get_db
+from app.core.executor import BoundedExecutor
+from app.core.jwt_engine import TokenError, build_token_engine
+from app.core.metrics import register_metrics
+from app.core.principal import (
+    Principal,
+    cache_principal,
+    principal_cache,
+    principal_cache_version,
+)
+from app.core.revocation import revocation_filter
 from app.models.user import User
+from app.services.loaders import user_loader
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/login")
+token_engine = build_token_engine(settings)
+
+# bcrypt is deliberately slow; run it in a dedicated pool so a login never
+# blocks the event loop for other in-flight requests
+password_executor = BoundedExecutor(
+    "password-hash",
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    kind=settings.PASSWORD_HASH_EXECUTOR,
+)
+register_metrics("password_executor", password_executor.stats)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -27,6 +48,16 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash in the password hashing pool."""
+    return await password_executor.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password in the password hashing pool."""
+    return await password_executor.run(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -35,24 +66,28 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    return token_engine.encode(to_encode)
 
 
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode a JWT access token."""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
+        return token_engine.decode(token)
+    except TokenError:
         return None
 
 
 async def get_current_user(
+    request: Request,
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db),
-) -> User:
-    """Get current authenticated user."""
+) -> Principal:
+    """Get current authenticated user.
+
+    Tokens with embedded claims are trusted as-is unless revoked. Otherwise
+    the user row is only read on a principal cache miss; the cached snapshot
+    is dropped whenever the user is updated or deleted.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -61,19 +96,41 @@ async def get_current_user(
     payload = decode_access_token(token)
     if payload is None:
         raise credentials_exception
-    user_id: int = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
-    result = await db.execute(select(User).filter(User.id == user_id))
-    user = result.scalar_one_or_none()
+    try:
+        user_id = int(payload["sub"])
+    except (KeyError, TypeError, ValueError):
+        raise credentials_exception from None
+    if settings.ACCESS_TOKEN_EMBED_CLAIMS and "token_version" in payload:
+        if revocation_filter.is_revoked(user_id, payload["token_version"]):
+            raise credentials_exception
+        principal = Principal(
+            id=user_id,
+            is_active=bool(payload.get("is_active", False)),
+            is_superuser=bool(payload.get("is_superuser", False)),
+        )
+        request.state.principal = principal
+        return principal
+    cached = principal_cache.get(user_id)
+    if cached is not None:
+        request.state.principal = cached
+        return cached
+    version = principal_cache_version()
+    if settings.BATCH_LOADING_ENABLED:
+        user = await user_loader.load(user_id)
+    else:
+        result = await db.execute(select(User).filter(User.id == user_id))
+        user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
-    return user
+    principal = Principal.from_user(user)
+    cache_principal(principal, version)
+    request.state.principal = principal
+    return principal
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     """Get current active user."""
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
@@ -81,8 +138,8 @@ async def get_current_active_user(
 
 
 async def get_current_active_superuser(
-    current_user: User = Depends(get_current_active_user),
-) -> User:
+    current_user: Principal = Depends(get_current_active_user),
+) -> Principal:
     """Get current active superuser."""
     if not current_user.is_superuser:
         raise HTTPException(
@@ -90,4 +147,3 @@ async def get_current_active_superuser(
             detail="The user doesn't have enough privileges",
         )
     return current_user
-
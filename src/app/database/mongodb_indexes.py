@@ -0,0 +1,128 @@
+"""Declarative MongoDB index registry.
+
+Models list their indexes next to their collection name::
+
+    class Config:
+        collection_name = "notes"
+        indexes = [IndexModel([...], name="...")]
+
+``ensure_indexes`` creates them idempotently and ``find_missing_indexes``
+reports drift. Building indexes on a large collection can take a while, so
+startup creation can be disabled (``MONGODB_CREATE_INDEXES=false``) in favour
+of running this module as a command::
+
+    python -m app.database.mongodb_indexes          # create missing indexes
+    python -m app.database.mongodb_indexes --check  # report drift, exit 1 if any
+"""
+
+import argparse
+import asyncio
+import logging
+from typing import Any, Dict, List, cast
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import TEXT, IndexModel
+from pymongo.errors import OperationFailure
+
+from app.config.settings import settings
+from app.database.mongodb import close_mongodb_connection, connect_to_mongodb, get_mongodb_database
+from app.models.mongodb_base import MongoDBBaseModel
+from app.models.mongodb_note import Note
+from app.models.mongodb_note_tag_count import NoteTagCount
+
+logger = logging.getLogger(__name__)
+
+# Models whose declared indexes are managed here
+INDEXED_MODELS: List[type[MongoDBBaseModel]] = [Note, NoteTagCount]
+
+
+def expected_indexes() -> Dict[str, List[IndexModel]]:
+    """Return the declared indexes keyed by collection name."""
+    # collection_name and indexes are extra keys outside pydantic's ConfigDict
+    configs = [cast(Dict[str, Any], model.model_config) for model in INDEXED_MODELS]
+    return {config["collection_name"]: config.get("indexes", []) for config in configs}
+
+
+def _reported_key(index: IndexModel) -> List[tuple]:
+    """Return the key of ``index`` as ``index_information`` reports it.
+
+    Text fields are stored as a single ``_fts``/``_ftsx`` pair.
+    """
+    key = []
+    for field, direction in index.document["key"].items():
+        if direction == TEXT:
+            if ("_fts", "text") not in key:
+                key += [("_fts", "text"), ("_ftsx", 1)]
+        else:
+            key.append((field, direction))
+    return key
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> Dict[str, List[str]]:
+    """Create every declared index; existing identical indexes are left alone."""
+    created = {}
+    for collection, indexes in expected_indexes().items():
+        if indexes:
+            created[collection] = await db[collection].create_indexes(indexes)
+    return created
+
+
+async def find_missing_indexes(db: AsyncIOMotorDatabase) -> Dict[str, List[str]]:
+    """Return the names of declared indexes that do not exist, by collection.
+
+    An index counts as present only if one with the same name and keys exists.
+    """
+    missing = {}
+    for collection, indexes in expected_indexes().items():
+        existing = await db[collection].index_information()
+        absent = [
+            index.document["name"]
+            for index in indexes
+            if existing.get(index.document["name"], {}).get("key") != _reported_key(index)
+        ]
+        if absent:
+            missing[collection] = absent
+    return missing
+
+
+async def check_index_drift(db: AsyncIOMotorDatabase) -> None:
+    """Log a warning for every collection missing declared indexes."""
+    for collection, names in (await find_missing_indexes(db)).items():
+        logger.warning(
+            f"MongoDB collection '{collection}' is missing indexes: {', '.join(names)}. "
+            "Run `python -m app.database.mongodb_indexes` to create them."
+        )
+
+
+async def bootstrap_indexes(db: AsyncIOMotorDatabase) -> None:
+    """Startup hook: create declared indexes if enabled, then report drift."""
+    if settings.MONGODB_CREATE_INDEXES:
+        try:
+            await ensure_indexes(db)
+        except OperationFailure as e:
+            # e.g. an index with the same name but different options exists
+            logger.error(f"Failed to create MongoDB indexes: {e}")
+    await check_index_drift(db)
+
+
+async def _main(check_only: bool) -> int:
+    await connect_to_mongodb()
+    try:
+        db = get_mongodb_database()
+        if not check_only:
+            for collection, names in (await ensure_indexes(db)).items():
+                print(f"{collection}: ensured {', '.join(names)}")
+        missing = await find_missing_indexes(db)
+        for collection, names in missing.items():
+            print(f"{collection}: missing {', '.join(names)}")
+        return 1 if missing else 0
+    finally:
+        await close_mongodb_connection()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create or verify MongoDB indexes.")
+    parser.add_argument(
+        "--check", action="store_true", help="only report missing indexes (exit 1 if any)"
+    )
+    raise SystemExit(asyncio.run(_main(parser.parse_args().check)))
@@ -0,0 +1,125 @@
+"""Connection pool instrumentation fed by SQLAlchemy pool events."""
+
+import bisect
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Checkout wait buckets in seconds (upper bounds, +Inf implied)
+DEFAULT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+# Seconds spent opening new connections during the current checkout
+_connect_seconds: ContextVar[Optional[float]] = ContextVar("pool_connect_seconds", default=None)
+
+
+class PoolMetrics:
+    """Checkout wait-time histogram and connection churn counters for one pool."""
+
+    def __init__(self, name: str, buckets: Sequence[float] = DEFAULT_WAIT_BUCKETS):
+        self.name = name
+        self.buckets = tuple(buckets)
+        self.wait_counts = [0] * (len(self.buckets) + 1)
+        self.wait_sum = 0.0
+        self.wait_max = 0.0
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.connects = 0
+        self.closes = 0
+        self.invalidations = 0
+        self._engine: AsyncEngine | None = None
+
+    def observe_wait(self, seconds: float) -> None:
+        """Record how long a checkout waited for a connection."""
+        self.wait_counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.wait_sum += seconds
+        self.wait_max = max(self.wait_max, seconds)
+
+    def pool_class(self) -> type[AsyncAdaptedQueuePool]:
+        """Return a pool class that reports checkout wait time to this instance.
+
+        Only the time spent waiting for a free connection is observed: opening
+        a new connection and the pre-ping are not part of it.
+        """
+        metrics = self
+
+        class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+            def _do_get(self):
+                if _connect_seconds.get() is not None:
+                    # QueuePool._do_get retries by calling itself
+                    return super()._do_get()
+                token = _connect_seconds.set(0.0)
+                started = time.perf_counter()
+                try:
+                    return super()._do_get()
+                except PoolTimeoutError:
+                    metrics.checkout_timeouts += 1
+                    raise
+                finally:
+                    connecting = _connect_seconds.get() or 0.0
+                    metrics.observe_wait(max(time.perf_counter() - started - connecting, 0.0))
+                    _connect_seconds.reset(token)
+
+            def _create_connection(self):
+                started = time.perf_counter()
+                try:
+                    return super()._create_connection()
+                finally:
+                    connecting = _connect_seconds.get()
+                    if connecting is not None:
+                        _connect_seconds.set(connecting + time.perf_counter() - started)
+
+        return InstrumentedAsyncAdaptedQueuePool
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        """Attach pool event listeners to ``engine``."""
+        self._engine = engine
+        target = engine.sync_engine
+
+        @event.listens_for(target, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            self.connects += 1
+
+        @event.listens_for(target, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            self.checkouts += 1
+
+        @event.listens_for(target, "close")
+        def on_close(dbapi_connection, connection_record):
+            self.closes += 1
+
+        @event.listens_for(target, "invalidate")
+        def on_invalidate(dbapi_connection, connection_record, exception):
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of pool state and counters."""
+        pool = self._engine.sync_engine.pool if self._engine is not None else None
+        # Per-bucket (non-cumulative) counts keyed by upper bound in seconds
+        histogram = {
+            str(bound): count
+            for bound, count in zip(self.buckets, self.wait_counts[:-1], strict=True)
+        }
+        histogram["+Inf"] = self.wait_counts[-1]
+        snapshot: Dict[str, Any] = {
+            "checkouts": self.checkouts,
+            "checkout_timeouts": self.checkout_timeouts,
+            "checkout_wait_seconds_sum": self.wait_sum,
+            "checkout_wait_seconds_max": self.wait_max,
+            "checkout_wait_histogram": histogram,
+            "connects": self.connects,
+            "closes": self.closes,
+            "invalidations": self.invalidations,
+        }
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            snapshot.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow_in_use=max(pool.overflow(), 0),
+            )
+        return snapshot
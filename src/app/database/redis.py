@@ -0,0 +1,39 @@
+"""Redis configuration (optional, enabled by REDIS_URL)."""
+
+from redis.asyncio import Redis
+from app.config.settings import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Global Redis client, only set when REDIS_URL is configured
+redis_client: Redis | None = None
+
+
+async def connect_to_redis():
+    """Connect to Redis if REDIS_URL is configured."""
+    global redis_client
+    if not settings.REDIS_URL:
+        return
+    try:
+        redis_client = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        # Test connection
+        await redis_client.ping()
+        logger.info("Connected to Redis successfully")
+    except Exception as e:
+        logger.error(f"Failed to connect to Redis: {e}")
+        raise
+
+
+async def close_redis_connection():
+    """Close Redis connection."""
+    global redis_client
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
+        logger.info("Redis connection closed")
+
+
+def get_redis_client() -> Redis | None:
+    """Get Redis client instance, or None when Redis is not configured."""
+    return redis_client
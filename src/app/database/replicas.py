@@ -0,0 +1,160 @@
+"""Read-replica routing with health checks and read-your-writes stickiness."""
+
+import asyncio
+import itertools
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaRouter:
+    """Round-robin over healthy read replicas.
+
+    Replicas are marked unhealthy when a connection error is raised on them
+    and re-admitted by :meth:`check_health`. Users who wrote recently are
+    pinned to the primary for ``sticky_seconds`` so they read their own writes.
+    """
+
+    def __init__(
+        self,
+        replicas: List[AsyncEngine],
+        sticky_seconds: float,
+        health_check_timeout: float = 2.0,
+        max_tracked_writers: int = 100_000,
+    ):
+        self.replicas = replicas
+        self.health_check_timeout = health_check_timeout
+        self._healthy: Dict[int, bool] = {id(engine): True for engine in replicas}
+        self._cycle = itertools.cycle(replicas) if replicas else None
+        self._recent_writers: TTLCache[bool] = TTLCache(
+            maxsize=max_tracked_writers, ttl=sticky_seconds
+        )
+        self.routed_to_replica = 0
+        self.routed_to_primary = 0
+        for engine in replicas:
+            self._watch_errors(engine)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def _watch_errors(self, engine: AsyncEngine) -> None:
+        @event.listens_for(engine.sync_engine, "handle_error")
+        def on_error(context):
+            if context.is_disconnect or context.connection is None:
+                self.mark_unhealthy(engine)
+
+    def mark_unhealthy(self, engine: AsyncEngine) -> None:
+        if self._healthy.get(id(engine)):
+            logger.warning(f"Read replica {engine.url.host} marked unhealthy")
+        self._healthy[id(engine)] = False
+
+    def choose(self) -> Optional[AsyncEngine]:
+        """Return the next healthy replica, or None if none is available."""
+        if self._cycle is None:
+            return None
+        for _ in range(len(self.replicas)):
+            engine = next(self._cycle)
+            if self._healthy[id(engine)]:
+                return engine
+        return None
+
+    def record_write(self, user_id: Any) -> None:
+        """Pin ``user_id`` to the primary for the stickiness window."""
+        if user_id is not None:
+            self._recent_writers.set(user_id, True)
+
+    def wrote_recently(self, user_id: Any) -> bool:
+        return user_id is not None and self._recent_writers.get(user_id) is not None
+
+    async def check_health(self) -> None:
+        """Ping every replica and update its health flag."""
+
+        async def ping(engine: AsyncEngine) -> None:
+            try:
+                async with engine.connect() as conn:
+                    await asyncio.wait_for(
+                        conn.execute(text("SELECT 1")), timeout=self.health_check_timeout
+                    )
+            except Exception as e:
+                self.mark_unhealthy(engine)
+                logger.warning(f"Read replica {engine.url.host} health check failed: {e}")
+                return
+            if not self._healthy[id(engine)]:
+                logger.info(f"Read replica {engine.url.host} is healthy again")
+            self._healthy[id(engine)] = True
+
+        await asyncio.gather(*(ping(engine) for engine in self.replicas))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters suitable for a metrics endpoint."""
+        return {
+            "replicas": len(self.replicas),
+            "healthy": sum(self._healthy.values()),
+            "routed_to_replica": self.routed_to_replica,
+            "routed_to_primary": self.routed_to_primary,
+            "sticky_writers": len(self._recent_writers),
+        }
+
+
+def _request_user_id(session: Session) -> Any:
+    request = session.info.get("request")
+    principal = getattr(request.state, "principal", None) if request is not None else None
+    return principal.id if principal is not None else None
+
+
+def make_routing_session_class(primary: AsyncEngine, router: ReplicaRouter) -> type[Session]:
+    """Build a sync ``Session`` class that sends reads to a replica.
+
+    The replica is chosen on first use and kept for the rest of the session.
+    Flushes, and sessions of users who wrote recently, use the primary.
+    """
+
+    class RoutingSession(Session):
+        def get_bind(self, mapper=None, clause=None, **kw) -> Engine:
+            if self._flushing:
+                return primary.sync_engine
+            bind = self.info.get("routed_bind")
+            if bind is None:
+                replica = None
+                if not router.wrote_recently(_request_user_id(self)):
+                    replica = router.choose()
+                if replica is None:
+                    router.routed_to_primary += 1
+                    bind = primary.sync_engine
+                else:
+                    router.routed_to_replica += 1
+                    bind = replica.sync_engine
+                self.info["routed_bind"] = bind
+            return bind
+
+    return RoutingSession
+
+
+def track_writes(router: ReplicaRouter) -> None:
+    """Record the request user as a recent writer whenever a session writes.
+
+    Covers both ORM unit-of-work flushes and INSERT/UPDATE/DELETE statements
+    executed directly through the session.
+    """
+
+    @event.listens_for(Session, "after_flush")
+    def on_flush(session, flush_context):
+        router.record_write(_request_user_id(session))
+
+    @event.listens_for(Session, "do_orm_execute")
+    def on_execute(orm_execute_state):
+        if (
+            orm_execute_state.is_insert
+            or orm_execute_state.is_update
+            or orm_execute_state.is_delete
+        ):
+            router.record_write(_request_user_id(orm_execute_state.session))
@@ -0,0 +1,64 @@
+"""Per-request SQLAlchemy session."""
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# Requests that never write: their sessions run in READ ONLY transactions
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+
+
+class RequestSession(AsyncSession):
+    """``AsyncSession`` that holds a pooled connection only while it is needed.
+
+    Like any session it checks out a connection lazily, on the first
+    statement. On top of that:
+
+    * a read-only session (``info["read_only"]``) ends its transaction right
+      after every ``execute`` - results are already buffered - so the
+      connection goes back to the pool before the response is serialized;
+    * :attr:`has_writes` tells the request dependency whether a final
+      ``commit()`` is needed at all.
+
+    Sessions are created with ``expire_on_commit=False``, so objects loaded
+    before a release stay usable afterwards.
+    """
+
+    @property
+    def read_only(self) -> bool:
+        return bool(self.info.get("read_only", False))
+
+    @property
+    def has_writes(self) -> bool:
+        """True if the session holds changes that still need a commit."""
+        return bool(self.new or self.dirty or self.deleted) or self.info.get(
+            "uncommitted_writes", False
+        )
+
+    async def execute(self, statement, *args, **kwargs):
+        result = await super().execute(statement, *args, **kwargs)
+        if self.read_only:
+            await self.release()
+        return result
+
+    async def release(self) -> None:
+        """End the current transaction and return its connection to the pool."""
+        if self.in_transaction():
+            await self.commit()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement_writes(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["uncommitted_writes"] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush_writes(session, flush_context):
+    session.info["uncommitted_writes"] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _reset_writes(session):
+    session.info["uncommitted_writes"] = False
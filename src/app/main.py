@@ -1,9 +1,9 @@
 """FastAPI application factory."""
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -13,9 +13,29 @@ from app.api.v1.router import api_router
 from app.middleware.logging import LoggingMiddleware
 from app.middleware.cors import setup_cors
 from app.workers.scheduler import start_scheduler, shutdown_scheduler
-from app.workers.tasks import setup_scheduled_jobs
-from app.database.mongodb import connect_to_mongodb, close_mongodb_connection
-from app.core.exceptions import NotFoundError, ConflictError, UnauthorizedError, ForbiddenError
+from app.workers.tasks import (
+    bootstrap_note_tag_counts,
+    setup_scheduled_jobs,
+    sync_token_revocations_job,
+)
+from app.database.mongodb import (
+    connect_to_mongodb,
+    close_mongodb_connection,
+    get_mongodb_database,
+)
+from app.database.mongodb_indexes import bootstrap_indexes
+from app.database.redis import connect_to_redis, close_redis_connection
+from app.core.exceptions import (
+    NotFoundError,
+    ConflictError,
+    UnauthorizedError,
+    ForbiddenError,
+    TooManyRequestsError,
+    ServiceUnavailableError,
+)
+from app.core.metrics import collect_metrics
+from app.core.security import get_current_active_superuser, password_executor
+from app.utils.logging import shutdown_logging
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,11 +48,19 @@ async def lifespan(app: FastAPI):
     start_scheduler()
     setup_scheduled_jobs()
     await connect_to_mongodb()
+    await bootstrap_indexes(get_mongodb_database())
+    await bootstrap_note_tag_counts()
+    await connect_to_redis()
+    if settings.ACCESS_TOKEN_EMBED_CLAIMS:
+        await sync_token_revocations_job()
     yield
     # Shutdown
     await engine.dispose()
+    password_executor.shutdown()
     shutdown_scheduler()
     await close_mongodb_connection()
+    await close_redis_connection()
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
@@ -42,13 +70,18 @@ def create_app() -> FastAPI:
         version=settings.APP_VERSION,
         debug=settings.DEBUG,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Setup CORS
     setup_cors(app)
 
     # Add middleware
-    app.add_middleware(LoggingMiddleware)
+    app.add_middleware(
+        LoggingMiddleware,
+        sample_rate=settings.ACCESS_LOG_SAMPLE_RATE,
+        slow_threshold_ms=settings.ACCESS_LOG_SLOW_MS,
+    )
 
     # Global exception handlers
     @app.exception_handler(StarletteHTTPException)
@@ -100,6 +133,26 @@ def create_app() -> FastAPI:
             content={"detail": exc.detail},
         )
 
+    @app.exception_handler(TooManyRequestsError)
+    async def too_many_requests_exception_handler(request: Request, exc: TooManyRequestsError):
+        """Handle rate limit errors."""
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={"detail": exc.detail},
+            headers=exc.headers,
+        )
+
+    @app.exception_handler(ServiceUnavailableError)
+    async def service_unavailable_exception_handler(
+        request: Request, exc: ServiceUnavailableError
+    ):
+        """Handle service unavailable errors."""
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={"detail": exc.detail},
+            headers=exc.headers,
+        )
+
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle general exceptions."""
@@ -125,6 +178,11 @@ def create_app() -> FastAPI:
         """Health check endpoint."""
         return {"status": "healthy"}
 
+    @app.get("/metrics", dependencies=[Depends(get_current_active_superuser)])
+    async def metrics():
+        """In-process metrics endpoint (caches, pools, admission counters); superusers only."""
+        return collect_metrics()
+
     return app
 
 
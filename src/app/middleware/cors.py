@@ -4,6 +4,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config.settings import settings
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 
 def setup_cors(app: FastAPI) -> None:
@@ -27,7 +28,7 @@ def setup_cors(app: FastAPI) -> None:
         allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
         allow_methods=allow_methods,
         allow_headers=allow_headers,
-        expose_headers=["X-Process-Time", "X-Request-ID"],
+        expose_headers=["X-Process-Time", "X-Request-ID", NEXT_CURSOR_HEADER],
         max_age=3600,
     )
 
@@ -1,26 +1,118 @@
-"""Logging middleware."""
+"""Access logging middleware."""
 
-import time
 import logging
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+import random
+import time
+import uuid
+from typing import Callable, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
+REQUEST_ID_HEADER = b"x-request-id"
+
+
+class LoggingMiddleware:
+    """Emit one structured access record per HTTP request.
+
+    A raw ASGI middleware: the response is passed through message by message,
+    so streaming responses are not buffered. Each response gets
+    ``X-Request-ID`` (the client's, or a generated one) and ``X-Process-Time``
+    (seconds until the headers were sent).
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging HTTP requests."""
+    Server errors and requests slower than ``slow_threshold_ms`` are always
+    logged; the rest are logged with probability ``sample_rate``.
+    """
 
-    async def dispatch(self, request: Request, call_next):
-        """Log request and response."""
-        start_time = time.time()
-        logger.info(f"Request: {request.method} {request.url}")
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        logger.info(
-            f"Response: {response.status_code} - "
-            f"Process time: {process_time:.4f}s"
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 1.0,
+        slow_threshold_ms: float = 1000.0,
+        timer: Callable[[], float] = time.perf_counter,
+        sampler: Callable[[], float] = random.random,
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_threshold_ms = slow_threshold_ms
+        self._timer = timer
+        self._sampler = sampler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = self._timer()
+        request_id = _request_id(scope) or uuid.uuid4().hex
+        scope.setdefault("state", {})["request_id"] = request_id
+        status_code = 500
+        bytes_sent = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, bytes_sent
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-process-time", str(self._timer() - started).encode()))
+                headers.append((REQUEST_ID_HEADER, request_id.encode()))
+                message = {**message, "headers": headers}
+            elif message["type"] == "http.response.body":
+                bytes_sent += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = (self._timer() - started) * 1000
+            self._log(scope, request_id, status_code, bytes_sent, duration_ms)
+
+    def _log(
+        self,
+        scope: Scope,
+        request_id: str,
+        status_code: int,
+        bytes_sent: int,
+        duration_ms: float,
+    ) -> None:
+        slow = duration_ms >= self.slow_threshold_ms
+        if status_code >= 500:
+            level = logging.ERROR
+        elif slow:
+            level = logging.WARNING
+        elif self.sample_rate >= 1 or self._sampler() < self.sample_rate:
+            level = logging.INFO
+        else:
+            return
+        if not logger.isEnabledFor(level):
+            return
+        route = scope.get("route")
+        # The route template, not the raw path, so records group per endpoint
+        route_path = getattr(route, "path", None)
+        logger.log(
+            level,
+            "%s %s %d %.1fms",
+            scope["method"],
+            route_path or "<unmatched>",
+            status_code,
+            duration_ms,
+            extra={
+                "request_id": request_id,
+                "access": {
+                    "method": scope["method"],
+                    "route": route_path,
+                    "status": status_code,
+                    "duration_ms": round(duration_ms, 3),
+                    "bytes_sent": bytes_sent,
+                    "slow": slow,
+                },
+            },
         )
-        response.headers["X-Process-Time"] = str(process_time)
-        return response
 
+
+def _request_id(scope: Scope) -> Optional[str]:
+    for name, value in scope["headers"]:
+        if name == REQUEST_ID_HEADER:
+            return value.decode("latin-1")[:128] or None
+    return None
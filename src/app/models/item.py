@@ -1,6 +1,6 @@
 """Item model."""
 
-from sqlalchemy import Column, Integer, String, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, Text
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -10,6 +10,8 @@ class Item(BaseModel):
     """Item model."""
 
     __tablename__ = "items"
+    # Serves the per-owner keyset pagination (WHERE owner_id = ? AND id > ? ORDER BY id)
+    __table_args__ = (Index("ix_items_owner_id_id", "owner_id", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True, nullable=False)
@@ -3,6 +3,7 @@
 from typing import Optional
 from app.models.mongodb_base import MongoDBBaseModel, PyObjectId
 from pydantic import Field
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
 
 
 class Note(MongoDBBaseModel):
@@ -16,4 +17,28 @@ class Note(MongoDBBaseModel):
 
     class Config:
         collection_name = "notes"
+        # Ensured by app.database.mongodb_indexes; lookups by _id + user_id use _id_
+        indexes = [
+            # Note list, newest first (keyset on created_at, _id)
+            IndexModel(
+                [("user_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+                name="user_created_at",
+            ),
+            # Note list filtered by archived state
+            IndexModel(
+                [
+                    ("user_id", ASCENDING),
+                    ("is_archived", ASCENDING),
+                    ("created_at", DESCENDING),
+                    ("_id", DESCENDING),
+                ],
+                name="user_archived_created_at",
+            ),
+            # Note search ($text must be paired with an equality on user_id)
+            IndexModel(
+                [("user_id", ASCENDING), ("title", TEXT), ("content", TEXT)],
+                weights={"title": 10, "content": 1},
+                name="user_text",
+            ),
+        ]
 
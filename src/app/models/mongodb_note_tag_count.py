@@ -0,0 +1,19 @@
+"""MongoDB note tag counter model."""
+
+from pymongo import ASCENDING, IndexModel
+
+from app.models.mongodb_base import MongoDBBaseModel, PyObjectId
+
+
+class NoteTagCount(MongoDBBaseModel):
+    """Number of a user's notes carrying a tag, maintained on every note write."""
+
+    user_id: PyObjectId
+    tag: str
+    count: int = 0
+
+    class Config:
+        collection_name = "note_tag_counts"
+        indexes = [
+            IndexModel([("user_id", ASCENDING), ("tag", ASCENDING)], unique=True, name="user_tag"),
+        ]
@@ -18,6 +18,8 @@ class User(BaseModel):
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
     full_name = Column(String, nullable=True)
+    # Bumped to revoke every access token issued before the change
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
 
     # Relationships
     items = relationship("Item", back_populates="owner", cascade="all, delete-orphan")
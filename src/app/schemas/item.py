@@ -1,8 +1,10 @@
 """Item schemas."""
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+from app.utils.serialization import ResponseSerializer
 
 
 class ItemBase(BaseModel):
@@ -42,3 +44,45 @@ class Item(ItemInDB):
 
     pass
 
+
+# Response serializer compiled once at import
+item_serializer = ResponseSerializer(Item)
+
+
+class ItemBulkCreate(BaseModel):
+    """Bulk item creation schema."""
+
+    items: List[ItemCreate] = Field(min_length=1)
+
+
+class ItemBulkUpdateEntry(ItemUpdate):
+    """One entry of a bulk item update."""
+
+    id: int
+
+
+class ItemBulkUpdate(BaseModel):
+    """Bulk item update schema."""
+
+    items: List[ItemBulkUpdateEntry] = Field(min_length=1)
+
+
+class ItemBulkDelete(BaseModel):
+    """Bulk item deletion schema."""
+
+    ids: List[int] = Field(min_length=1)
+
+
+class ItemBulkResult(BaseModel):
+    """Outcome for one item of a bulk operation."""
+
+    id: int
+    status: int
+    item: Optional[Item] = None
+    detail: Optional[str] = None
+
+
+class ItemBulkResponse(BaseModel):
+    """Bulk operation response schema, one result per requested item in order."""
+
+    results: List[ItemBulkResult]
@@ -4,6 +4,8 @@ from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict
 
+from app.utils.serialization import ResponseSerializer
+
 
 class NoteBase(BaseModel):
     """Base note schema."""
@@ -45,3 +47,30 @@ class Note(NoteInDB):
 
     pass
 
+
+# Response serializer compiled once at import
+note_serializer = ResponseSerializer(Note)
+
+
+class NoteImportError(BaseModel):
+    """A rejected line of a note import."""
+
+    line: int
+    error: str
+
+
+class NoteImportSummary(BaseModel):
+    """Note import result schema."""
+
+    received: int = 0
+    inserted: int = 0
+    failed: int = 0
+    # Only the first NOTES_IMPORT_MAX_ERRORS errors are listed
+    errors: list[NoteImportError] = Field(default_factory=list)
+
+
+class TagCount(BaseModel):
+    """Number of the user's notes carrying a tag."""
+
+    tag: str
+    count: int
@@ -4,6 +4,8 @@ from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, EmailStr, field_validator, Field
 
+from app.utils.serialization import ResponseSerializer
+
 
 class UserBase(BaseModel):
     """Base user schema."""
@@ -62,6 +64,10 @@ class User(UserInDB):
     pass
 
 
+# Response serializer compiled once at import
+user_serializer = ResponseSerializer(User)
+
+
 class UserLogin(BaseModel):
     """User login schema."""
 
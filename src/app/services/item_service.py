@@ -1,12 +1,77 @@
 """Item service."""
 
-from typing import Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Row, delete, insert, select, update
 from fastapi import HTTPException, status
 
+from app.config.settings import settings
 from app.models.item import Item
-from app.schemas.item import ItemCreate, ItemUpdate
+from app.schemas.item import (
+    Item as ItemSchema,
+    ItemBulkResult,
+    ItemBulkUpdateEntry,
+    ItemCreate,
+    ItemUpdate,
+)
+from app.services.loaders import item_loader
+from app.utils.pagination import Page, clamp_limit, decode_cursor, paginate
+
+T = TypeVar("T")
+
+# Columns selected by ItemService.get_items: exactly the fields of the response schema
+LIST_COLUMNS = tuple(ItemSchema.model_fields)
+# Columns written by ItemService.export_items, in output order
+EXPORT_COLUMNS = ("id", "title", "description", "owner_id", "created_at", "updated_at")
+
+
+def _columns(fields: Optional[Sequence[str]], *required: str) -> List[Any]:
+    """Item columns for ``fields`` (default LIST_COLUMNS) plus ``required`` ones."""
+    names = list(fields or LIST_COLUMNS)
+    names += [name for name in required if name not in names]
+    return [getattr(Item, name) for name in names]
+
+
+def _chunks(values: Sequence[T], size: int) -> List[Sequence[T]]:
+    return [values[i : i + size] for i in range(0, len(values), size)]
+
+
+def _check_bulk_size(count: int) -> None:
+    if count > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {settings.BULK_MAX_ITEMS} items can be processed per request",
+        )
+
+
+def _not_found(item_id: int) -> ItemBulkResult:
+    return ItemBulkResult(
+        id=item_id,
+        status=status.HTTP_404_NOT_FOUND,
+        detail=f"Item with id {item_id} not found",
+    )
+
+
+def _forbidden(item_id: int) -> ItemBulkResult:
+    return ItemBulkResult(
+        id=item_id, status=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+    )
+
+
+def _succeeded(item: Item, status_code: int) -> ItemBulkResult:
+    schema = ItemSchema.model_validate(item)
+    return ItemBulkResult(id=schema.id, status=status_code, item=schema)
 
 
 class ItemService:
@@ -24,48 +89,238 @@ class ItemService:
             )
         return item
 
+    @staticmethod
+    async def get_item_fields(db: AsyncSession, item_id: int, fields: Sequence[str]) -> Row:
+        """Get only ``fields`` (plus owner_id) of an item by ID, as a row."""
+        result = await db.execute(select(*_columns(fields, "owner_id")).filter(Item.id == item_id))
+        item = result.one_or_none()
+        if not item:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Item with id {item_id} not found",
+            )
+        return item
+
+    @staticmethod
+    async def load_item(db: AsyncSession, item_id: int) -> Item:
+        """Get an item by ID for read-only use, batched with concurrent lookups.
+
+        Falls back to ``get_item`` when batch loading is disabled. The returned
+        instance may be detached, so do not modify it.
+        """
+        if not settings.BATCH_LOADING_ENABLED:
+            return await ItemService.get_item(db, item_id)
+        item = await item_loader.load(item_id)
+        if not item:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Item with id {item_id} not found",
+            )
+        return item
+
     @staticmethod
     async def get_items(
-        db: AsyncSession, skip: int = 0, limit: int = 100, owner_id: Optional[int] = None
-    ) -> list[Item]:
-        """Get multiple items."""
-        query = select(Item)
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        owner_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[Row]:
+        """Get a page of items in id order, starting after ``cursor``.
+
+        Items are read-only rows of ``fields`` (default LIST_COLUMNS, id is
+        always added for the cursor) rather than ORM entities, so nothing is
+        added to the session's identity map.
+        """
+        limit = clamp_limit(limit)
+        query = select(*_columns(fields, "id"))
         if owner_id:
             query = query.filter(Item.owner_id == owner_id)
-        query = query.offset(skip).limit(limit)
-        result = await db.execute(query)
-        return list(result.scalars().all())
+        if cursor:
+            (last_id,) = decode_cursor(cursor, int)
+            query = query.filter(Item.id > last_id)
+        query = query.order_by(Item.id)
+        if skip:
+            query = query.offset(skip)
+        result = await db.execute(query.limit(limit + 1))
+        return paginate(result.all(), limit, lambda item: (item.id,))
+
+    @staticmethod
+    async def export_items(
+        db: AsyncSession, owner_id: int, batch_size: Optional[int] = None
+    ) -> AsyncIterator[Sequence[Sequence[Any]]]:
+        """Yield all of an owner's items in id order, ``batch_size`` rows at a time.
+
+        Rows are plain column tuples read through a server-side cursor, so
+        memory use is bounded by one batch whatever the number of items.
+        """
+        batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+        query = (
+            select(*(getattr(Item, column) for column in EXPORT_COLUMNS))
+            .filter(Item.owner_id == owner_id)
+            .order_by(Item.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await db.stream(query)
+        async for rows in result.partitions():
+            yield rows
 
     @staticmethod
     async def create_item(db: AsyncSession, item_create: ItemCreate, owner_id: int) -> Item:
         """Create a new item."""
-        db_item = Item(**item_create.model_dump(), owner_id=owner_id)
-        db.add(db_item)
+        result = await db.execute(
+            insert(Item).values(**item_create.model_dump(), owner_id=owner_id).returning(Item)
+        )
+        item = result.scalar_one()
         await db.commit()
-        await db.refresh(db_item)
-        return db_item
+        return item
+
+    @staticmethod
+    async def _raise_not_found_or_forbidden(db: AsyncSession, item_id: int) -> NoReturn:
+        """Explain why an ownership-scoped statement matched no row."""
+        result = await db.execute(select(Item.id).filter(Item.id == item_id))
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Item with id {item_id} not found",
+            )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions",
+        )
 
     @staticmethod
-    async def update_item(db: AsyncSession, item_id: int, item_update: ItemUpdate) -> Item:
-        """Update an item."""
-        item = await ItemService.get_item(db, item_id)
+    async def update_item(
+        db: AsyncSession, item_id: int, item_update: ItemUpdate, owner_id: Optional[int] = None
+    ) -> Item:
+        """Update an item, only if it belongs to ``owner_id`` when given."""
         update_data = item_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(item, field, value)
+        if not update_data:
+            item = await ItemService.get_item(db, item_id)
+            if owner_id is not None and item.owner_id != owner_id:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Not enough permissions",
+                )
+            return item
+        query = update(Item).where(Item.id == item_id)
+        if owner_id is not None:
+            query = query.where(Item.owner_id == owner_id)
+        result = await db.execute(query.values(**update_data).returning(Item))
+        updated = result.scalar_one_or_none()
+        if updated is None:
+            await ItemService._raise_not_found_or_forbidden(db, item_id)
         await db.commit()
-        await db.refresh(item)
-        return item
+        return updated
 
     @staticmethod
-    async def delete_item(db: AsyncSession, item_id: int) -> None:
-        """Delete an item."""
-        item = await ItemService.get_item(db, item_id)
-        await db.delete(item)
+    async def delete_item(db: AsyncSession, item_id: int, owner_id: Optional[int] = None) -> None:
+        """Delete an item, only if it belongs to ``owner_id`` when given."""
+        query = delete(Item).where(Item.id == item_id)
+        if owner_id is not None:
+            query = query.where(Item.owner_id == owner_id)
+        result = await db.execute(query.returning(Item.id))
+        if result.scalar_one_or_none() is None:
+            await ItemService._raise_not_found_or_forbidden(db, item_id)
         await db.commit()
 
     @staticmethod
-    async def check_ownership(db: AsyncSession, item_id: int, user_id: int) -> bool:
-        """Check if user owns the item."""
-        item = await ItemService.get_item(db, item_id)
-        return item.owner_id == user_id
+    async def create_items(
+        db: AsyncSession,
+        items: List[ItemCreate],
+        owner_id: int,
+        chunk_size: Optional[int] = None,
+    ) -> List[ItemBulkResult]:
+        """Create many items with one multi-row INSERT ... RETURNING per chunk."""
+        _check_bulk_size(len(items))
+        results: List[ItemBulkResult] = []
+        for chunk in _chunks(items, chunk_size or settings.BULK_CHUNK_SIZE):
+            created = await db.scalars(
+                insert(Item).returning(Item, sort_by_parameter_order=True),
+                [{**item.model_dump(), "owner_id": owner_id} for item in chunk],
+            )
+            results.extend(_succeeded(item, status.HTTP_201_CREATED) for item in created)
+        await db.commit()
+        return results
 
+    @staticmethod
+    async def update_items(
+        db: AsyncSession,
+        updates: List[ItemBulkUpdateEntry],
+        owner_id: int,
+        chunk_size: Optional[int] = None,
+    ) -> List[ItemBulkResult]:
+        """Update many of ``owner_id``'s items.
+
+        Each chunk is loaded with one ``WHERE id IN (...)`` query and written
+        back in a single flush, which batches rows changing the same columns
+        into one executemany UPDATE. Missing and foreign items are reported
+        per entry and left untouched.
+        """
+        _check_bulk_size(len(updates))
+        results: List[ItemBulkResult] = []
+        for chunk in _chunks(updates, chunk_size or settings.BULK_CHUNK_SIZE):
+            loaded = await db.execute(
+                select(Item).filter(Item.id.in_([entry.id for entry in chunk]))
+            )
+            found: Dict[int, Item] = {cast(int, item.id): item for item in loaded.scalars()}
+            outcomes: List[Union[ItemBulkResult, Item]] = []
+            for entry in chunk:
+                item = found.get(entry.id)
+                if item is None:
+                    outcomes.append(_not_found(entry.id))
+                elif item.owner_id != owner_id:
+                    outcomes.append(_forbidden(entry.id))
+                else:
+                    changes = entry.model_dump(exclude_unset=True, exclude={"id"})
+                    for field, value in changes.items():
+                        setattr(item, field, value)
+                    outcomes.append(item)
+            await db.flush()
+            results.extend(
+                (
+                    outcome
+                    if isinstance(outcome, ItemBulkResult)
+                    else _succeeded(outcome, status.HTTP_200_OK)
+                )
+                for outcome in outcomes
+            )
+        await db.commit()
+        return results
+
+    @staticmethod
+    async def delete_items(
+        db: AsyncSession,
+        item_ids: List[int],
+        owner_id: int,
+        chunk_size: Optional[int] = None,
+    ) -> List[ItemBulkResult]:
+        """Delete many of ``owner_id``'s items with one DELETE per chunk.
+
+        Only ids the owner-scoped DELETE did not match are looked up again,
+        to tell missing items from foreign ones.
+        """
+        _check_bulk_size(len(item_ids))
+        chunk_size = chunk_size or settings.BULK_CHUNK_SIZE
+        unique_ids = list(dict.fromkeys(item_ids))
+        deleted: set[int] = set()
+        for chunk in _chunks(unique_ids, chunk_size):
+            result = await db.execute(
+                delete(Item).where(Item.id.in_(chunk), Item.owner_id == owner_id).returning(Item.id)
+            )
+            deleted.update(result.scalars())
+        existing: set[int] = set()
+        for chunk in _chunks([i for i in unique_ids if i not in deleted], chunk_size):
+            result = await db.execute(select(Item.id).filter(Item.id.in_(chunk)))
+            existing.update(result.scalars())
+        await db.commit()
+        outcomes: Dict[int, ItemBulkResult] = {}
+        for item_id in unique_ids:
+            if item_id in deleted:
+                outcomes[item_id] = ItemBulkResult(id=item_id, status=status.HTTP_204_NO_CONTENT)
+            elif item_id in existing:
+                outcomes[item_id] = _forbidden(item_id)
+            else:
+                outcomes[item_id] = _not_found(item_id)
+        return [outcomes[item_id] for item_id in item_ids]
@@ -0,0 +1,45 @@
+"""Batched point lookups shared across concurrent requests.
+
+Each loader resolves many ``WHERE id = ?`` lookups with one
+``WHERE id IN (...)`` query on its own short-lived session. Returned
+instances are detached from any request session, so they are only suitable
+for read-only use (authorization checks and responses).
+"""
+
+from typing import Dict, List
+
+from sqlalchemy import select
+
+from app.config.database import AsyncSessionLocal
+from app.config.settings import settings
+from app.core.metrics import register_metrics
+from app.models.item import Item
+from app.models.user import User
+from app.utils.dataloader import BatchLoader
+
+
+async def _fetch_users(user_ids: List[int]) -> Dict[int, User]:
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(select(User).filter(User.id.in_(user_ids)))
+        return {user.id: user for user in result.scalars()}
+
+
+async def _fetch_items(item_ids: List[int]) -> Dict[int, Item]:
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(select(Item).filter(Item.id.in_(item_ids)))
+        return {item.id: item for item in result.scalars()}
+
+
+user_loader: BatchLoader[int, User] = BatchLoader(
+    _fetch_users,
+    window=settings.BATCH_LOADING_WINDOW_MS / 1000,
+    max_batch_size=settings.BATCH_LOADING_MAX_SIZE,
+)
+item_loader: BatchLoader[int, Item] = BatchLoader(
+    _fetch_items,
+    window=settings.BATCH_LOADING_WINDOW_MS / 1000,
+    max_batch_size=settings.BATCH_LOADING_MAX_SIZE,
+)
+
+register_metrics("user_loader", user_loader.stats)
+register_metrics("item_loader", item_loader.stats)
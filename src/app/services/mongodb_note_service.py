@@ -1,32 +1,88 @@
 """MongoDB Note service."""
 
-from typing import Optional, List
+import re
+from collections import Counter
+from typing import Any, AsyncIterator, Dict, Iterable, List, Literal, Optional, Sequence
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from fastapi import HTTPException, status
+from pydantic import ValidationError
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 
 from app.models.mongodb_note import Note
-from app.schemas.mongodb_note import NoteCreate, NoteUpdate
+from app.config.settings import settings
+from app.schemas.mongodb_note import (
+    Note as NoteSchema,
+    NoteCreate,
+    NoteImportError,
+    NoteImportSummary,
+    NoteUpdate,
+)
+from app.services.note_search_cache import note_search_cache
+from app.utils.ndjson import iter_lines
+from app.utils.pagination import Page, clamp_limit, decode_cursor, paginate
 from datetime import datetime
 
+# Default note order; the keyset cursor encodes (created_at, _id)
+NEWEST_FIRST = [("created_at", -1), ("_id", -1)]
+
+
+def _tag_delta(old_tags: Iterable[str], new_tags: Iterable[str]) -> Dict[str, int]:
+    """Per-tag counter changes for a note whose tags go from old to new."""
+    old, new = set(old_tags), set(new_tags)
+    delta = {tag: 1 for tag in new - old}
+    delta.update((tag, -1) for tag in old - new)
+    return delta
+
+
+def _projection(fields: Optional[Sequence[str]], *required: str) -> Optional[Dict[str, int]]:
+    """Mongo projection of the note schema ``fields`` plus ``required`` keys (None: all)."""
+    if fields is None:
+        return None
+    keys = [NoteSchema.model_fields[name].alias or name for name in fields]
+    return {key: 1 for key in (*keys, *required)}
+
+
+def _stringify_ids(note: dict) -> dict:
+    note["_id"] = str(note["_id"])
+    if "user_id" in note:
+        note["user_id"] = str(note["user_id"])
+    return note
+
+
+def _newest_first_after(cursor: str) -> dict:
+    """Filter for notes after ``cursor`` in NEWEST_FIRST order."""
+    last_created_at, last_id = decode_cursor(cursor, datetime.fromisoformat, ObjectId)
+    return {
+        "$or": [
+            {"created_at": {"$lt": last_created_at}},
+            {"created_at": last_created_at, "_id": {"$lt": last_id}},
+        ]
+    }
+
 
 class MongoDBNoteService:
     """MongoDB Note service."""
 
     @staticmethod
-    async def get_note(db: AsyncIOMotorDatabase, note_id: str, user_id: str) -> dict:
-        """Get a note by ID."""
+    async def get_note(
+        db: AsyncIOMotorDatabase,
+        note_id: str,
+        user_id: str,
+        fields: Optional[Sequence[str]] = None,
+    ) -> dict:
+        """Get a note by ID, only with ``fields`` when given."""
         note = await db.notes.find_one(
-            {"_id": ObjectId(note_id), "user_id": ObjectId(user_id)}
+            {"_id": ObjectId(note_id), "user_id": ObjectId(user_id)},
+            projection=_projection(fields),
         )
         if not note:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Note with id {note_id} not found",
             )
-        note["_id"] = str(note["_id"])
-        note["user_id"] = str(note["user_id"])
-        return note
+        return _stringify_ids(note)
 
     @staticmethod
     async def get_notes(
@@ -35,18 +91,28 @@ class MongoDBNoteService:
         skip: int = 0,
         limit: int = 100,
         archived: Optional[bool] = None,
-    ) -> List[dict]:
-        """Get multiple notes."""
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[dict]:
+        """Get a page of notes, newest first, starting after ``cursor``.
+
+        With ``fields``, only those (and the cursor keys) are read from MongoDB.
+        """
+        limit = clamp_limit(limit)
         query = {"user_id": ObjectId(user_id)}
         if archived is not None:
             query["is_archived"] = archived
+        if cursor:
+            query.update(_newest_first_after(cursor))
 
-        cursor = db.notes.find(query).skip(skip).limit(limit).sort("created_at", -1)
-        notes = await cursor.to_list(length=limit)
-        for note in notes:
-            note["_id"] = str(note["_id"])
-            note["user_id"] = str(note["user_id"])
-        return notes
+        find = db.notes.find(query, projection=_projection(fields, "created_at")).sort(NEWEST_FIRST)
+        if skip:
+            find = find.skip(skip)
+        notes = await find.limit(limit + 1).to_list(length=limit + 1)
+        page = paginate(notes, limit, lambda note: (note["created_at"], note["_id"]))
+        for note in page.items:
+            _stringify_ids(note)
+        return page
 
     @staticmethod
     async def create_note(
@@ -59,40 +125,190 @@ class MongoDBNoteService:
         note_dict["updated_at"] = datetime.utcnow()
 
         result = await db.notes.insert_one(note_dict)
-        created_note = await db.notes.find_one({"_id": result.inserted_id})
-        created_note["_id"] = str(created_note["_id"])
-        created_note["user_id"] = str(created_note["user_id"])
-        return created_note
+        # The inserted document is already complete; no need to read it back
+        note_dict["_id"] = str(result.inserted_id)
+        await MongoDBNoteService._adjust_tag_counts(
+            db, note_dict["user_id"], _tag_delta([], note_dict["tags"])
+        )
+        note_dict["user_id"] = str(note_dict["user_id"])
+        await note_search_cache.bump(user_id)
+        return note_dict
+
+    @staticmethod
+    async def import_notes(
+        db: AsyncIOMotorDatabase,
+        chunks: AsyncIterator[bytes],
+        user_id: str,
+        batch_size: Optional[int] = None,
+    ) -> NoteImportSummary:
+        """Import notes from an NDJSON byte stream, one ``NoteCreate`` per line.
+
+        Lines are validated as they arrive and written with unordered
+        ``insert_many`` calls of ``batch_size`` notes, so memory is bounded
+        by one batch. Invalid lines and rejected writes are reported by line
+        number; the rest of the import continues.
+        """
+        batch_size = batch_size or settings.NOTES_IMPORT_BATCH_SIZE
+        summary = NoteImportSummary()
+        owner_id = ObjectId(user_id)
+        batch: List[dict] = []
+        batch_lines: List[int] = []
+
+        def reject(line: int, error: str) -> None:
+            summary.failed += 1
+            if len(summary.errors) < settings.NOTES_IMPORT_MAX_ERRORS:
+                summary.errors.append(NoteImportError(line=line, error=error))
+
+        async def flush() -> None:
+            failed = set()
+            try:
+                result = await db.notes.insert_many(batch, ordered=False)
+                summary.inserted += len(result.inserted_ids)
+            except BulkWriteError as e:
+                summary.inserted += e.details.get("nInserted", 0)
+                for write_error in e.details.get("writeErrors", []):
+                    failed.add(write_error["index"])
+                    reject(
+                        batch_lines[write_error["index"]],
+                        write_error.get("errmsg", "Write failed"),
+                    )
+            tag_counts = Counter(
+                tag
+                for index, note in enumerate(batch)
+                if index not in failed
+                for tag in set(note["tags"])
+            )
+            await MongoDBNoteService._adjust_tag_counts(db, owner_id, tag_counts)
+            batch.clear()
+            batch_lines.clear()
+
+        async for line_number, line in iter_lines(chunks, settings.NOTES_IMPORT_MAX_LINE_BYTES):
+            summary.received += 1
+            if line is None:
+                reject(line_number, "Line too long")
+                continue
+            try:
+                note_create = NoteCreate.model_validate_json(line)
+            except ValidationError as e:
+                reject(line_number, "; ".join(error["msg"] for error in e.errors()))
+                continue
+            now = datetime.utcnow()
+            note = note_create.model_dump()
+            note.update(user_id=owner_id, created_at=now, updated_at=now)
+            batch.append(note)
+            batch_lines.append(line_number)
+            if len(batch) >= batch_size:
+                await flush()
+        if batch:
+            await flush()
+        if summary.inserted:
+            await note_search_cache.bump(user_id)
+        return summary
 
     @staticmethod
     async def update_note(
         db: AsyncIOMotorDatabase, note_id: str, note_update: NoteUpdate, user_id: str
     ) -> dict:
         """Update a note."""
-        # Check if note exists and belongs to user
-        await MongoDBNoteService.get_note(db, note_id, user_id)
-
         update_data = note_update.model_dump(exclude_unset=True)
-        if update_data:
-            update_data["updated_at"] = datetime.utcnow()
-            await db.notes.update_one(
-                {"_id": ObjectId(note_id), "user_id": ObjectId(user_id)},
-                {"$set": update_data},
-            )
-
-        updated_note = await db.notes.find_one(
-            {"_id": ObjectId(note_id), "user_id": ObjectId(user_id)}
+        if not update_data:
+            return await MongoDBNoteService.get_note(db, note_id, user_id)
+        update_data["updated_at"] = datetime.utcnow()
+        # The previous tags are needed for the tag counters; the updated note
+        # is the previous one with update_data applied
+        previous = await db.notes.find_one_and_update(
+            {"_id": ObjectId(note_id), "user_id": ObjectId(user_id)},
+            {"$set": update_data},
+            return_document=ReturnDocument.BEFORE,
         )
-        updated_note["_id"] = str(updated_note["_id"])
-        updated_note["user_id"] = str(updated_note["user_id"])
-        return updated_note
+        if not previous:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Note with id {note_id} not found",
+            )
+        note = {**previous, **update_data}
+        if "tags" in update_data:
+            delta = _tag_delta(previous.get("tags") or [], note["tags"] or [])
+            await MongoDBNoteService._adjust_tag_counts(db, previous["user_id"], delta)
+        await note_search_cache.bump(user_id)
+        return _stringify_ids(note)
 
     @staticmethod
     async def delete_note(db: AsyncIOMotorDatabase, note_id: str, user_id: str) -> None:
         """Delete a note."""
-        # Check if note exists and belongs to user
-        await MongoDBNoteService.get_note(db, note_id, user_id)
-        await db.notes.delete_one({"_id": ObjectId(note_id), "user_id": ObjectId(user_id)})
+        note = await db.notes.find_one_and_delete(
+            {"_id": ObjectId(note_id), "user_id": ObjectId(user_id)},
+            projection={"tags": 1},
+        )
+        if not note:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Note with id {note_id} not found",
+            )
+        await MongoDBNoteService._adjust_tag_counts(
+            db, ObjectId(user_id), _tag_delta(note.get("tags") or [], [])
+        )
+        await note_search_cache.bump(user_id)
+
+    @staticmethod
+    async def _adjust_tag_counts(
+        db: AsyncIOMotorDatabase, user_id: ObjectId, delta: Dict[str, int]
+    ) -> None:
+        """Apply per-tag counter changes with one unordered bulk write.
+
+        Only increments create missing counters: a decrement without one
+        would leave a negative count behind.
+        """
+        operations = [
+            UpdateOne(
+                {"user_id": user_id, "tag": tag}, {"$inc": {"count": change}}, upsert=change > 0
+            )
+            for tag, change in delta.items()
+            if change
+        ]
+        if operations:
+            await db.note_tag_counts.bulk_write(operations, ordered=False)
+
+    @staticmethod
+    async def get_tag_counts(db: AsyncIOMotorDatabase, user_id: str) -> List[dict]:
+        """Get the user's tags with the number of notes carrying each, most used first."""
+        find = db.note_tag_counts.find(
+            {"user_id": ObjectId(user_id), "count": {"$gt": 0}},
+            projection={"_id": 0, "tag": 1, "count": 1},
+        ).sort([("count", -1), ("tag", 1)])
+        return await find.to_list(length=None)
+
+    @staticmethod
+    async def rebuild_tag_counts(db: AsyncIOMotorDatabase) -> int:
+        """Recompute every tag counter from the notes collection.
+
+        The counter collection is replaced atomically ($out keeps its
+        indexes). Counter updates made while the aggregation runs are lost,
+        so run it off-peak. Returns the number of counters written.
+        """
+        pipeline: List[Dict[str, Any]] = [
+            # A tag listed twice on one note counts once, as in _tag_delta
+            {"$project": {"user_id": 1, "tags": {"$setUnion": [{"$ifNull": ["$tags", []]}]}}},
+            {"$unwind": "$tags"},
+            {"$group": {"_id": {"user_id": "$user_id", "tag": "$tags"}, "count": {"$sum": 1}}},
+            {"$project": {"_id": 0, "user_id": "$_id.user_id", "tag": "$_id.tag", "count": 1}},
+            {"$out": "note_tag_counts"},
+        ]
+        await db.notes.aggregate(pipeline).to_list(length=None)
+        return await db.note_tag_counts.count_documents({})
+
+    @staticmethod
+    async def bootstrap_tag_counts(db: AsyncIOMotorDatabase) -> Optional[int]:
+        """Startup hook: build the tag counters once if notes predate them.
+
+        Returns the number of counters written, or None when they already
+        exist (or there are no notes).
+        """
+        if await db.note_tag_counts.find_one({}, projection={"_id": 1}) is not None:
+            return None
+        if await db.notes.find_one({}, projection={"_id": 1}) is None:
+            return None
+        return await MongoDBNoteService.rebuild_tag_counts(db)
 
     @staticmethod
     async def search_notes(
@@ -101,20 +317,72 @@ class MongoDBNoteService:
         search_term: str,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[dict]:
-        """Search notes by title or content."""
-        query = {
-            "user_id": ObjectId(user_id),
-            "$or": [
-                {"title": {"$regex": search_term, "$options": "i"}},
-                {"content": {"$regex": search_term, "$options": "i"}},
-            ],
-        }
-
-        cursor = db.notes.find(query).skip(skip).limit(limit).sort("created_at", -1)
-        notes = await cursor.to_list(length=limit)
-        for note in notes:
-            note["_id"] = str(note["_id"])
-            note["user_id"] = str(note["user_id"])
-        return notes
+        mode: Literal["text", "regex"] = "text",
+        cursor: Optional[str] = None,
+    ) -> Page[dict]:
+        """Search notes by title or content, one page at a time.
+
+        ``text`` mode uses the notes text index (title weighted above content)
+        and ranks by relevance. ``regex`` mode matches the term as a literal,
+        case-insensitive substring, newest first; it cannot use an index.
+        Whitespace in the term is collapsed and results are cached per user
+        until the user's next note write.
+        """
+        search_term = note_search_cache.normalize(search_term)
+        limit = clamp_limit(limit)
+        return await note_search_cache.get_or_compute(
+            user_id,
+            (mode, search_term, skip, limit, cursor),
+            lambda: MongoDBNoteService._search_notes(
+                db, user_id, search_term, skip, limit, mode, cursor
+            ),
+        )
 
+    @staticmethod
+    async def _search_notes(
+        db: AsyncIOMotorDatabase,
+        user_id: str,
+        search_term: str,
+        skip: int,
+        limit: int,
+        mode: str,
+        cursor: Optional[str],
+    ) -> Page[dict]:
+        if mode == "regex":
+            pattern = {"$regex": re.escape(search_term), "$options": "i"}
+            conditions = [{"$or": [{"title": pattern}, {"content": pattern}]}]
+            if cursor:
+                conditions.append(_newest_first_after(cursor))
+            find = db.notes.find({"user_id": ObjectId(user_id), "$and": conditions})
+            find = find.sort(NEWEST_FIRST)
+            if skip:
+                find = find.skip(skip)
+            notes = await find.limit(limit + 1).to_list(length=limit + 1)
+            page = paginate(notes, limit, lambda note: (note["created_at"], note["_id"]))
+        else:
+            pipeline: List[Dict[str, Any]] = [
+                {"$match": {"user_id": ObjectId(user_id), "$text": {"$search": search_term}}},
+                {"$addFields": {"score": {"$meta": "textScore"}}},
+            ]
+            if cursor:
+                last_score, last_id = decode_cursor(cursor, float, ObjectId)
+                pipeline.append(
+                    {
+                        "$match": {
+                            "$or": [
+                                {"score": {"$lt": last_score}},
+                                {"score": last_score, "_id": {"$lt": last_id}},
+                            ]
+                        }
+                    }
+                )
+            # _id breaks score ties so the order, and therefore the cursor, is stable
+            pipeline.append({"$sort": {"score": -1, "_id": -1}})
+            if skip:
+                pipeline.append({"$skip": skip})
+            pipeline.append({"$limit": limit + 1})
+            notes = await db.notes.aggregate(pipeline).to_list(length=limit + 1)
+            page = paginate(notes, limit, lambda note: (note["score"], note["_id"]))
+        for note in page.items:
+            _stringify_ids(note)
+        return page
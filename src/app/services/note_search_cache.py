@@ -0,0 +1,164 @@
+"""Per-user cache of note search results, invalidated by a generation counter."""
+
+import hashlib
+import itertools
+import json
+import logging
+import secrets
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from redis.exceptions import RedisError
+
+from app.config.settings import settings
+from app.core.metrics import register_metrics
+from app.database.redis import get_redis_client
+from app.utils.cache import TTLCache
+from app.utils.pagination import Page, json_default
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "notes:search"
+
+
+class NoteSearchCache:
+    """Cache search pages per user, dropping all of a user's pages on each write.
+
+    Each write gives the user a new, never reused generation, and cached
+    pages are keyed by the generation they were computed under, so older
+    pages stop matching and simply age out. A user whose generation has been
+    evicted or has expired gets a fresh one on the next lookup, so pages
+    cached under any earlier generation can never be served again.
+
+    Pages and generations are shared through Redis when it is configured and
+    kept in process otherwise.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, enabled: bool = True):
+        self.enabled = enabled
+        self.ttl = ttl
+        self._pages: TTLCache[Page[dict]] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generations: TTLCache[str] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._counter = itertools.count(1)
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @staticmethod
+    def normalize(search_term: str) -> str:
+        """Collapse whitespace and case so equivalent queries share an entry."""
+        return " ".join(search_term.split()).casefold()
+
+    async def get_or_compute(
+        self,
+        user_id: str,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Page[dict]]],
+    ) -> Page[dict]:
+        """Return the cached page for ``(user_id, key)`` or compute and cache it."""
+        if not self.enabled:
+            return await compute()
+        redis_client = get_redis_client()
+        try:
+            if redis_client is None:
+                generation = self._generations.get(user_id)
+                if generation is None:
+                    generation = self._new_generation()
+                    self._generations.set(user_id, generation)
+                page = self._pages.get((user_id, generation, key))
+            else:
+                generation, page = await self._redis_get(redis_client, user_id, key)
+        except RedisError as e:
+            self.errors += 1
+            logger.warning(f"Note search cache unavailable: {e}")
+            return await compute()
+        if page is not None:
+            self.hits += 1
+            return page
+        self.misses += 1
+        # Stored under the generation read before computing: if a write
+        # happened meanwhile, the page is never served
+        page = await compute()
+        try:
+            if redis_client is None:
+                self._pages.set((user_id, generation, key), page)
+            else:
+                await self._redis_set(redis_client, user_id, generation, key, page)
+        except RedisError as e:
+            self.errors += 1
+            logger.warning(f"Note search cache unavailable: {e}")
+        return page
+
+    async def bump(self, user_id: str) -> None:
+        """Invalidate every cached page of ``user_id`` after a note write."""
+        if not self.enabled:
+            return
+        redis_client = get_redis_client()
+        if redis_client is None:
+            self._generations.set(user_id, self._new_generation())
+            return
+        try:
+            await redis_client.set(
+                f"{REDIS_KEY_PREFIX}:gen:{user_id}", secrets.token_hex(8), ex=int(self.ttl) + 1
+            )
+        except RedisError as e:
+            self.errors += 1
+            logger.warning(f"Failed to invalidate note search cache for user {user_id}: {e}")
+
+    def _new_generation(self) -> str:
+        return str(next(self._counter))
+
+    def _redis_page_key(self, user_id: str, generation: str, key: Hashable) -> str:
+        digest = hashlib.sha256(json.dumps(key, default=str).encode()).hexdigest()[:32]
+        return f"{REDIS_KEY_PREFIX}:{user_id}:{generation}:{digest}"
+
+    async def _redis_get(
+        self, redis_client, user_id: str, key: Hashable
+    ) -> Tuple[str, Optional[Page[dict]]]:
+        generation_key = f"{REDIS_KEY_PREFIX}:gen:{user_id}"
+        generation = await redis_client.get(generation_key)
+        if generation is None:
+            # Evicted or expired: start a generation no cached page can match
+            generation = secrets.token_hex(8)
+            created = await redis_client.set(
+                generation_key, generation, ex=int(self.ttl) + 1, nx=True
+            )
+            if not created:
+                generation = await redis_client.get(generation_key) or generation
+            return generation, None
+        raw = await redis_client.get(self._redis_page_key(user_id, generation, key))
+        if raw is None:
+            return generation, None
+        data = json.loads(raw)
+        return generation, Page(items=data["items"], next_cursor=data["next_cursor"])
+
+    async def _redis_set(
+        self, redis_client, user_id: str, generation: str, key: Hashable, page: Page[dict]
+    ) -> None:
+        raw = json.dumps(
+            {"items": page.items, "next_cursor": page.next_cursor}, default=json_default
+        )
+        await redis_client.set(
+            self._redis_page_key(user_id, generation, key), raw, ex=max(int(self.ttl), 1)
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters suitable for a metrics endpoint."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "backend": "redis" if get_redis_client() is not None else "memory",
+            "size": len(self._pages),
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+note_search_cache = NoteSearchCache(
+    maxsize=settings.NOTE_SEARCH_CACHE_MAX_SIZE,
+    ttl=settings.NOTE_SEARCH_CACHE_TTL_SECONDS,
+    enabled=settings.NOTE_SEARCH_CACHE_ENABLED,
+)
+
+register_metrics("note_search_cache", note_search_cache.stats)
@@ -0,0 +1,65 @@
+"""Access token revocation service."""
+
+from typing import Dict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from redis.exceptions import RedisError
+import logging
+
+from app.core.revocation import revocation_filter
+from app.database.redis import get_redis_client
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+REDIS_TOKEN_VERSIONS_KEY = "auth:token_versions"
+
+
+class TokenRevocationService:
+    """Keep the in-memory revocation filter in sync with the database and Redis."""
+
+    @staticmethod
+    async def revoke(user_id: int, min_version: int) -> None:
+        """Revoke tokens for a user issued below ``min_version``.
+
+        The local filter is updated immediately; other workers pick the change
+        up from Redis (when configured) or from the ``token_version`` column on
+        their next sync. A Redis failure is logged rather than raised, since
+        the change has already been committed.
+
+        The Redis hash expires once no revocation has been written to it for
+        the access token lifetime, when every token its entries cover has
+        expired.
+        """
+        revocation_filter.revoke(user_id, min_version)
+        redis_client = get_redis_client()
+        if redis_client is None:
+            return
+        try:
+            await redis_client.hset(REDIS_TOKEN_VERSIONS_KEY, str(user_id), min_version)
+            await redis_client.expire(
+                REDIS_TOKEN_VERSIONS_KEY, int(revocation_filter.retention_seconds)
+            )
+        except RedisError as e:
+            logger.warning(f"Failed to share token revocation for user {user_id}: {e}")
+
+    @staticmethod
+    async def sync(db: AsyncSession) -> int:
+        """Rebuild the filter from ``users.token_version`` and Redis.
+
+        Returns the number of users with revoked tokens.
+        """
+        result = await db.execute(
+            select(User.id, User.token_version).filter(User.token_version > 0)
+        )
+        versions: Dict[int, int] = dict(result.tuples().all())
+        redis_client = get_redis_client()
+        if redis_client is not None:
+            shared = await redis_client.hgetall(REDIS_TOKEN_VERSIONS_KEY)
+            for raw_user_id, raw_version in shared.items():
+                user_id, version = int(raw_user_id), int(raw_version)
+                versions[user_id] = max(version, versions.get(user_id, 0))
+        revocation_filter.replace(versions)
+        logger.debug(f"Token revocation filter synced ({len(versions)} users)")
+        return len(versions)
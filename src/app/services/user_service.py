@@ -1,13 +1,37 @@
 """User service."""
 
-from typing import Optional
+from typing import Any, List, Optional, Sequence, cast
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
+from sqlalchemy import Row, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
 from app.models.user import User
-from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash
+from app.schemas.user import User as UserSchema, UserCreate, UserUpdate
+from app.config.settings import settings
+from app.core.principal import invalidate_principal
+from app.core.security import get_password_hash_async
+from app.services.loaders import user_loader
+from app.services.token_revocation_service import TokenRevocationService
+from app.utils.pagination import Page, clamp_limit, decode_cursor, paginate
+
+# Columns selected by UserService.get_users: exactly the fields of the response schema
+LIST_COLUMNS = tuple(UserSchema.model_fields)
+
+
+def _columns(fields: Optional[Sequence[str]], *required: str) -> List[Any]:
+    """User columns for ``fields`` (default LIST_COLUMNS) plus ``required`` ones."""
+    names = list(fields or LIST_COLUMNS)
+    names += [name for name in required if name not in names]
+    return [getattr(User, name) for name in names]
+
+
+def _is_unique_violation(error: IntegrityError) -> bool:
+    """True if ``error`` is a unique constraint violation (PostgreSQL or SQLite)."""
+    sqlstate = getattr(error.orig, "sqlstate", None) or getattr(error.orig, "pgcode", None)
+    if sqlstate is not None:
+        return bool(sqlstate == "23505")
+    return getattr(error.orig, "sqlite_errorname", None) == "SQLITE_CONSTRAINT_UNIQUE"
 
 
 class UserService:
@@ -25,6 +49,35 @@ class UserService:
             )
         return user
 
+    @staticmethod
+    async def get_user_fields(db: AsyncSession, user_id: int, fields: Sequence[str]) -> Row:
+        """Get only ``fields`` of a user by ID, as a row."""
+        result = await db.execute(select(*_columns(fields)).filter(User.id == user_id))
+        user = result.one_or_none()
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User with id {user_id} not found",
+            )
+        return user
+
+    @staticmethod
+    async def load_user(db: AsyncSession, user_id: int) -> User:
+        """Get a user by ID for read-only use, batched with concurrent lookups.
+
+        Falls back to ``get_user`` when batch loading is disabled. The returned
+        instance may be detached, so do not modify it.
+        """
+        if not settings.BATCH_LOADING_ENABLED:
+            return await UserService.get_user(db, user_id)
+        user = await user_loader.load(user_id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User with id {user_id} not found",
+            )
+        return user
+
     @staticmethod
     async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
         """Get a user by email."""
@@ -38,56 +91,104 @@ class UserService:
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100) -> list[User]:
-        """Get multiple users."""
-        result = await db.execute(select(User).offset(skip).limit(limit))
-        return list(result.scalars().all())
+    async def get_users(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[Row]:
+        """Get a page of users in id order, starting after ``cursor``.
+
+        Users are read-only rows of ``fields`` (default LIST_COLUMNS, id is
+        always added for the cursor) rather than ORM entities, so password
+        hashes are never loaded.
+        """
+        limit = clamp_limit(limit)
+        query = select(*_columns(fields, "id"))
+        if cursor:
+            (last_id,) = decode_cursor(cursor, int)
+            query = query.filter(User.id > last_id)
+        query = query.order_by(User.id)
+        if skip:
+            query = query.offset(skip)
+        result = await db.execute(query.limit(limit + 1))
+        return paginate(result.all(), limit, lambda user: (user.id,))
 
     @staticmethod
     async def create_user(db: AsyncSession, user_create: UserCreate) -> User:
         """Create a new user."""
-        # Check if user already exists
-        result = await db.execute(
-            select(User).filter(
-                or_(User.email == user_create.email, User.username == user_create.username)
-            )
+        conflict = HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="User with this email or username already exists",
         )
-        existing_user = result.scalar_one_or_none()
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="User with this email or username already exists",
-            )
-        hashed_password = get_password_hash(user_create.password)
-        db_user = User(
-            email=user_create.email,
-            username=user_create.username,
-            hashed_password=hashed_password,
-            full_name=user_create.full_name,
-            is_active=user_create.is_active,
+        # Checked before hashing so duplicate sign-ups never cost a bcrypt round
+        existing = await db.execute(
+            select(User.id)
+            .filter(or_(User.email == user_create.email, User.username == user_create.username))
+            .limit(1)
         )
-        db.add(db_user)
+        if existing.scalar_one_or_none() is not None:
+            raise conflict
+        hashed_password = await get_password_hash_async(user_create.password)
+        try:
+            result = await db.execute(
+                insert(User)
+                .values(
+                    email=user_create.email,
+                    username=user_create.username,
+                    hashed_password=hashed_password,
+                    full_name=user_create.full_name,
+                    is_active=user_create.is_active,
+                )
+                .returning(User)
+            )
+        except IntegrityError as e:
+            await db.rollback()
+            # A concurrent sign-up took the email or username after the check
+            if _is_unique_violation(e):
+                raise conflict from e
+            raise
+        user = result.scalar_one()
         await db.commit()
-        await db.refresh(db_user)
-        return db_user
+        return user
 
     @staticmethod
     async def update_user(db: AsyncSession, user_id: int, user_update: UserUpdate) -> User:
         """Update a user."""
-        user = await UserService.get_user(db, user_id)
         update_data = user_update.model_dump(exclude_unset=True)
+        if not update_data:
+            return await UserService.get_user(db, user_id)
+        # Credential and status changes invalidate every token issued so far
+        revoke_tokens = "password" in update_data or "is_active" in update_data
         if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
-        for field, value in update_data.items():
-            setattr(user, field, value)
+            update_data["hashed_password"] = await get_password_hash_async(
+                update_data.pop("password")
+            )
+        if revoke_tokens:
+            update_data["token_version"] = User.token_version + 1
+        result = await db.execute(
+            update(User).where(User.id == user_id).values(**update_data).returning(User)
+        )
+        user = result.scalar_one_or_none()
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User with id {user_id} not found",
+            )
         await db.commit()
-        await db.refresh(user)
+        invalidate_principal(user_id)
+        if revoke_tokens:
+            await TokenRevocationService.revoke(user_id, cast(int, user.token_version))
         return user
 
     @staticmethod
     async def delete_user(db: AsyncSession, user_id: int) -> None:
         """Delete a user."""
         user = await UserService.get_user(db, user_id)
+        token_version = cast(int, user.token_version)
         await db.delete(user)
         await db.commit()
+        invalidate_principal(user_id)
+        await TokenRevocationService.revoke(user_id, token_version + 1)
 
@@ -0,0 +1,112 @@
+"""DataLoader-style batching of point lookups across concurrent requests."""
+
+import asyncio
+import weakref
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchFn = Callable[[List[K]], Awaitable[Mapping[K, V]]]
+
+
+class _Batch:
+    """Keys collected during one window and the futures waiting on them."""
+
+    __slots__ = ("futures", "handle")
+
+    def __init__(self):
+        self.futures: Dict[Any, asyncio.Future] = {}
+        self.handle: Optional[asyncio.Handle] = None
+
+
+class BatchLoader(Generic[K, V]):
+    """Coalesce ``load(key)`` calls into a single ``batch_fn(keys)`` call.
+
+    Keys requested on the same event loop within ``window`` seconds (or within
+    the same loop tick when ``window`` is 0) are deduplicated and resolved by
+    one call to ``batch_fn``, which returns a mapping of the keys it found.
+    Missing keys resolve to ``None``. Each event loop gets its own batch, so
+    the loader is safe to share at module level.
+    """
+
+    def __init__(self, batch_fn: BatchFn, window: float = 0.0, max_batch_size: int = 500):
+        self.batch_fn = batch_fn
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._batches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Batch]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # The loop only keeps weak references to tasks
+        self._tasks: Set[asyncio.Task] = set()
+        self.loads = 0
+        self.batches = 0
+        self.keys_fetched = 0
+
+    async def load(self, key: K) -> Optional[V]:
+        """Return the value for ``key``, batched with concurrent loads."""
+        loop = asyncio.get_running_loop()
+        self.loads += 1
+        batch = self._batches.get(loop)
+        if batch is None:
+            batch = self._batches[loop] = _Batch()
+            if self.window > 0:
+                batch.handle = loop.call_later(self.window, self._dispatch, loop)
+            else:
+                batch.handle = loop.call_soon(self._dispatch, loop)
+        future = batch.futures.get(key)
+        if future is None:
+            future = batch.futures[key] = loop.create_future()
+            if len(batch.futures) >= self.max_batch_size:
+                if batch.handle is not None:
+                    batch.handle.cancel()
+                self._dispatch(loop)
+        # Shield so one cancelled caller does not cancel the shared result
+        return await asyncio.shield(future)
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        batch = self._batches.pop(loop, None)
+        if batch is not None and batch.futures:
+            task = loop.create_task(self._resolve(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: _Batch) -> None:
+        keys = list(batch.futures)
+        self.batches += 1
+        self.keys_fetched += len(keys)
+        try:
+            found = await self.batch_fn(keys)
+            for key, future in batch.futures.items():
+                if not future.done():
+                    future.set_result(found.get(key))
+        except Exception as e:
+            for future in batch.futures.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Cancelled (or worse): callers must not wait forever
+            for future in batch.futures.values():
+                if not future.done():
+                    future.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters suitable for a metrics endpoint."""
+        return {
+            "loads": self.loads,
+            "batches": self.batches,
+            "keys_fetched": self.keys_fetched,
+            "avg_batch_size": self.keys_fetched / self.batches if self.batches else 0.0,
+        }
@@ -0,0 +1,50 @@
+"""Incremental NDJSON/CSV encoding for streamed exports."""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Sequence
+
+from app.utils.pagination import json_default
+
+# Export format -> response media type
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _encode_ndjson(rows: Sequence[Sequence[Any]], columns: Sequence[str]) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(columns, row, strict=True)), default=json_default) + "\n"
+        for row in rows
+    ).encode()
+
+
+def _encode_csv(rows: Sequence[Sequence[Any]], columns: Sequence[str]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        [value.isoformat() if isinstance(value, datetime) else value for value in row]
+        for row in rows
+    )
+    return buffer.getvalue().encode()
+
+
+async def encode_rows(
+    batches: AsyncIterator[Sequence[Sequence[Any]]], columns: Sequence[str], fmt: str
+) -> AsyncIterator[bytes]:
+    """Encode batches of rows as they arrive, one chunk per batch.
+
+    Only the current batch is held in memory. CSV output starts with a
+    header row; NDJSON emits one object per line.
+    """
+    if fmt == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(columns)
+        yield buffer.getvalue().encode()
+        encode = _encode_csv
+    else:
+        encode = _encode_ndjson
+    async for rows in batches:
+        yield encode(rows, columns)
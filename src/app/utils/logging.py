@@ -1,21 +1,48 @@
 """Logging utilities."""
 
+import copy
 import logging
+import queue
 import sys
-import json
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+from datetime import datetime, timezone
+
+import orjson
+
+from app.core.metrics import register_metrics
+
+OVERFLOW_POLICIES = ("drop", "block")
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    return orjson.dumps(data, default=str).decode()
 
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
+    def __init__(self):
+        super().__init__()
+        # The "YYYY-MM-DDTHH:MM:SS" prefix only changes once per second
+        self._second = None
+        self._second_prefix = ""
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        if second != self._second:
+            self._second_prefix = (
+                datetime.fromtimestamp(second, timezone.utc).replace(tzinfo=None).isoformat()
+            )
+            self._second = second
+        return f"{self._second_prefix}.{int((created - second) * 1_000_000):06d}"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -23,35 +50,243 @@ class JSONFormatter(logging.Formatter):
             "function": record.funcName,
             "line": record.lineno,
         }
-        
-        # Add exception info if present
+
+        # Add exception info if present (records from a queue carry it as text)
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
-        
+        elif record.exc_text:
+            log_data["exception"] = record.exc_text
+
         # Add extra fields
         if hasattr(record, "request_id"):
             log_data["request_id"] = record.request_id
         if hasattr(record, "user_id"):
             log_data["user_id"] = record.user_id
-        
-        return json.dumps(log_data)
+        if hasattr(record, "access"):
+            log_data["access"] = record.access
+
+        return _dumps(log_data)
+
+
+class BatchStreamHandler(logging.StreamHandler):
+    """StreamHandler that can also write a batch of records with a single flush."""
+
+    def emit_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        """Format ``records`` and write them in one write and one flush."""
+        lines = []
+        for record in records:
+            if not self.filter(record):
+                continue
+            try:
+                lines.append(self.format(record) + self.terminator)
+            except Exception:
+                self.handleError(record)
+        if not lines:
+            return
+        self.acquire()
+        try:
+            self.stream.write("".join(lines))
+            self.flush()
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
 
 
-def setup_logging(level: Optional[str] = None, use_json: bool = False, log_file: Optional[str] = None) -> None:
+class BatchRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that can also write a batch of records with a single flush."""
+
+    def emit_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        """Format ``records`` and write them in as few writes as rotation allows."""
+        self.acquire()
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            pending: List[str] = []
+            size = self.stream.tell()
+            for record in records:
+                if not self.filter(record):
+                    continue
+                try:
+                    line = self.format(record) + self.terminator
+                except Exception:
+                    self.handleError(record)
+                    continue
+                line_size = len(line.encode(self.encoding or "utf-8"))
+                if self.maxBytes > 0 and size and size + line_size >= self.maxBytes:
+                    if pending:
+                        self._write(pending, record)
+                    self.doRollover()
+                    pending, size = [], 0
+                pending.append(line)
+                size += line_size
+            if pending:
+                self._write(pending, records[-1])
+        finally:
+            self.release()
+
+    def _write(self, lines: List[str], record: logging.LogRecord) -> None:
+        # doRollover leaves no stream open when the handler was created with delay=True
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write("".join(lines))
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler over a bounded queue that drops or blocks when it is full.
+
+    Only the record's message and traceback text are resolved on the calling
+    thread; formatting and I/O happen on the listener thread.
+    """
+
+    def __init__(self, maxsize: int, overflow: str = "drop"):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+        # Also kept with its concrete type: QueueHandler.queue is only "queue-like"
+        self.log_queue: queue.Queue = queue.Queue(maxsize)
+        super().__init__(self.log_queue)
+        self.overflow = overflow
+        self.enqueued = 0
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow == "block":
+            self.log_queue.put(record)
+        else:
+            try:
+                self.log_queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+                return
+        self.enqueued += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters suitable for a metrics endpoint."""
+        return {
+            "overflow": self.overflow,
+            "queue_size": self.log_queue.qsize(),
+            "queue_max_size": self.log_queue.maxsize,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+        }
+
+
+class BatchingQueueListener:
+    """Drain a log queue on a background thread and hand records over in batches.
+
+    Handlers with an ``emit_batch`` method receive each batch at once; other
+    handlers get the records one by one.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        handlers: Sequence[logging.Handler],
+        max_batch: int = 512,
+    ):
+        self.queue = log_queue
+        self.handlers = list(handlers)
+        self.max_batch = max_batch
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="log-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write out everything queued so far and stop the thread."""
+        if self._thread is None:
+            return
+        self.queue.put(None)
+        self._thread.join()
+        self._thread = None
+        for handler in self.handlers:
+            handler.flush()
+
+    def _run(self) -> None:
+        while True:
+            record = self.queue.get()
+            stopping = record is None
+            batch: List[logging.LogRecord] = [] if stopping else [record]
+            while not stopping and len(batch) < self.max_batch:
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    stopping = True
+                else:
+                    batch.append(record)
+            if batch:
+                self._handle(batch)
+            if stopping:
+                return
+
+    def _handle(self, batch: List[logging.LogRecord]) -> None:
+        # A failing handler (e.g. a rollover OSError) must not kill the thread
+        for handler in self.handlers:
+            records = [record for record in batch if record.levelno >= handler.level]
+            if not records:
+                continue
+            emit_batch = getattr(handler, "emit_batch", None)
+            if emit_batch is not None:
+                try:
+                    emit_batch(records)
+                except Exception:
+                    handler.handleError(records[-1])
+            else:
+                for record in records:
+                    try:
+                        handler.handle(record)
+                    except Exception:
+                        handler.handleError(record)
+
+
+_listener: Optional[BatchingQueueListener] = None
+
+
+def setup_logging(
+    level: Optional[str] = None,
+    use_json: bool = False,
+    log_file: Optional[str] = None,
+    async_mode: bool = False,
+    queue_size: int = 10_000,
+    overflow: str = "drop",
+) -> None:
     """Setup application logging.
-    
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         use_json: Use JSON formatting for structured logging
         log_file: Optional path to log file (enables file rotation)
+        async_mode: Hand records to a background thread through a bounded
+            queue instead of writing them on the logging thread
+        queue_size: Maximum number of queued records in async mode
+        overflow: What to do with a full queue: "drop" the record (counted
+            in the "logging" metrics) or "block" until there is room
     """
     log_level = level or "INFO"
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
-    
+
     # Remove existing handlers
+    shutdown_logging()
     root_logger.handlers.clear()
-    
+
     # Choose formatter
     if use_json:
         formatter = JSONFormatter()
@@ -62,19 +297,21 @@ def setup_logging(level: Optional[str] = None, use_json: bool = False, log_file:
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         console_format = formatter
-    
+
+    handlers: List[logging.Handler] = []
+
     # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = BatchStreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, log_level.upper()))
     console_handler.setFormatter(console_format)
-    root_logger.addHandler(console_handler)
-    
+    handlers.append(console_handler)
+
     # File handler with rotation (if log_file is provided)
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = RotatingFileHandler(
+
+        file_handler = BatchRotatingFileHandler(
             log_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5,
@@ -82,10 +319,28 @@ def setup_logging(level: Optional[str] = None, use_json: bool = False, log_file:
         )
         file_handler.setLevel(getattr(logging, log_level.upper()))
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
-    
+        handlers.append(file_handler)
+
+    if async_mode:
+        global _listener
+        queue_handler = BoundedQueueHandler(queue_size, overflow)
+        _listener = BatchingQueueListener(queue_handler.log_queue, handlers)
+        _listener.start()
+        root_logger.addHandler(queue_handler)
+        register_metrics("logging", queue_handler.stats)
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+
     # Set levels for third-party loggers
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
+
+def shutdown_logging() -> None:
+    """Flush and stop the background log writer started by async mode, if any."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,42 @@
+"""Incremental line splitting for streamed NDJSON request bodies."""
+
+from typing import AsyncIterator, Optional, Tuple
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """Yield ``(line_number, line)`` for each non-blank line of a byte stream.
+
+    At most ``max_line_bytes`` of a line are buffered. A longer line is
+    skipped up to its newline and reported as ``(line_number, None)``.
+    Line numbers start at 1.
+    """
+    buffer = bytearray()
+    line_number = 0
+    oversized = False
+    async for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end == -1:
+                if not oversized:
+                    buffer += chunk[start:]
+                    if len(buffer) > max_line_bytes:
+                        oversized = True
+                        buffer.clear()
+                break
+            line_number += 1
+            if oversized or len(buffer) + end - start > max_line_bytes:
+                yield line_number, None
+            else:
+                buffer += chunk[start:end]
+                if buffer.strip():
+                    yield line_number, bytes(buffer)
+            buffer.clear()
+            oversized = False
+            start = end + 1
+    if oversized:
+        yield line_number + 1, None
+    elif buffer.strip():
+        yield line_number + 1, bytes(buffer)
@@ -0,0 +1,72 @@
+"""Keyset (cursor) pagination helpers."""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Generic, List, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, status
+
+from app.config.settings import settings
+
+T = TypeVar("T")
+
+# Response header carrying the cursor of the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results and the cursor to fetch the next one."""
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def clamp_limit(limit: int) -> int:
+    """Bound a client-supplied page size to ``[1, PAGINATION_MAX_LIMIT]``."""
+    return max(1, min(limit, settings.PAGINATION_MAX_LIMIT))
+
+
+def json_default(value: Any) -> str:
+    """``json.dumps`` fallback: ISO 8601 for datetimes, ``str()`` for anything else."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor."""
+    raw = json.dumps(values, default=json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> tuple:
+    """Decode a cursor, converting each key with the matching parser.
+
+    Raises a 400 error if the cursor is malformed or does not match
+    ``parsers``.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("cursor length mismatch")
+        return tuple(parse(value) for parse, value in zip(parsers, values, strict=True))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        ) from e
+
+
+def paginate(rows: Sequence[T], limit: int, key: Callable[[T], tuple]) -> Page[T]:
+    """Build a page from ``rows`` fetched with ``limit + 1``.
+
+    The extra row only signals that another page exists; it is dropped.
+    """
+    if len(rows) <= limit:
+        return Page(items=list(rows))
+    items = list(rows[:limit])
+    return Page(items=items, next_cursor=encode_cursor(*key(items[-1])))
@@ -0,0 +1,113 @@
+"""Precompiled JSON serializers for response schemas."""
+
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from app.utils.pagination import NEXT_CURSOR_HEADER, Page
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+class ResponseSerializer(Generic[SchemaT]):
+    """Turn ORM objects, documents or schema instances into JSON bytes in one step.
+
+    Returning the ``Response`` built here from an endpoint bypasses FastAPI's
+    response_model handling (validate, convert to JSON-compatible Python,
+    ``json.dumps``): records are validated into ``schema`` and written as
+    JSON by pydantic-core directly. Instances of ``schema`` are trusted and
+    not validated again. Keep ``response_model`` on the route for the
+    OpenAPI schema.
+    """
+
+    def __init__(self, schema: Type[SchemaT]):
+        self.schema = schema
+        self._one = TypeAdapter(schema)
+        self._many = TypeAdapter(List[schema])  # type: ignore[valid-type]
+        # Field name by name or alias, as accepted by parse_fields
+        self._names = {name: name for name in schema.model_fields}
+        self._names.update(
+            (info.alias, name) for name, info in schema.model_fields.items() if info.alias
+        )
+        self._subsets: Dict[Tuple[str, ...], "ResponseSerializer"] = {}
+
+    def parse_fields(self, fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+        """Parse a comma-separated ``fields`` query parameter into schema field names.
+
+        Fields may be given by name or by alias (``id`` or ``_id``) and come
+        back in schema order. None means every field. Unknown names are a 400.
+        """
+        if fields is None:
+            return None
+        requested = set()
+        for name in fields.split(","):
+            name = name.strip()
+            if not name:
+                continue
+            if name not in self._names:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown field {name!r}, expected some of: "
+                    + ", ".join(self.schema.model_fields),
+                )
+            requested.add(self._names[name])
+        if not requested:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="fields must name at least one field",
+            )
+        return tuple(name for name in self.schema.model_fields if name in requested)
+
+    def only(self, fields: Optional[Tuple[str, ...]]) -> "ResponseSerializer":
+        """Return a serializer writing only ``fields`` (as returned by parse_fields).
+
+        Serializers for a field subset are built on first use and cached.
+        """
+        if fields is None or len(fields) == len(self.schema.model_fields):
+            return self
+        serializer = self._subsets.get(fields)
+        if serializer is None:
+            definitions: Dict[str, Any] = {
+                name: (info.annotation, info)
+                for name, info in self.schema.model_fields.items()
+                if name in fields
+            }
+            model = create_model(
+                f"{self.schema.__name__}Fields", __config__=self.schema.model_config, **definitions
+            )
+            serializer = self._subsets[fields] = ResponseSerializer(model)
+        return serializer
+
+    def validate(self, data: Any) -> SchemaT:
+        """Validate one ORM object or document (by attribute or by key)."""
+        if isinstance(data, self.schema):
+            return data
+        return self._one.validate_python(data, from_attributes=True)
+
+    def validate_many(self, data: Sequence[Any]) -> List[SchemaT]:
+        """Validate records, skipping the ones that already are schema instances."""
+        if all(isinstance(record, self.schema) for record in data):
+            return list(data)
+        return self._many.validate_python(data, from_attributes=True)
+
+    def dump_json(self, data: Any) -> bytes:
+        """Serialize one record as JSON (field aliases are used, as FastAPI does)."""
+        return self._one.dump_json(self.validate(data), by_alias=True)
+
+    def dump_json_many(self, data: Sequence[Any]) -> bytes:
+        """Serialize a list of records as a JSON array."""
+        return self._many.dump_json(self.validate_many(data), by_alias=True)
+
+    def response(self, data: Any, status_code: int = status.HTTP_200_OK) -> Response:
+        """Build a JSON response for one record."""
+        return Response(self.dump_json(data), status_code, media_type="application/json")
+
+    def page_response(self, page: Page[Any]) -> Response:
+        """Build a JSON array response for a page, with its cursor header if there is one."""
+        headers: Optional[Dict[str, str]] = None
+        if page.next_cursor:
+            headers = {NEXT_CURSOR_HEADER: page.next_cursor}
+        return Response(
+            self.dump_json_many(page.items), headers=headers, media_type="application/json"
+        )
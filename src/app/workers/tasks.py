@@ -1,6 +1,11 @@
 """APScheduler jobs."""
 
 from app.workers.scheduler import scheduler
+from app.config.database import AsyncSessionLocal, replica_router
+from app.config.settings import settings
+from app.database.mongodb import get_mongodb_database
+from app.services.mongodb_note_service import MongoDBNoteService
+from app.services.token_revocation_service import TokenRevocationService
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,8 +24,57 @@ async def example_async_scheduled_job():
     return "Async scheduled job completed"
 
 
+async def sync_token_revocations_job():
+    """Refresh the access token revocation filter from the database and Redis."""
+    async with AsyncSessionLocal() as session:
+        await TokenRevocationService.sync(session)
+
+
+async def check_replica_health_job():
+    """Ping read replicas and re-admit the ones that recovered."""
+    await replica_router.check_health()
+
+
+async def rebuild_note_tag_counts_job():
+    """Recompute the note tag counters to repair any drift."""
+    counters = await MongoDBNoteService.rebuild_tag_counts(get_mongodb_database())
+    logger.info(f"Rebuilt {counters} note tag counters")
+
+
+async def bootstrap_note_tag_counts():
+    """Build the note tag counters at startup if the notes predate them."""
+    counters = await MongoDBNoteService.bootstrap_tag_counts(get_mongodb_database())
+    if counters is not None:
+        logger.info(f"Built {counters} note tag counters from existing notes")
+
+
 def setup_scheduled_jobs():
     """Setup scheduled jobs."""
+    if replica_router.enabled:
+        scheduler.add_job(
+            check_replica_health_job,
+            "interval",
+            seconds=settings.DATABASE_REPLICA_HEALTH_CHECK_SECONDS,
+            id="check_replica_health",
+            replace_existing=True,
+        )
+    if settings.ACCESS_TOKEN_EMBED_CLAIMS:
+        scheduler.add_job(
+            sync_token_revocations_job,
+            "interval",
+            seconds=settings.TOKEN_REVOCATION_SYNC_SECONDS,
+            id="sync_token_revocations",
+            replace_existing=True,
+        )
+    if settings.NOTE_TAG_COUNTS_REBUILD_HOURS > 0:
+        scheduler.add_job(
+            rebuild_note_tag_counts_job,
+            "interval",
+            hours=settings.NOTE_TAG_COUNTS_REBUILD_HOURS,
+            id="rebuild_note_tag_counts",
+            replace_existing=True,
+        )
+
     # Example: Run a job every 5 minutes
     # scheduler.add_job(
     #     example_scheduled_job,
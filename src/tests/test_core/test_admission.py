@@ -0,0 +1,69 @@
+"""Admission controller tests."""
+
+import asyncio
+
+import pytest
+
+from app.core.admission import AdmissionController, KeyedTokenBuckets
+from app.core.exceptions import ServiceUnavailableError, TooManyRequestsError
+
+
+class FakeTimer:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_buckets_refill():
+    """Test keyed buckets enforce burst and refill over time."""
+    timer = FakeTimer()
+    buckets = KeyedTokenBuckets(rate_per_minute=60, burst=2, timer=timer)
+    assert buckets.try_acquire("alice") == 0
+    assert buckets.try_acquire("alice") == 0
+    assert buckets.try_acquire("alice") == pytest.approx(1.0)
+    assert buckets.try_acquire("bob") == 0
+    timer.now = 1.0
+    assert buckets.try_acquire("alice") == 0
+
+
+@pytest.mark.asyncio
+async def test_admission_rate_limited():
+    """Test per-username limits reject with Retry-After."""
+    controller = AdmissionController(
+        "test",
+        max_concurrency=1,
+        max_queue=0,
+        queue_timeout=1,
+        username_limiter=KeyedTokenBuckets(rate_per_minute=1, burst=1),
+    )
+    async with controller.admit(username="alice"):
+        pass
+    with pytest.raises(TooManyRequestsError) as exc_info:
+        async with controller.admit(username="alice"):
+            pass
+    assert int(exc_info.value.headers["Retry-After"]) >= 1
+    assert controller.stats()["rejected_rate_limited"] == 1
+
+
+@pytest.mark.asyncio
+async def test_admission_queue_full_and_timeout():
+    """Test the wait queue is bounded and times out."""
+    controller = AdmissionController("test", max_concurrency=1, max_queue=1, queue_timeout=0.05)
+    async with controller.admit():
+        waiter = asyncio.ensure_future(controller.admit().__aenter__())
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceUnavailableError) as exc_info:
+            async with controller.admit():
+                pass
+        assert exc_info.value.headers == {"Retry-After": "1"}
+        with pytest.raises(ServiceUnavailableError):
+            await waiter
+    stats = controller.stats()
+    assert stats["admitted"] == 1
+    assert stats["queued"] == 1
+    assert stats["rejected_queue_full"] == 1
+    assert stats["rejected_queue_timeout"] == 1
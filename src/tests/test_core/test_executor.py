@@ -0,0 +1,69 @@
+"""Bounded executor tests."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core.exceptions import ServiceUnavailableError
+from app.core.executor import BoundedExecutor
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor_runs_off_loop():
+    """Test calls run on a pool thread."""
+    executor = BoundedExecutor("test", max_workers=1, max_queue=0)
+    try:
+        thread_name = await executor.run(lambda: threading.current_thread().name)
+        assert thread_name.startswith("test")
+        assert executor.stats()["completed"] == 1
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor_rejects_when_saturated():
+    """Test saturation fails fast with 503 and Retry-After."""
+    executor = BoundedExecutor("test", max_workers=1, max_queue=0, retry_after=2)
+    release = threading.Event()
+    try:
+        running = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceUnavailableError) as exc_info:
+            await executor.run(lambda: None)
+        assert exc_info.value.headers["Retry-After"] == "2"
+        assert executor.stats()["rejected"] == 1
+        release.set()
+        await running
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_keeps_slot_until_call_ends():
+    """Test a call whose caller was cancelled still counts against the limit."""
+    executor = BoundedExecutor("test", max_workers=1, max_queue=0)
+    started, release = threading.Event(), threading.Event()
+
+    def work():
+        started.set()
+        release.wait()
+
+    try:
+        caller = asyncio.ensure_future(executor.run(work))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        assert executor.stats()["pending"] == 1
+        with pytest.raises(ServiceUnavailableError):
+            await executor.run(lambda: None)
+        release.set()
+        for _ in range(100):
+            if executor.stats()["pending"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert executor.stats()["pending"] == 0
+    finally:
+        release.set()
+        executor.shutdown()
@@ -0,0 +1,84 @@
+"""JWT engine tests."""
+
+import base64
+import json
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from app.core.jwt_engine import JoseBackend, KeyRing, TokenEngine, TokenError
+
+SECRET = "test-secret-key-that-is-at-least-32-chars"
+
+
+def make_engine(secret: str = SECRET, kid: str = "k1") -> TokenEngine:
+    key_ring = KeyRing(JoseBackend())
+    key_ring.add(kid, "HS256", secret, active=True)
+    return TokenEngine(key_ring)
+
+
+def test_encode_decode_roundtrip():
+    """Test tokens carry the kid and decode with the pre-parsed key."""
+    engine = make_engine()
+    token = engine.encode({"sub": "1"})
+    assert engine.decode(token)["sub"] == "1"
+
+
+def test_decode_rejects_unknown_kid():
+    """Test tokens signed by a key outside the ring are rejected."""
+    token = make_engine(kid="other").encode({"sub": "1"})
+    with pytest.raises(TokenError):
+        make_engine().decode(token)
+
+
+@pytest.mark.parametrize("kid", [["x"], {"k": "v"}, 1])
+def test_decode_rejects_non_string_kid(kid):
+    """Test a kid that is not a string is a token error, not a lookup crash."""
+    header = base64.urlsafe_b64encode(json.dumps({"alg": "HS256", "kid": kid}).encode())
+    token = f"{header.decode().rstrip('=')}.e30.sig"
+    with pytest.raises(TokenError):
+        make_engine().decode(token)
+
+
+def test_decode_rejects_bad_signature():
+    """Test tokens signed with a different secret are rejected."""
+    token = make_engine(secret="another-secret-key-that-is-32-chars-long").encode({"sub": "1"})
+    with pytest.raises(TokenError):
+        make_engine().decode(token)
+
+
+def test_key_rotation_keeps_retired_keys_verifiable():
+    """Test tokens signed by a retired key still verify after rotation."""
+    old_engine = make_engine(kid="old")
+    token = old_engine.encode({"sub": "1"})
+    key_ring = KeyRing(JoseBackend())
+    key_ring.add("old", "HS256", SECRET)
+    key_ring.add("new", "HS256", "rotated-secret-key-that-is-32-chars-long", active=True)
+    assert TokenEngine(key_ring).decode(token)["sub"] == "1"
+
+
+def test_jose_backend_rejects_eddsa():
+    """Test unsupported algorithm/backend combinations fail at startup."""
+    with pytest.raises(ValueError):
+        KeyRing(JoseBackend()).add("k1", "EdDSA", b"")
+
+
+def test_pyjwt_eddsa_roundtrip():
+    """Test EdDSA signing with the PyJWT backend."""
+    pytest.importorskip("jwt")
+    from app.core.jwt_engine import PyJWTBackend
+
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    key_ring = KeyRing(PyJWTBackend())
+    key_ring.add("ed", "EdDSA", public_pem, private_pem, active=True)
+    engine = TokenEngine(key_ring)
+    assert engine.decode(engine.encode({"sub": "1"}))["sub"] == "1"
@@ -0,0 +1,38 @@
+"""Principal cache tests."""
+
+import pytest
+
+from app.core.principal import (
+    Principal,
+    cache_principal,
+    invalidate_principal,
+    principal_cache,
+    principal_cache_version,
+)
+
+
+def test_principal_is_immutable():
+    """Test principal snapshots cannot be mutated."""
+    principal = Principal(id=1, is_active=True, is_superuser=False)
+    with pytest.raises(AttributeError):
+        principal.is_superuser = True
+
+
+def test_invalidate_principal():
+    """Test invalidation drops the cached snapshot."""
+    principal_cache.set(42, Principal(id=42, is_active=True, is_superuser=False))
+    invalidate_principal(42)
+    assert principal_cache.get(42) is None
+
+
+def test_fill_racing_an_invalidation_is_not_cached():
+    """Test a principal read before an invalidation is not cached after it."""
+    version = principal_cache_version()
+    stale = Principal(id=43, is_active=True, is_superuser=True)
+    invalidate_principal(43)
+    cache_principal(stale, version)
+    assert principal_cache.get(43) is None
+
+    cache_principal(stale, principal_cache_version())
+    assert principal_cache.get(43) == stale
+    invalidate_principal(43)
@@ -0,0 +1,38 @@
+"""Token revocation filter tests."""
+
+from app.core.revocation import BloomFilter, RevocationFilter
+
+
+def test_bloom_filter_membership():
+    """Test added keys are always reported as present."""
+    bloom = BloomFilter(size_bits=1024, num_hashes=3)
+    for key in range(50):
+        bloom.add(key)
+    assert all(key in bloom for key in range(50))
+
+
+def test_revocation_filter_versions():
+    """Test tokens below the revoked version are rejected."""
+    revocations = RevocationFilter(size_bits=1024, num_hashes=3, retention_seconds=60)
+    assert not revocations.is_revoked(1, 0)
+    revocations.revoke(1, 2)
+    assert revocations.is_revoked(1, 1)
+    assert not revocations.is_revoked(1, 2)
+    assert not revocations.is_revoked(2, 0)
+
+
+def test_revocation_filter_replace_keeps_recent_local_entries():
+    """Test a sync does not forget revocations missing from the snapshot."""
+    revocations = RevocationFilter(size_bits=1024, num_hashes=3, retention_seconds=60)
+    revocations.revoke(7, 1)
+    revocations.replace({3: 2})
+    assert revocations.is_revoked(3, 1)
+    assert revocations.is_revoked(7, 0)
+
+
+def test_revocation_filter_replace_drops_expired_local_entries():
+    """Test local-only entries are dropped once all their tokens expired."""
+    revocations = RevocationFilter(size_bits=1024, num_hashes=3, retention_seconds=0)
+    revocations.revoke(7, 1)
+    revocations.replace({})
+    assert not revocations.is_revoked(7, 0)
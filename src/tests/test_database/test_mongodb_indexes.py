@@ -0,0 +1,59 @@
+"""MongoDB index registry tests."""
+
+import pytest
+
+from app.database.mongodb_indexes import ensure_indexes, expected_indexes, find_missing_indexes
+
+
+class FakeCollection:
+    """Keeps index definitions the way ``index_information`` reports them."""
+
+    def __init__(self):
+        self.indexes = {"_id_": {"key": [("_id", 1)]}}
+
+    async def create_indexes(self, indexes):
+        for index in indexes:
+            key = []
+            for field, direction in index.document["key"].items():
+                if direction != "text":
+                    key.append((field, direction))
+                elif ("_fts", "text") not in key:
+                    key += [("_fts", "text"), ("_ftsx", 1)]
+            self.indexes[index.document["name"]] = {"key": key}
+        return [index.document["name"] for index in indexes]
+
+    async def index_information(self):
+        return self.indexes
+
+
+class FakeDatabase(dict):
+    def __missing__(self, name):
+        self[name] = FakeCollection()
+        return self[name]
+
+
+def test_note_indexes_are_declared():
+    """Test that the note list query shapes are covered."""
+    names = [index.document["name"] for index in expected_indexes()["notes"]]
+    assert names == ["user_created_at", "user_archived_created_at", "user_text"]
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_resolves_drift():
+    """Test that missing indexes are reported until they are created."""
+    db = FakeDatabase()
+    assert await find_missing_indexes(db) == {
+        "notes": ["user_created_at", "user_archived_created_at", "user_text"],
+        "note_tag_counts": ["user_tag"],
+    }
+    await ensure_indexes(db)
+    assert await find_missing_indexes(db) == {}
+
+
+@pytest.mark.asyncio
+async def test_index_with_different_keys_is_drift():
+    """Test that an index reusing a declared name with other keys is reported."""
+    db = FakeDatabase()
+    await ensure_indexes(db)
+    db["notes"].indexes["user_created_at"] = {"key": [("user_id", 1)]}
+    assert await find_missing_indexes(db) == {"notes": ["user_created_at"]}
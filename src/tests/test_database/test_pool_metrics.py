@@ -0,0 +1,64 @@
+"""Connection pool metrics tests."""
+
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database.pool_metrics import PoolMetrics
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_record_checkouts_and_churn(tmp_path):
+    """Test checkouts, overflow connections and wait times are recorded."""
+    metrics = PoolMetrics("test")
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=metrics.pool_class(),
+        pool_size=1,
+        max_overflow=1,
+    )
+    metrics.instrument(engine)
+
+    async def query():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await asyncio.sleep(0.01)
+
+    try:
+        await asyncio.gather(*(query() for _ in range(4)))
+        stats = metrics.stats()
+        assert stats["checkouts"] == 4
+        assert stats["connects"] == 2
+        assert stats["closes"] == 1  # the overflow connection is discarded
+        assert sum(stats["checkout_wait_histogram"].values()) == 4
+        assert stats["checked_out"] == 0
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_wait_excludes_connecting(tmp_path):
+    """Test time spent opening a connection is not counted as checkout wait."""
+    metrics = PoolMetrics("test")
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=metrics.pool_class(),
+        pool_size=1,
+        max_overflow=0,
+    )
+    metrics.instrument(engine)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def slow_connect(dbapi_connection, connection_record):
+        time.sleep(0.05)
+
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        assert metrics.stats()["connects"] == 1
+        assert metrics.stats()["checkout_wait_seconds_max"] < 0.05
+    finally:
+        await engine.dispose()
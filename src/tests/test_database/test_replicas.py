@@ -0,0 +1,61 @@
+"""Read replica routing tests."""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database.replicas import ReplicaRouter, make_routing_session_class
+
+
+def make_engine(path):
+    return create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+
+async def label_database(engine, label):
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE whoami (label TEXT)"))
+        await conn.execute(text(f"INSERT INTO whoami VALUES ('{label}')"))
+
+
+@pytest.mark.asyncio
+async def test_router_round_robin_skips_unhealthy(tmp_path):
+    """Test replicas are used in turn and unhealthy ones are skipped."""
+    replicas = [make_engine(tmp_path / "r1.db"), make_engine(tmp_path / "r2.db")]
+    router = ReplicaRouter(replicas, sticky_seconds=5)
+    assert [router.choose(), router.choose()] == replicas
+    router.mark_unhealthy(replicas[0])
+    assert router.choose() is replicas[1]
+    assert router.choose() is replicas[1]
+    await router.check_health()
+    assert router.stats()["healthy"] == 2
+
+
+@pytest.mark.asyncio
+async def test_routing_session_read_your_writes(tmp_path):
+    """Test reads go to a replica unless the user wrote recently."""
+    primary = make_engine(tmp_path / "primary.db")
+    replica = make_engine(tmp_path / "replica.db")
+    await label_database(primary, "primary")
+    await label_database(replica, "replica")
+    router = ReplicaRouter([replica], sticky_seconds=5)
+    session_factory = async_sessionmaker(
+        primary,
+        class_=AsyncSession,
+        sync_session_class=make_routing_session_class(primary, router),
+    )
+    request = SimpleNamespace(state=SimpleNamespace(principal=SimpleNamespace(id=1)))
+
+    async def read_label():
+        async with session_factory() as session:
+            session.info["request"] = request
+            return (await session.execute(text("SELECT label FROM whoami"))).scalar_one()
+
+    try:
+        assert await read_label() == "replica"
+        router.record_write(1)
+        assert await read_label() == "primary"
+    finally:
+        await primary.dispose()
+        await replica.dispose()
@@ -0,0 +1,47 @@
+"""Request session tests."""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database.base_class import Base
+from app.database.request_session import RequestSession
+from app.models.item import Item
+from app.models.user import User
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'session.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=RequestSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_read_only_session_releases_after_each_statement(session_factory):
+    """Test read-only sessions do not hold a connection between statements."""
+    async with session_factory() as session:
+        session.info["read_only"] = True
+        result = await session.execute(select(User))
+        assert result.scalars().all() == []
+        assert not session.in_transaction()
+        assert not session.has_writes
+
+
+@pytest.mark.asyncio
+async def test_session_tracks_uncommitted_writes(session_factory):
+    """Test writes are tracked until they are committed."""
+    async with session_factory() as session:
+        await session.execute(text("SELECT 1"))
+        assert not session.has_writes
+        await session.execute(
+            insert(User).values(email="a@example.com", username="a", hashed_password="x")
+        )
+        assert session.has_writes
+        await session.commit()
+        assert not session.has_writes
+        session.add(Item(title="t", owner_id=1))
+        assert session.has_writes
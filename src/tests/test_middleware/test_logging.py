@@ -0,0 +1,70 @@
+"""Access logging middleware tests."""
+
+import logging
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.middleware.logging import LoggingMiddleware
+
+
+def make_app(**options) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware, **options)
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        if item_id == 0:
+            raise HTTPException(status_code=503, detail="unavailable")
+        return {"id": item_id}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(3):
+                yield b"x" * 10
+
+        return StreamingResponse(chunks())
+
+    return app
+
+
+def access_records(caplog):
+    return [record.access for record in caplog.records if hasattr(record, "access")]
+
+
+@pytest.mark.asyncio
+async def test_access_record(caplog):
+    """Test one record per request with route template, status and size."""
+    caplog.set_level(logging.INFO, logger="app.middleware.logging")
+    transport = ASGITransport(app=make_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/items/7", headers={"X-Request-ID": "abc"})
+        streamed = await client.get("/stream")
+
+    assert response.headers["X-Request-ID"] == "abc"
+    assert float(response.headers["X-Process-Time"]) >= 0
+    assert len(streamed.headers["X-Request-ID"]) == 32
+    item, stream = access_records(caplog)
+    assert item["route"] == "/items/{item_id}"
+    assert item["status"] == 200
+    assert item["bytes_sent"] == len(response.content)
+    assert stream["bytes_sent"] == 30
+
+
+@pytest.mark.asyncio
+async def test_sampling_keeps_errors_and_slow_requests(caplog):
+    """Test that sampled-out requests are dropped unless they failed or were slow."""
+    caplog.set_level(logging.INFO, logger="app.middleware.logging")
+    quiet = make_app(sample_rate=0.01, sampler=lambda: 0.5)
+    slow = make_app(sample_rate=0.01, sampler=lambda: 0.5, slow_threshold_ms=0)
+    for app in (quiet, slow):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/items/1")
+            await client.get("/items/0")
+
+    statuses = [(record["status"], record["slow"]) for record in access_records(caplog)]
+    assert statuses == [(503, False), (200, True), (503, True)]
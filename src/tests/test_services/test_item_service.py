@@ -0,0 +1,139 @@
+"""Item service tests."""
+
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.item import ItemBulkUpdateEntry, ItemCreate, ItemUpdate
+from app.schemas.user import UserCreate
+from app.services.item_service import ItemService
+from app.services.user_service import UserService
+
+
+@pytest.fixture
+async def owner(db_session):
+    """Create an item owner."""
+    user_create = UserCreate(email="owner@example.com", username="owner", password="Testpass123")
+    return await UserService.create_user(db_session, user_create)
+
+
+@pytest.mark.asyncio
+async def test_create_item(db_session, owner):
+    """Test creating an item."""
+    item = await ItemService.create_item(db_session, ItemCreate(title="Item"), owner_id=owner.id)
+    assert item.id is not None
+    assert item.title == "Item"
+    assert item.owner_id == owner.id
+    assert item.created_at is not None
+
+
+@pytest.mark.asyncio
+async def test_update_item(db_session, owner):
+    """Test updating an item."""
+    item = await ItemService.create_item(db_session, ItemCreate(title="Item"), owner_id=owner.id)
+    updated = await ItemService.update_item(db_session, item.id, ItemUpdate(title="Renamed"))
+    assert updated.title == "Renamed"
+    assert (await ItemService.get_item(db_session, item.id)).title == "Renamed"
+
+
+@pytest.mark.asyncio
+async def test_update_missing_item(db_session):
+    """Test updating an item that does not exist."""
+    with pytest.raises(HTTPException) as exc_info:
+        await ItemService.update_item(db_session, 999, ItemUpdate(title="Renamed"))
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_update_item_of_other_owner(db_session, owner):
+    """Test that updating another user's item is forbidden."""
+    item = await ItemService.create_item(db_session, ItemCreate(title="Item"), owner_id=owner.id)
+    with pytest.raises(HTTPException) as exc_info:
+        await ItemService.update_item(
+            db_session, item.id, ItemUpdate(title="Renamed"), owner_id=owner.id + 1
+        )
+    assert exc_info.value.status_code == 403
+    assert (await ItemService.get_item(db_session, item.id)).title == "Item"
+
+
+@pytest.mark.asyncio
+async def test_delete_item(db_session, owner):
+    """Test deleting an item."""
+    item = await ItemService.create_item(db_session, ItemCreate(title="Item"), owner_id=owner.id)
+    with pytest.raises(HTTPException) as exc_info:
+        await ItemService.delete_item(db_session, item.id, owner_id=owner.id + 1)
+    assert exc_info.value.status_code == 403
+    await ItemService.delete_item(db_session, item.id, owner_id=owner.id)
+    with pytest.raises(HTTPException) as exc_info:
+        await ItemService.delete_item(db_session, item.id, owner_id=owner.id)
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_items_by_cursor(db_session, owner):
+    """Test walking an owner's items page by page."""
+    for i in range(5):
+        await ItemService.create_item(db_session, ItemCreate(title=f"Item {i}"), owner_id=owner.id)
+    titles = []
+    cursor = None
+    while True:
+        page = await ItemService.get_items(db_session, limit=2, owner_id=owner.id, cursor=cursor)
+        titles.extend(item.title for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert titles == [f"Item {i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_get_items_returns_rows(db_session, owner):
+    """Test that listing items does not load ORM entities into the session."""
+    await ItemService.create_item(db_session, ItemCreate(title="Item"), owner_id=owner.id)
+    db_session.expunge_all()
+    page = await ItemService.get_items(db_session, owner_id=owner.id)
+    assert page.items[0].title == "Item"
+    assert len(db_session.identity_map) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_items_selects_fields(db_session, owner):
+    """Test that only the requested columns, plus the keys needed, are selected."""
+    item = await ItemService.create_item(db_session, ItemCreate(title="Item"), owner_id=owner.id)
+    page = await ItemService.get_items(db_session, owner_id=owner.id, fields=("title",))
+    assert page.items[0]._fields == ("title", "id")
+    row = await ItemService.get_item_fields(db_session, item.id, ("title",))
+    assert row._fields == ("title", "owner_id")
+    with pytest.raises(HTTPException) as exc_info:
+        await ItemService.get_item_fields(db_session, 999, ("title",))
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_bulk_items(db_session, owner):
+    """Test bulk create, update and delete with per-item results."""
+    created = await ItemService.create_items(
+        db_session, [ItemCreate(title=f"Item {i}") for i in range(5)], owner.id, chunk_size=2
+    )
+    assert [result.item.title for result in created] == [f"Item {i}" for i in range(5)]
+    ids = [result.id for result in created]
+    foreign = await ItemService.create_item(db_session, ItemCreate(title="Foreign"), owner.id + 1)
+
+    updated = await ItemService.update_items(
+        db_session,
+        [
+            ItemBulkUpdateEntry(id=ids[0], title="Renamed"),
+            ItemBulkUpdateEntry(id=foreign.id, title="Stolen"),
+            ItemBulkUpdateEntry(id=999, title="Missing"),
+        ],
+        owner.id,
+        chunk_size=2,
+    )
+    assert [result.status for result in updated] == [200, 403, 404]
+    assert updated[0].item.title == "Renamed"
+    assert (await ItemService.get_item(db_session, foreign.id)).title == "Foreign"
+
+    deleted = await ItemService.delete_items(
+        db_session, [ids[1], foreign.id, 999, ids[2]], owner.id, chunk_size=2
+    )
+    assert [result.status for result in deleted] == [204, 403, 404, 204]
+    page = await ItemService.get_items(db_session, owner_id=owner.id)
+    assert [item.id for item in page.items] == [ids[0], ids[3], ids[4]]
@@ -0,0 +1,267 @@
+"""MongoDB note service tests."""
+
+import json
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
+
+from app.schemas.mongodb_note import NoteCreate, NoteUpdate
+from app.services.mongodb_note_service import MongoDBNoteService, _tag_delta
+
+
+class FakeNotesCollection:
+    """Records insert_many batches and rejects notes titled "duplicate"."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def insert_many(self, documents, ordered=True):
+        assert ordered is False
+        self.batches.append(list(documents))
+        errors = [
+            {"index": index, "errmsg": "duplicate key"}
+            for index, document in enumerate(documents)
+            if document["title"] == "duplicate"
+        ]
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": len(documents) - len(errors)})
+
+        class Result:
+            inserted_ids = [ObjectId() for _ in documents]
+
+        return Result()
+
+
+class FakeTagCountsCollection:
+    """Applies $inc upserts from bulk_write to a (user_id, tag) -> count dict."""
+
+    def __init__(self):
+        self.counts = {}
+
+    async def bulk_write(self, operations, ordered=True):
+        assert ordered is False
+        for operation in operations:
+            key = (operation._filter["user_id"], operation._filter["tag"])
+            if key not in self.counts and not operation._upsert:
+                continue
+            self.counts[key] = self.counts.get(key, 0) + operation._doc["$inc"]["count"]
+
+    def of(self, user_id):
+        return {
+            tag: count for (owner, tag), count in self.counts.items() if owner == user_id and count
+        }
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.notes = FakeNotesCollection()
+        self.note_tag_counts = FakeTagCountsCollection()
+
+
+async def body(*lines: str):
+    for line in lines:
+        yield line.encode() + b"\n"
+
+
+@pytest.mark.asyncio
+async def test_import_notes():
+    """Test batching and per-line error reporting of a note import."""
+    db = FakeDatabase()
+    user_id = str(ObjectId())
+    lines = [json.dumps({"title": f"Note {i}", "content": "text"}) for i in range(5)]
+    lines.insert(2, '{"title": "missing content"}')
+    lines.insert(4, "not json")
+    lines.append(json.dumps({"title": "duplicate", "content": "text", "tags": ["x"]}))
+    lines[0] = json.dumps({"title": "Note 0", "content": "text", "tags": ["x", "x", "y"]})
+
+    summary = await MongoDBNoteService.import_notes(db, body(*lines), user_id, batch_size=2)
+
+    assert summary.received == 8
+    assert summary.inserted == 5
+    assert summary.failed == 3
+    assert [error.line for error in summary.errors] == [3, 5, 8]
+    assert [len(batch) for batch in db.notes.batches] == [2, 2, 2]
+    assert all(note["user_id"] == ObjectId(user_id) for note in db.notes.batches[0])
+    # The rejected duplicate's tag is not counted
+    assert db.note_tag_counts.of(ObjectId(user_id)) == {"x": 1, "y": 1}
+
+
+class InMemoryNotesCollection:
+    """Single-document write operations over a dict, counting calls."""
+
+    def __init__(self):
+        self.documents = {}
+        self.calls = 0
+
+    def _match(self, query):
+        document = self.documents.get(query["_id"])
+        if document is not None and document["user_id"] == query["user_id"]:
+            return document
+        return None
+
+    async def insert_one(self, document):
+        self.calls += 1
+        document["_id"] = ObjectId()
+        self.documents[document["_id"]] = dict(document)
+
+        class Result:
+            inserted_id = document["_id"]
+
+        return Result()
+
+    async def find_one_and_update(self, query, update, return_document=None):
+        self.calls += 1
+        document = self._match(query)
+        if document is None:
+            return None
+        before = dict(document)
+        document.update(update["$set"])
+        return before if return_document == ReturnDocument.BEFORE else dict(document)
+
+    async def find_one_and_delete(self, query, projection=None):
+        self.calls += 1
+        document = self._match(query)
+        if document is not None:
+            del self.documents[document["_id"]]
+        return document
+
+
+@pytest.mark.asyncio
+async def test_note_writes_use_one_round_trip():
+    """Test that create, update and delete each make a single call."""
+    db = FakeDatabase()
+    db.notes = InMemoryNotesCollection()
+    user_id = str(ObjectId())
+
+    note = await MongoDBNoteService.create_note(
+        db, NoteCreate(title="Note", content="text"), user_id
+    )
+    assert note["user_id"] == user_id
+    assert isinstance(note["_id"], str)
+
+    updated = await MongoDBNoteService.update_note(
+        db, note["_id"], NoteUpdate(title="Renamed"), user_id
+    )
+    assert updated["title"] == "Renamed"
+    assert updated["_id"] == note["_id"]
+
+    await MongoDBNoteService.delete_note(db, note["_id"], user_id)
+    assert db.notes.calls == 3
+
+    with pytest.raises(HTTPException) as exc_info:
+        await MongoDBNoteService.update_note(db, note["_id"], NoteUpdate(title="Gone"), user_id)
+    assert exc_info.value.status_code == 404
+    with pytest.raises(HTTPException) as exc_info:
+        await MongoDBNoteService.delete_note(db, note["_id"], user_id)
+    assert exc_info.value.status_code == 404
+
+
+def test_tag_delta():
+    """Test that only added and removed tags change counters."""
+    assert _tag_delta(["a", "b", "b"], ["b", "c"]) == {"c": 1, "a": -1}
+    assert _tag_delta(["a"], ["a"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_note_writes_maintain_tag_counts():
+    """Test that create, update and delete keep the user's tag counters in sync."""
+    db = FakeDatabase()
+    db.notes = InMemoryNotesCollection()
+    user_id = str(ObjectId())
+    owner = ObjectId(user_id)
+
+    first = await MongoDBNoteService.create_note(
+        db, NoteCreate(title="A", content="text", tags=["work", "urgent"]), user_id
+    )
+    await MongoDBNoteService.create_note(
+        db, NoteCreate(title="B", content="text", tags=["work"]), user_id
+    )
+    assert db.note_tag_counts.of(owner) == {"work": 2, "urgent": 1}
+
+    await MongoDBNoteService.update_note(
+        db, first["_id"], NoteUpdate(tags=["work", "later"]), user_id
+    )
+    assert db.note_tag_counts.of(owner) == {"work": 2, "later": 1}
+
+    await MongoDBNoteService.update_note(db, first["_id"], NoteUpdate(title="Renamed"), user_id)
+    assert db.note_tag_counts.of(owner) == {"work": 2, "later": 1}
+
+    await MongoDBNoteService.delete_note(db, first["_id"], user_id)
+    assert db.note_tag_counts.of(owner) == {"work": 1}
+
+
+@pytest.mark.asyncio
+async def test_decrement_does_not_create_counter():
+    """Test that removing a tag without a counter leaves no negative counter behind."""
+    db = FakeDatabase()
+    owner = ObjectId()
+
+    await MongoDBNoteService._adjust_tag_counts(db, owner, {"legacy": -1, "new": 1})
+
+    assert db.note_tag_counts.counts == {(owner, "new"): 1}
+
+
+class RecordingNotesCollection:
+    """Records the find query / aggregate pipeline and returns no notes."""
+
+    def __init__(self):
+        self.query = None
+        self.projection = None
+        self.pipeline = None
+
+    def find(self, query, projection=None):
+        self.query = query
+        self.projection = projection
+        return self
+
+    def aggregate(self, pipeline):
+        self.pipeline = pipeline
+        return self
+
+    def sort(self, *args):
+        return self
+
+    def skip(self, count):
+        return self
+
+    def limit(self, count):
+        return self
+
+    async def to_list(self, length):
+        return []
+
+
+@pytest.mark.asyncio
+async def test_regex_search_escapes_term():
+    """Test that regex mode matches the search term literally."""
+    db = FakeDatabase()
+    db.notes = RecordingNotesCollection()
+    await MongoDBNoteService.search_notes(db, str(ObjectId()), "a.b*(", mode="regex")
+    title_match = db.notes.query["$and"][0]["$or"][0]["title"]
+    assert title_match == {"$regex": r"a\.b\*\(", "$options": "i"}
+
+
+@pytest.mark.asyncio
+async def test_text_search_ranks_by_score():
+    """Test that text mode uses $text and a stable score order."""
+    db = FakeDatabase()
+    db.notes = RecordingNotesCollection()
+    await MongoDBNoteService.search_notes(db, str(ObjectId()), "groceries", limit=10)
+    assert db.notes.pipeline[0]["$match"]["$text"] == {"$search": "groceries"}
+    assert {"$sort": {"score": -1, "_id": -1}} in db.notes.pipeline
+    assert db.notes.pipeline[-1] == {"$limit": 11}
+
+
+@pytest.mark.asyncio
+async def test_get_notes_projects_fields():
+    """Test that requested fields become a projection that keeps the cursor keys."""
+    db = FakeDatabase()
+    db.notes = RecordingNotesCollection()
+    user_id = str(ObjectId())
+    await MongoDBNoteService.get_notes(db, user_id, fields=("title", "id"))
+    assert db.notes.projection == {"title": 1, "_id": 1, "created_at": 1}
+    await MongoDBNoteService.get_notes(db, user_id)
+    assert db.notes.projection is None
@@ -0,0 +1,82 @@
+"""Note search cache tests."""
+
+import pytest
+
+from app.services.note_search_cache import NoteSearchCache
+from app.utils.pagination import Page
+
+
+class Search:
+    """Counts how often the underlying search runs."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return Page(items=[{"title": f"result {self.calls}"}])
+
+
+def test_normalize():
+    """Test that equivalent queries share a key."""
+    assert NoteSearchCache.normalize("  Shopping   LIST ") == "shopping list"
+
+
+@pytest.mark.asyncio
+async def test_hit_until_user_writes():
+    """Test that a user's pages are served from cache until that user writes."""
+    cache = NoteSearchCache(maxsize=100, ttl=60)
+    search = Search()
+    first = await cache.get_or_compute("u1", ("text", "list"), search)
+    assert await cache.get_or_compute("u1", ("text", "list"), search) is first
+    assert search.calls == 1
+
+    await cache.bump("u2")
+    await cache.get_or_compute("u1", ("text", "list"), search)
+    assert search.calls == 1
+
+    await cache.bump("u1")
+    await cache.get_or_compute("u1", ("text", "list"), search)
+    assert search.calls == 2
+    assert cache.stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_evicted_generation_is_a_miss():
+    """Test that pages cached before a write stay unreachable once the generation is evicted."""
+    cache = NoteSearchCache(maxsize=2, ttl=60)
+    search = Search()
+    await cache.get_or_compute("u1", ("text", "list"), search)
+    await cache.bump("u1")
+    # Writes by other users push u1's generation out of the cache
+    await cache.bump("u2")
+    await cache.bump("u3")
+
+    page = await cache.get_or_compute("u1", ("text", "list"), search)
+    assert page.items == [{"title": "result 2"}]
+    assert search.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_write_during_search_is_not_cached_as_current():
+    """Test that a page computed across a write is not served afterwards."""
+    cache = NoteSearchCache(maxsize=100, ttl=60)
+    search = Search()
+
+    async def search_racing_a_write():
+        await cache.bump("u1")
+        return await search()
+
+    await cache.get_or_compute("u1", ("text", "list"), search_racing_a_write)
+    await cache.get_or_compute("u1", ("text", "list"), search)
+    assert search.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_disabled():
+    """Test that a disabled cache always searches."""
+    cache = NoteSearchCache(maxsize=100, ttl=60, enabled=False)
+    search = Search()
+    await cache.get_or_compute("u1", ("text", "list"), search)
+    await cache.get_or_compute("u1", ("text", "list"), search)
+    assert search.calls == 2
@@ -1,8 +1,11 @@
 """User service tests."""
 
 import pytest
+from fastapi import HTTPException
+
+from app.core.security import password_executor
 from app.services.user_service import UserService
-from app.schemas.user import UserCreate
+from app.schemas.user import User, UserCreate, UserUpdate
 
 
 @pytest.mark.asyncio
@@ -24,3 +27,51 @@ async def test_get_user(db_session, test_user_data):
     assert user.id == created_user.id
     assert user.email == test_user_data["email"]
 
+
+@pytest.mark.asyncio
+async def test_create_duplicate_user(db_session):
+    """Test that a duplicate email or username is rejected."""
+    user_create = UserCreate(email="dup@example.com", username="dupuser", password="Testpass123")
+    await UserService.create_user(db_session, user_create)
+    hashed = password_executor.stats()["completed"]
+    with pytest.raises(HTTPException) as exc_info:
+        await UserService.create_user(db_session, user_create)
+    assert exc_info.value.status_code == 409
+    # Rejected before the password is hashed
+    assert password_executor.stats()["completed"] == hashed
+
+
+@pytest.mark.asyncio
+async def test_update_user(db_session):
+    """Test updating a user."""
+    user_create = UserCreate(email="upd@example.com", username="upduser", password="Testpass123")
+    created_user = await UserService.create_user(db_session, user_create)
+    token_version = created_user.token_version
+    user = await UserService.update_user(
+        db_session, created_user.id, UserUpdate(full_name="Renamed", password="Newpass1234")
+    )
+    assert user.full_name == "Renamed"
+    assert user.token_version == token_version + 1
+
+
+@pytest.mark.asyncio
+async def test_update_missing_user(db_session):
+    """Test updating a user that does not exist."""
+    with pytest.raises(HTTPException) as exc_info:
+        await UserService.update_user(db_session, 999, UserUpdate(full_name="Nobody"))
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_users_selects_schema_columns(db_session):
+    """Test that listed users carry the response fields and no password hash."""
+    for i in range(3):
+        await UserService.create_user(
+            db_session,
+            UserCreate(email=f"list{i}@example.com", username=f"list{i}", password="Testpass123"),
+        )
+    page = await UserService.get_users(db_session, limit=2)
+    assert [user.username for user in page.items] == ["list0", "list1"]
+    assert page.next_cursor is not None
+    assert set(page.items[0]._fields) == set(User.model_fields)
+    assert "hashed_password" not in page.items[0]._fields
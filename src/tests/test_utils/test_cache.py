@@ -0,0 +1,54 @@
+"""Cache utility tests."""
+
+from app.utils.cache import TTLCache
+
+
+class FakeTimer:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_hit_and_miss():
+    """Test hit/miss counters."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    assert cache.get(1) is None
+    cache.set(1, "a")
+    assert cache.get(1) == "a"
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_ttl_cache_expiry():
+    """Test entries expire after the TTL."""
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=2, ttl=10, timer=timer)
+    cache.set(1, "a")
+    timer.now = 10
+    assert cache.get(1) is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_lru_eviction():
+    """Test the least recently used entry is evicted when full."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    cache.get(1)
+    cache.set(3, "c")
+    assert cache.get(2) is None
+    assert cache.get(1) == "a"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_cache_invalidate():
+    """Test explicit invalidation."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set(1, "a")
+    cache.invalidate(1)
+    assert cache.get(1) is None
@@ -0,0 +1,69 @@
+"""Batch loader tests."""
+
+import asyncio
+
+import pytest
+
+from app.utils.dataloader import BatchLoader
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_are_batched():
+    """Test loads issued in the same tick share one deduplicated batch call."""
+    calls = []
+
+    async def batch_fn(keys):
+        calls.append(sorted(keys))
+        return {key: key * 10 for key in keys if key != 3}
+
+    loader = BatchLoader(batch_fn)
+    results = await asyncio.gather(*(loader.load(key) for key in (1, 2, 2, 3)))
+    assert results == [10, 20, 20, None]
+    assert calls == [[1, 2, 3]]
+    assert loader.stats()["batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_splits_batches():
+    """Test a full batch is dispatched immediately."""
+    calls = []
+
+    async def batch_fn(keys):
+        calls.append(len(keys))
+        return {key: key for key in keys}
+
+    loader = BatchLoader(batch_fn, max_batch_size=2)
+    await asyncio.gather(*(loader.load(key) for key in range(5)))
+    assert calls == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_propagate_to_every_caller():
+    """Test a failing batch call fails all waiting loads."""
+
+    async def batch_fn(keys):
+        raise RuntimeError("boom")
+
+    loader = BatchLoader(batch_fn)
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batch_cancels_waiting_loads():
+    """Test callers are released when the batch call itself is cancelled."""
+    started = asyncio.Event()
+
+    async def batch_fn(keys):
+        started.set()
+        await asyncio.Event().wait()
+
+    loader = BatchLoader(batch_fn)
+    load = asyncio.create_task(loader.load(1))
+    await started.wait()
+    for task in loader._tasks:
+        task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(load, timeout=1)
+    await asyncio.sleep(0)
+    assert not loader._tasks
@@ -0,0 +1,37 @@
+"""Export encoding tests."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from app.utils.export import encode_rows
+
+COLUMNS = ("id", "title", "created_at")
+CREATED_AT = datetime(2024, 5, 1, 12, 30)
+
+
+async def batches():
+    yield [(1, "first", CREATED_AT), (2, "second, with comma", CREATED_AT)]
+    yield [(3, None, CREATED_AT)]
+
+
+@pytest.mark.asyncio
+async def test_encode_ndjson():
+    """Test NDJSON output, one chunk per batch."""
+    chunks = [chunk async for chunk in encode_rows(batches(), COLUMNS, "ndjson")]
+    assert len(chunks) == 2
+    lines = b"".join(chunks).decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+    assert json.loads(lines[0])["created_at"] == CREATED_AT.isoformat()
+
+
+@pytest.mark.asyncio
+async def test_encode_csv():
+    """Test CSV output with a header row."""
+    chunks = [chunk async for chunk in encode_rows(batches(), COLUMNS, "csv")]
+    assert len(chunks) == 3
+    lines = b"".join(chunks).decode().splitlines()
+    assert lines[0] == "id,title,created_at"
+    assert lines[2] == f'2,"second, with comma",{CREATED_AT.isoformat()}'
+    assert lines[3] == f"3,,{CREATED_AT.isoformat()}"
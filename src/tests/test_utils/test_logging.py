@@ -0,0 +1,110 @@
+"""Logging utilities tests."""
+
+import io
+import json
+import logging
+import queue
+
+from app.utils.logging import (
+    BatchingQueueListener,
+    BatchRotatingFileHandler,
+    BatchStreamHandler,
+    BoundedQueueHandler,
+    JSONFormatter,
+)
+
+
+def make_logger(handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(f"tests.logging.{id(handler)}")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.handlers = [handler]
+    return logger
+
+
+def test_queue_handler_drops_when_full():
+    """Test that a full queue drops records and counts them in drop mode."""
+    handler = BoundedQueueHandler(maxsize=2, overflow="drop")
+    logger = make_logger(handler)
+    for i in range(5):
+        logger.info("record %d", i)
+    assert handler.stats()["enqueued"] == 2
+    assert handler.stats()["dropped"] == 3
+    assert handler.queue.get_nowait().msg == "record 0"
+
+
+def test_listener_writes_batches_as_json():
+    """Test that queued records, tracebacks included, reach the stream as JSON lines."""
+    stream = io.StringIO()
+    output = BatchStreamHandler(stream)
+    output.setFormatter(JSONFormatter())
+    handler = BoundedQueueHandler(maxsize=100, overflow="block")
+    listener = BatchingQueueListener(handler.queue, [output])
+    logger = make_logger(handler)
+
+    listener.start()
+    for i in range(10):
+        logger.info("record %d", i, extra={"request_id": "abc"})
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed")
+    listener.stop()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines[:10]] == [f"record {i}" for i in range(10)]
+    assert lines[0]["request_id"] == "abc"
+    assert "ValueError: boom" in lines[10]["exception"]
+    assert handler.queue.empty()
+
+
+def test_listener_stops_with_empty_queue():
+    """Test that stopping an idle listener returns."""
+    listener = BatchingQueueListener(queue.Queue(), [BatchStreamHandler(io.StringIO())])
+    listener.start()
+    listener.stop()
+
+
+def test_listener_survives_failing_handler():
+    """Test a handler raising from emit_batch does not stop the listener thread."""
+
+    class FailingHandler(BatchStreamHandler):
+        def emit_batch(self, records):
+            raise OSError("disk full")
+
+        def handleError(self, record):
+            self.errors = getattr(self, "errors", 0) + 1
+
+    stream = io.StringIO()
+    output = BatchStreamHandler(stream)
+    failing = FailingHandler(io.StringIO())
+    handler = BoundedQueueHandler(maxsize=100)
+    listener = BatchingQueueListener(handler.queue, [failing, output])
+    logger = make_logger(handler)
+
+    listener.start()
+    logger.info("first")
+    logger.info("second")
+    listener.stop()
+
+    assert stream.getvalue().splitlines() == ["first", "second"]
+    assert failing.errors >= 1
+
+
+def test_batch_file_handler_rotates(tmp_path):
+    """Test that a batch larger than the size limit is split across rotated files."""
+    log_file = tmp_path / "app.log"
+    handler = BatchRotatingFileHandler(log_file, maxBytes=50, backupCount=5)
+    records = [
+        logging.LogRecord("test", logging.INFO, __file__, 1, f"record {i:02d}", None, None)
+        for i in range(10)
+    ]
+    handler.emit_batch(records)
+    handler.close()
+
+    files = sorted(tmp_path.iterdir())
+    assert len(files) == 3
+    assert all(path.stat().st_size < 50 for path in files)
+    lines = [line for path in reversed(files[1:]) for line in path.read_text().splitlines()]
+    lines += log_file.read_text().splitlines()
+    assert lines == [f"record {i:02d}" for i in range(10)]
@@ -0,0 +1,34 @@
+"""NDJSON line splitting tests."""
+
+import pytest
+
+from app.utils.ndjson import iter_lines
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(*chunks: bytes, max_line_bytes: int = 16):
+    return [item async for item in iter_lines(stream(*chunks), max_line_bytes)]
+
+
+@pytest.mark.asyncio
+async def test_lines_split_across_chunks():
+    """Test that lines are reassembled across chunk boundaries."""
+    assert await collect(b'{"a"', b':1}\n{"b":2}\n', b"\n", b'{"c":3}') == [
+        (1, b'{"a":1}'),
+        (2, b'{"b":2}'),
+        (4, b'{"c":3}'),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_oversized_lines_are_skipped():
+    """Test that a line over the limit is reported and the next one is kept."""
+    assert await collect(b"x" * 10, b"y" * 10, b"\nshort\n", b"z" * 20) == [
+        (1, None),
+        (2, b"short"),
+        (3, None),
+    ]
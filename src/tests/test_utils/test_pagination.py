@@ -0,0 +1,44 @@
+"""Pagination helper tests."""
+
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from app.config.settings import settings
+from app.utils.pagination import clamp_limit, decode_cursor, encode_cursor, paginate
+
+
+def test_cursor_round_trip():
+    """Test that cursor keys survive encoding."""
+    created_at = datetime(2024, 5, 1, 12, 30)
+    note_id = ObjectId()
+    cursor = encode_cursor(created_at, note_id)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, datetime.fromisoformat, ObjectId) == (created_at, note_id)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor("abc"), encode_cursor(1, 2)])
+def test_invalid_cursor(cursor):
+    """Test that malformed or mismatched cursors are rejected."""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, int)
+    assert exc_info.value.status_code == 400
+
+
+def test_paginate():
+    """Test that only a full page with an extra row gets a next cursor."""
+    page = paginate([1, 2, 3], 2, lambda row: (row,))
+    assert page.items == [1, 2]
+    assert decode_cursor(page.next_cursor, int) == (2,)
+    last_page = paginate([1, 2], 2, lambda row: (row,))
+    assert last_page.items == [1, 2]
+    assert last_page.next_cursor is None
+
+
+def test_clamp_limit():
+    """Test that the page size is bounded."""
+    assert clamp_limit(10) == 10
+    assert clamp_limit(0) == 1
+    assert clamp_limit(10**9) == settings.PAGINATION_MAX_LIMIT
@@ -0,0 +1,78 @@
+"""Response serializer tests."""
+
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.item import Item, item_serializer
+from app.schemas.mongodb_note import note_serializer
+from app.utils.pagination import NEXT_CURSOR_HEADER, Page
+
+
+def make_item(item_id: int) -> SimpleNamespace:
+    now = datetime(2024, 1, 1, 12, 30)
+    return SimpleNamespace(
+        id=item_id,
+        title=f"Item {item_id}",
+        description=None,
+        owner_id=1,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_serializes_orm_objects_like_response_model():
+    """Test that the output matches FastAPI's response_model serialization."""
+    items = [make_item(1), make_item(2)]
+    expected = [Item.model_validate(item).model_dump(mode="json") for item in items]
+    assert json.loads(item_serializer.dump_json_many(items)) == expected
+    assert json.loads(item_serializer.dump_json(items[0])) == expected[0]
+
+
+def test_schema_instances_are_not_revalidated():
+    """Test that already validated records are dumped as they are."""
+    item = Item.model_validate(make_item(1))
+    assert item_serializer.validate_many([item])[0] is item
+    assert item_serializer.validate(item) is item
+
+
+def test_page_response_keeps_aliases_and_cursor():
+    """Test that note ids are written as "_id" and the cursor becomes a header."""
+    note = {
+        "_id": "abc",
+        "user_id": "u1",
+        "title": "Note",
+        "content": "text",
+        "created_at": "2024-01-01T12:30:00",
+        "updated_at": "2024-01-01T12:30:00",
+    }
+    response = note_serializer.page_response(Page(items=[note], next_cursor="next"))
+    assert response.headers[NEXT_CURSOR_HEADER] == "next"
+    assert response.media_type == "application/json"
+    assert json.loads(response.body)[0]["_id"] == "abc"
+    last = note_serializer.page_response(Page(items=[], next_cursor=None))
+    assert NEXT_CURSOR_HEADER not in last.headers
+    assert last.body == b"[]"
+
+
+def test_parse_fields():
+    """Test that fields are accepted by name or alias and returned in schema order."""
+    assert note_serializer.parse_fields(None) is None
+    assert note_serializer.parse_fields("title, _id,title") == ("title", "id")
+    assert item_serializer.parse_fields("id,title") == ("title", "id")
+    for fields in ("title,secret", " , "):
+        with pytest.raises(HTTPException) as exc_info:
+            item_serializer.parse_fields(fields)
+        assert exc_info.value.status_code == 400
+
+
+def test_only_writes_selected_fields():
+    """Test that a field subset serializer ignores extra columns and is cached."""
+    fields = item_serializer.parse_fields("id,title")
+    serializer = item_serializer.only(fields)
+    assert serializer is item_serializer.only(fields)
+    assert item_serializer.only(None) is item_serializer
+    assert json.loads(serializer.dump_json_many([make_item(1)])) == [{"title": "Item 1", "id": 1}]